@@ -1,7 +1,15 @@
 import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from ui.main_window import MainWindow
+from multiprocessing import freeze_support
+from utils.startup_profiler import profiler
+
+profiler.enabled = "--profile-startup" in sys.argv
+
+with profiler.measure("import", "PyQt5"):
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+with profiler.measure("import", "ui.main_window"):
+    from ui.main_window import MainWindow
 
 def get_resource_path(relative_path):
     """Get the correct path whether running as a script or an executable."""
@@ -23,8 +31,14 @@ def load_stylesheet(used_app):
         print(f"⚠️ WARNING: Stylesheet not found: {qss_path}")
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    load_stylesheet(app)
-    window = MainWindow()
-    window.show()
+    freeze_support()  # ✅ Necesar în executabilul PyInstaller pentru scanarea de validare în paralel
+    with profiler.measure("construct", "QApplication"):
+        app = QApplication([arg for arg in sys.argv if arg != "--profile-startup"])
+    with profiler.measure("construct", "stylesheet"):
+        load_stylesheet(app)
+    with profiler.measure("construct", "MainWindow (total)"):
+        window = MainWindow()
+    with profiler.measure("construct", "show"):
+        window.show()
+    QTimer.singleShot(0, profiler.report)  # ✅ Raportăm după primul paint
     sys.exit(app.exec_())
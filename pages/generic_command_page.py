@@ -8,7 +8,12 @@ from PyQt5.QtWidgets import (
     QDialog, QInputDialog, QMessageBox, QMenu, QAction
 )
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from utils.file_watcher import DataFileWatcher
+from utils.io_executor import io_executor
+from utils.json_io import SharedJsonFile, copy_json_data, read_json, report_save
+from utils.spec_merge import describe_key, diff_entries
 
 class CommandDialog(QDialog):
     """Dialog pentru introducerea Action, Expected Result și alegerea categoriilor de parametri."""
@@ -67,11 +72,14 @@ class CommandDialog(QDialog):
             QMessageBox.warning(self, "No Field Selected", "Click inside Action or Expected Result before selecting a parameter.")
 
 class GenericCommandPage(QWidget):
+    command_changed = pyqtSignal(str)  # 🔹 Emis când textul unei comenzi s-a schimbat (testele dependente se actualizează)
+
     def __init__(self):
         super().__init__()
         self.parameters_file = None
         self.json_file = self.get_resource_path( "../data/generic_commands.json")
         self.parameters_file = self.get_resource_path(  "../data/parameters.json")
+        self.commands_file = SharedJsonFile(self.json_file)  # 🔹 Salvările îmbină modificările altor instanțe
         self.commands_data = {}
         self.parameters_data = {}
 
@@ -121,24 +129,39 @@ class GenericCommandPage(QWidget):
         self.load_parameters()
         self.load_commands()
 
-    def load_parameters(self):
-        """Upload la categoriile de parametri din `parameters.json`."""
-        if not os.path.exists(self.parameters_file):
-            return
+        # 🔹 generic_commands.json modificat din afara aplicației: sunt actualizate doar rândurile schimbate
+        self.file_watcher = DataFileWatcher([self.json_file], self)
+        self.file_watcher.file_changed.connect(lambda path: self.reload_external_commands())
+
+    def load_parameters(self, on_loaded=None):
+        """Upload la categoriile de parametri din `parameters.json` (în fundal); `on_loaded` rulează după actualizare."""
+        def read_parameters():
+            if not os.path.exists(self.parameters_file):
+                return None
 
-        try:
-            with open(self.parameters_file, "r", encoding="utf-8") as file:
-                self.parameters_data = json.load(file)
-        except json.JSONDecodeError:
-            print("⚠️ Error loading parameters file.")
+            try:
+                return read_json(self.parameters_file)
+            except json.JSONDecodeError:
+                print("⚠️ Error loading parameters file.")
+                return None
+
+        def apply(parameters_data):
+            if parameters_data is not None:
+                self.parameters_data = parameters_data
+            if on_loaded:
+                on_loaded()
+
+        io_executor().submit_read(self.parameters_file, read_parameters, apply)
 
     def add_command(self):
         """Adaugă o nouă comandă și reîncărcăm categoriile de parametri pentru a include cele mai recente date."""
 
         # 🔹 Reîncărcăm datele parametrilor înainte de a deschide dialogul
-        self.load_parameters()
-        print("🔹 Parameters reloaded before creating command:", self.parameters_data.keys())
+        self.load_parameters(on_loaded=self.create_command)
+
+    def create_command(self):
         """Adaugă o nouă comandă cu dialog personalizat."""
+        print("🔹 Parameters reloaded before creating command:", self.parameters_data.keys())
         command_name, ok = QInputDialog.getText(self, "New Command", "Enter command name:")
         if not ok or not command_name.strip():
             return
@@ -165,28 +188,95 @@ class GenericCommandPage(QWidget):
             self.save_commands()
 
     def save_commands(self):
-        """Salvează comenzile în JSON."""
-        with open(self.json_file, "w", encoding="utf-8") as file:
-            json.dump(self.commands_data, file, indent=4)
+        """Salvează comenzile în JSON (în fundal, pe o copie a datelor)."""
+        commands_data = copy_json_data(self.commands_data)
+        io_executor().submit_write(self.json_file, lambda: self.commands_file.write(commands_data),
+                                   on_done=self.commands_saved)
+
+    def commands_saved(self, result):
+        """După salvare: comenzile păstrate de pe disc (salvate de altă instanță) apar și în tabel."""
+        report_save("Generic commands", result, self)
+        if result.from_disk:
+            self.reload_external_commands(only=result.from_disk)
+
+    def reload_external_commands(self, only=None):
+        """Citește generic_commands.json în fundal și aplică doar comenzile modificate."""
+        io_executor().submit_read(
+            self.json_file, lambda: self.commands_file.read_external_change(force=only is not None),
+            lambda change: self.apply_external_commands(change, only),
+            on_error=lambda e: print(f"❌ ERROR reloading commands: {e}"))
+
+    def apply_external_commands(self, change, only=None):
+        """Adaugă, actualizează sau șterge doar rândurile comenzilor modificate pe disc."""
+        if change is None:
+            return
+
+        commands_data, pristine, stamp = change
+        added, changed, removed = diff_entries(self.commands_data, commands_data)
+        if only is not None:
+            only = set(only)
+            added, changed, removed = ([key for key in keys if describe_key(key) in only]
+                                       for keys in (added, changed, removed))
+
+        io_executor().submit_read(self.json_file, lambda: self.commands_file.remember(pristine, stamp),
+                                  description="Remembering generic_commands.json version")
+
+        removed_names = {command_name for command_name, in removed}
+        updated_names = {command_name for command_name, in changed}
+        for row in reversed(range(self.command_table.rowCount())):
+            command_name = self.command_table.item(row, 0).text()
+            if command_name in removed_names:
+                self.command_table.removeRow(row)
+            elif command_name in updated_names:
+                details = commands_data[command_name]
+                self.command_table.setItem(row, 1, QTableWidgetItem(details.get("Action", "")))
+                self.command_table.setItem(row, 2, QTableWidgetItem(details.get("Expected Result", "")))
+
+        for command_name in removed_names:
+            del self.commands_data[command_name]
+        for command_name in updated_names:
+            self.commands_data[command_name] = commands_data[command_name]
+        for command_name, in added:
+            details = self.commands_data[command_name] = commands_data[command_name]
+            row_position = self.command_table.rowCount()
+            self.command_table.insertRow(row_position)
+            self.command_table.setItem(row_position, 0, QTableWidgetItem(command_name))
+            self.command_table.setItem(row_position, 1, QTableWidgetItem(details.get("Action", "")))
+            self.command_table.setItem(row_position, 2, QTableWidgetItem(details.get("Expected Result", "")))
+
+        if added:
+            self.filter_commands()
+        print(f"🔄 generic_commands.json changed on disk: {len(added)} added, {len(changed)} changed, "
+              f"{len(removed)} removed.")
 
     def load_commands(self):
-        """Încarcă comenzile din JSON."""
-        if not os.path.exists(self.json_file):
+        """Încarcă comenzile din JSON (în fundal) și populează tabelul."""
+        def read_commands():
+            if not os.path.exists(self.json_file):
+                return None
+
+            try:
+                return self.commands_file.read()
+            except json.JSONDecodeError:
+                print("Error loading JSON file.")
+                return None
+
+        io_executor().submit_read(self.json_file, read_commands, self.populate_commands)
+
+    def populate_commands(self, commands_data):
+        """Populează tabelul cu comenzile încărcate."""
+        if commands_data is None:
             return
 
-        try:
-            with open(self.json_file, "r", encoding="utf-8") as file:
-                self.commands_data = json.load(file)
+        self.commands_data = commands_data
 
-            for command_name, details in self.commands_data.items():
-                row_position = self.command_table.rowCount()
-                self.command_table.insertRow(row_position)
+        for command_name, details in self.commands_data.items():
+            row_position = self.command_table.rowCount()
+            self.command_table.insertRow(row_position)
 
-                self.command_table.setItem(row_position, 0, QTableWidgetItem(command_name))
-                self.command_table.setItem(row_position, 1, QTableWidgetItem(details.get("Action", "")))
-                self.command_table.setItem(row_position, 2, QTableWidgetItem(details.get("Expected Result", "")))
-        except json.JSONDecodeError:
-            print("Error loading JSON file.")
+            self.command_table.setItem(row_position, 0, QTableWidgetItem(command_name))
+            self.command_table.setItem(row_position, 1, QTableWidgetItem(details.get("Action", "")))
+            self.command_table.setItem(row_position, 2, QTableWidgetItem(details.get("Expected Result", "")))
 
     def filter_commands(self):
         """Filtrează comenzile în funcție de textul introdus în căutare."""
@@ -227,6 +317,10 @@ class GenericCommandPage(QWidget):
         edit_action.triggered.connect(self.edit_selected_command)
         context_menu.addAction(edit_action)
 
+        update_tests_action = QAction("Update Dependent Tests", self)
+        update_tests_action.triggered.connect(self.update_dependent_tests)
+        context_menu.addAction(update_tests_action)
+
         delete_action = QAction("Delete Command", self)
         delete_action.triggered.connect(self.delete_selected_command)
         context_menu.addAction(delete_action)
@@ -262,6 +356,18 @@ class GenericCommandPage(QWidget):
 
             self.save_commands()
 
+            if (new_action, new_expected) != (action_text, expected_text):
+                self.command_changed.emit(command_name)
+
+    def update_dependent_tests(self):
+        """Re-generează manual toate step-urile construite din comanda selectată."""
+        selected_row = self.command_table.currentRow()
+        if selected_row == -1:
+            QMessageBox.warning(self, "No Command Selected", "Please select a command.")
+            return
+
+        self.command_changed.emit(self.command_table.item(selected_row, 0).text())
+
     def get_resource_path(self, relative_path):
         """Get the correct path whether running as a script or an executable."""
         if getattr(sys, 'frozen', False):  # Running as compiled .exe
@@ -1,23 +1,71 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QTableWidget, QTableWidgetItem,
     QHBoxLayout, QLabel, QLineEdit, QHeaderView, QFrame, QTabWidget,
-    QMessageBox, QInputDialog, QFileDialog, QAction, QMenu
+    QMessageBox, QInputDialog, QFileDialog, QAction, QMenu, QDialog, QListWidget, QListWidgetItem,
+    QApplication, QShortcut
 )
-from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QKeySequence
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 import json
 import os
-import pandas as pd
 import sys
 
+from utils.file_watcher import DataFileWatcher
+from utils.io_executor import io_executor
+from utils.json_io import SharedJsonFile, report_save
+from utils.parameter_table import ParameterTable, format_clipboard_block, parse_clipboard_block
+from utils.spec_merge import describe_key, diff_entries
+from utils.value_index import ValueIndex, format_canonical
+
+
+class ParameterListDialog(QDialog):
+    """Listă de rezultate (căutare după valoare, duplicate); dublu click pe un parametru îl afișează în tabel."""
+
+    def __init__(self, title, summary, rows):
+        super().__init__()
+        self.setWindowTitle(title)
+        self.setGeometry(400, 300, 600, 450)
+        self.selected_parameter = None
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(summary))
+
+        # 🔹 `rows`: (text, (categorie, parametru)) sau (text, None) pentru rândurile de titlu
+        self.result_list = QListWidget()
+        for text, parameter in rows:
+            item = QListWidgetItem(text)
+            if parameter is None:
+                item.setFlags(Qt.ItemIsEnabled)
+                font = item.font()
+                font.setBold(True)
+                item.setFont(font)
+            else:
+                item.setData(Qt.UserRole, parameter)
+            self.result_list.addItem(item)
+        self.result_list.itemDoubleClicked.connect(self.select_parameter)
+        layout.addWidget(self.result_list)
+
+        self.setLayout(layout)
+
+    def select_parameter(self, item):
+        if item.data(Qt.UserRole):
+            self.selected_parameter = tuple(item.data(Qt.UserRole))
+            self.accept()
+
+
 class ParametersPage(QWidget):
+    parameter_renamed = pyqtSignal(str, str, str)  # 🔹 (categorie, nume vechi, nume nou) - testele sunt actualizate
+
     def __init__(self):
         super().__init__()
 
         self.category_tables = {}
 
         self.json_file = self.get_resource_path("../data/parameters.json")
-        self.load_parameters()
+        self.shared_file = SharedJsonFile(self.json_file, merge_depth=2)  # 🔹 Îmbinare per parametru la salvare
+        self.parameters_data = {}
+        self.save_scheduled = False
+        self.value_index = None  # 🔹 Construit la prima căutare după valoare; invalidat la fiecare salvare
 
         layout = QVBoxLayout()
 
@@ -44,11 +92,26 @@ class ParametersPage(QWidget):
         self.import_button.clicked.connect(self.import_from_xlsx)
         layout.addWidget(self.import_button)
 
+        # 🔹 Căutare după valoare și raportul de duplicate (index pe valorile normalizate)
+        value_tools_layout = QHBoxLayout()
+        self.find_by_value_button = QPushButton("🔎 Find by Value")
+        self.find_by_value_button.clicked.connect(self.find_by_value)
+        value_tools_layout.addWidget(self.find_by_value_button)
+
+        self.duplicates_button = QPushButton("♊ Duplicate Values Report")
+        self.duplicates_button.clicked.connect(self.show_duplicate_values)
+        value_tools_layout.addWidget(self.duplicates_button)
+        layout.addLayout(value_tools_layout)
+
         self.copied_parameter = None  # ✅ Buffer pentru Copy/Paste
 
         self.setLayout(layout)
 
-        self.populate_tabs()  # Populează UI-ul cu datele existente din JSON
+        self.load_parameters(on_loaded=self.populate_tabs)  # Populează UI-ul cu datele existente din JSON
+
+        # 🔹 parameters.json modificat din afara aplicației: sunt actualizați doar parametrii schimbați
+        self.file_watcher = DataFileWatcher([self.json_file], self)
+        self.file_watcher.file_changed.connect(lambda path: self.reload_external_parameters())
 
     def show_context_menu(self, position, parameter_table, category_name):
         """Afișează meniul contextual pentru parametri."""
@@ -83,12 +146,27 @@ class ParametersPage(QWidget):
         edit_name_action.triggered.connect(lambda: self.edit_parameter_name(row, parameter_table, category_name))
         menu.addAction(edit_name_action)
 
+        menu.addSeparator()
+
+        copy_cells_action = QAction("Copy Cells", self)
+        copy_cells_action.triggered.connect(lambda: self.copy_cells(parameter_table))
+        menu.addAction(copy_cells_action)
+
+        paste_cells_action = QAction("Paste Cells", self)
+        paste_cells_action.setEnabled(bool(QApplication.clipboard().text()))
+        paste_cells_action.triggered.connect(lambda: self.paste_cells(category_name, parameter_table))
+        menu.addAction(paste_cells_action)
+
+        fill_down_action = QAction("Fill Down", self)
+        fill_down_action.triggered.connect(lambda: self.fill_down(category_name, parameter_table))
+        menu.addAction(fill_down_action)
+
         menu.exec_(parameter_table.viewport().mapToGlobal(position))
 
     def copy_parameter(self, param_name, category_name):
 	    """Copiem un parametru pentru a fi lipit într-o altă categorie."""
 	    if category_name in self.parameters_data and param_name in self.parameters_data[category_name]:
-		    self.copied_parameter = (param_name, self.parameters_data[category_name].copy())
+		    self.copied_parameter = (param_name, self.parameters_data[category_name][param_name].copy())
 		    self.copied_category = category_name
 		    print(f"📋 Copied parameter: {param_name} from {category_name}")
 	    else:
@@ -109,8 +187,8 @@ class ParametersPage(QWidget):
 
         print(f"📋 Pasting parameter: {new_param_name} into {category_name}")
 
-        self.parameters_data[category_name][new_param_name] = param_data
-        self.add_parameter_to_table(target_row + 1, new_param_name, param_data, parameter_table)
+        self.parameters_data[category_name].insert(target_row + 1, new_param_name, param_data)
+        self.insert_parameter_in_ui(target_row + 1, new_param_name, param_data, parameter_table)
         self.save_parameters()
         print(f"✅ Pasted parameter: {new_param_name} in {category_name}")
 
@@ -137,17 +215,9 @@ class ParametersPage(QWidget):
             # ✅ Copy parameter data and avoid reference issues
             new_param_data = self.parameters_data[category_name][param_name].copy()
 
-            # ✅ Insert the new parameter in the dictionary **immediately after the original**
-            keys_list = list(self.parameters_data[category_name].keys())
-            param_index = keys_list.index(param_name)
-            updated_dict = {}
-
-            for key in keys_list:
-                updated_dict[key] = self.parameters_data[category_name][key]
-                if key == param_name:  # ✅ Insert duplicate immediately after original
-                    updated_dict[new_param_name] = new_param_data
-
-            self.parameters_data[category_name] = updated_dict
+            # ✅ Insert the new parameter **immediately after the original**
+            category_table = self.parameters_data[category_name]
+            category_table.insert(category_table.rows[param_name] + 1, new_param_name, new_param_data)
 
             # ✅ Manually insert a new row in UI **without overwriting**
             self.insert_parameter_in_ui(row+1, new_param_name, new_param_data, parameter_table)
@@ -191,14 +261,18 @@ class ParametersPage(QWidget):
 
             print(f"✏️ Renaming parameter '{old_name}' to '{new_name}' in {category_name}")
 
-            # ✅ Actualizăm JSON
-            self.parameters_data[category_name][new_name] = self.parameters_data[category_name].pop(old_name)
+            # ✅ Actualizăm JSON (parametrul își păstrează poziția)
+            self.parameters_data[category_name].rename_parameter(old_name, new_name)
 
             # ✅ Actualizăm UI
             item.setText(new_name)
             self.save_parameters()
             print(f"✅ Renamed parameter '{old_name}' to '{new_name}' in {category_name}")
 
+            # ✅ Salvarea este trimisă imediat, astfel încât testele recitesc parametrii cu noul nume
+            self.flush_pending_io()
+            self.parameter_renamed.emit(category_name, old_name, new_name)
+
     def handle_item_edit(self, item):
         """Previne editarea directă a numelui parametrului."""
         if item.column() == 0:  # ✅ Coloana `Parameter Name`
@@ -207,61 +281,191 @@ class ParametersPage(QWidget):
             item.setText(self.previous_param_name)  # ✅ Revenim la numele anterior
             self.table.blockSignals(False)
 
-    def load_parameters(self):
-        """Loads parameters from JSON, ensuring correct format and preventing errors."""
-        self.parameters_data = {}
+    def load_parameters(self, on_loaded=None):
+        """Loads parameters from JSON in the background; `on_loaded` runs once `parameters_data` is updated."""
+        def apply(parameters_data):
+            self.parameters_data = parameters_data
+            self.value_index = None
+            if on_loaded:
+                on_loaded()
+
+        io_executor().submit_read(self.json_file, self.read_parameters_file, apply)
+
+    def read_parameters_file(self):
+        """Reads parameters.json, ensuring correct format and preventing errors (runs on the I/O thread)."""
+        parameters_data = {}
 
         if not os.path.exists(self.json_file):
             print(f"⚠️ Warning: {self.json_file} not found. Creating a new one.")
-            return
+            return parameters_data
 
         try:
-            with open(self.json_file, "r", encoding="utf-8") as file:
-                data = json.load(file)
-
-            # ✅ Cleaning up any incorrect structure while loading
-            for category, params in data.items():
-                self.parameters_data[category] = {}
-                for param_name, param_data in params.items():
-                    if isinstance(param_data, dict):
-                        self.parameters_data[category][param_name] = {
-                            k: v for k, v in param_data.items() if k != "Parameter Name"
-                        }
-                    else:
-                        print(f"⚠️ Skipping invalid parameter structure for '{param_name}' in '{category}'.")
-
+            parameters_data = self.parameter_tables(self.shared_file.read())
             print("✅ Parameters loaded successfully.")
 
         except json.JSONDecodeError:
             print(f"⚠️ Error: {self.json_file} is corrupted or empty.")
-            self.parameters_data = {}
+            parameters_data = {}
+
+        return parameters_data
+
+    @staticmethod
+    def parameter_tables(data):
+        """{category: ParameterTable} from the JSON data, skipping entries with an incorrect structure."""
+        parameters_data = {}
+        for category, params in data.items():
+            parameters_data[category] = ParameterTable()
+            for param_name, param_data in params.items():
+                if isinstance(param_data, dict):
+                    parameters_data[category][param_name] = {
+                        k: v for k, v in param_data.items() if k != "Parameter Name"
+                    }
+                else:
+                    print(f"⚠️ Skipping invalid parameter structure for '{param_name}' in '{category}'.")
+        return parameters_data
 
     def save_parameters(self, update_ui=True):
-        """Saves parameters correctly to JSON and updates UI if needed."""
+        """
+        Saves parameters to JSON in the background.
+
+        All calls made during one event-loop iteration are grouped into a single write. The in-memory
+        `parameters_data` is what gets written, so it is no longer re-read from disk afterwards
+        (`update_ui` is kept for compatibility).
+        """
         if not self.json_file:
             print("❌ ERROR: json_file path is not set!")
             return
 
-        try:
-            print("🔹 Saving parameters to JSON...")
-            cleaned_data = {}
-            for category, params in self.parameters_data.items():
-                cleaned_data[category] = {
-                    param_name: {k: v for k, v in param_data.items() if k != "Parameter Name"}
-                    for param_name, param_data in params.items()
-                }
+        self.value_index = None  # ✅ Valorile s-au schimbat; indexul este reconstruit la următoarea căutare
 
-            with open(self.json_file, "w", encoding="utf-8") as file:
-                json.dump(cleaned_data, file, indent=4)
+        if not self.save_scheduled:
+            self.save_scheduled = True
+            QTimer.singleShot(0, self.flush_pending_io)
 
-            print(f"✅ Parameters saved successfully in: {self.json_file}")
+    def flush_pending_io(self):
+        """Hands the scheduled save over to the I/O thread immediately."""
+        if not self.save_scheduled:
+            return
 
-            # 🔹 Only reload UI if explicitly requested
-            if update_ui:
-                self.load_parameters()
+        self.save_scheduled = False
+        print("🔹 Saving parameters to JSON...")
+        cleaned_data = {category: params.to_dict() for category, params in self.parameters_data.items()}
+
+        io_executor().submit_write(
+            self.json_file, lambda: self.shared_file.write(cleaned_data),
+            on_done=self.parameters_saved,
+            on_error=lambda e: print(f"❌ ERROR saving parameters: {e}"))
+
+    def parameters_saved(self, result):
+        """După salvare: parametrii păstrați de pe disc (salvați de altă instanță) sunt preluați și în UI."""
+        report_save(f"Parameters ({self.json_file})", result, self)
+        if result.from_disk:
+            self.reload_external_parameters(only=result.from_disk)
+
+    # ----------------- External Changes -----------------
+    def reload_external_parameters(self, only=None):
+        """Citește parameters.json în fundal și aplică doar diferențele (`only`: doar aceste intrări)."""
+        def read_change():
+            change = self.shared_file.read_external_change(force=only is not None)
+            if change is None:
+                return None
+            data, pristine, stamp = change
+            return self.parameter_tables(data), pristine, stamp
+
+        io_executor().submit_read(self.json_file, read_change,
+                                  lambda change: self.apply_external_parameters(change, only),
+                                  on_error=lambda e: print(f"❌ ERROR reloading parameters: {e}"))
+
+    def apply_external_parameters(self, change, only=None):
+        """Applies the categories and parameters added, changed or removed on disk to the tabs, in place."""
+        if change is None:
+            return
+        if self.save_scheduled and only is None:
+            return  # ✅ Salvarea programată îmbină modificările de pe disc și le preia apoi (`parameters_saved`)
+
+        parameters_data, pristine, stamp = change
+        added, changed, removed = diff_entries(self.parameters_data, parameters_data, depth=2)
+        if only is not None:
+            only = set(only)
+            added, changed, removed = ([key for key in keys if describe_key(key) in only]
+                                       for keys in (added, changed, removed))
+
+        # ✅ Versiunea citită devine baza pentru următoarea salvare (înainte de orice salvare declanșată aici)
+        io_executor().submit_read(self.json_file, lambda: self.shared_file.remember(pristine, stamp),
+                                  description="Remembering parameters.json version")
+
+        removed_categories = {key[0] for key in removed if len(key) == 1}
+        for category_name in removed_categories:
+            self.remove_category_tab(category_name)
+        for category_name, param_name in (key for key in removed if len(key) == 2):
+            if category_name not in removed_categories:
+                self.remove_parameter_row(category_name, param_name)
+
+        added_categories = {key[0] for key in added if len(key) == 1}
+        for category_name in added_categories:
+            self.parameters_data[category_name] = parameters_data[category_name]
+            self.add_category(category_name, parameters_data[category_name])
+
+        for category_name, param_name in (key for key in changed + added if len(key) == 2):
+            if category_name not in added_categories:
+                self.set_parameter_row(category_name, param_name, parameters_data[category_name][param_name])
+
+        self.value_index = None
+        print(f"🔄 parameters.json changed on disk: {len(added)} added, {len(changed)} changed, "
+              f"{len(removed)} removed.")
+
+    def remove_category_tab(self, category_name):
+        for index in range(self.tab_widget.count()):
+            if self.tab_widget.tabText(index) == category_name:
+                self.tab_widget.removeTab(index)
+                break
+        self.parameters_data.pop(category_name, None)
+        self.category_tables.pop(category_name, None)
+
+    def remove_parameter_row(self, category_name, param_name):
+        parameters = self.parameters_data.get(category_name)
+        table = self.category_tables.get(category_name)
+        if parameters is None or param_name not in parameters:
+            return
+        del parameters[param_name]
+        if table is None:
+            return
+        for row in range(table.rowCount()):
+            item = table.item(row, 0)
+            if item and item.text().strip() == param_name:
+                table.removeRow(row)
+                break
+
+    def set_parameter_row(self, category_name, param_name, values):
+        """Replaces (or appends) one parameter with `values`, updating only its row of the table."""
+        parameters = self.parameters_data.get(category_name)
+        table = self.category_tables.get(category_name)
+        if parameters is None or table is None:
+            return
+        values = dict(values)
+        is_new = param_name not in parameters
+        parameters[param_name] = values
 
-        except Exception as e:
-            print(f"❌ ERROR saving parameters: {e}")
+        table.blockSignals(True)  # ✅ Fără `update_parameter_value` (și salvare) pentru fiecare celulă
+        try:
+            headers = [table.horizontalHeaderItem(col).text() for col in range(table.columnCount())]
+            for variant in parameters.variants:
+                if variant not in headers:
+                    table.insertColumn(table.columnCount())
+                    table.setHorizontalHeaderItem(table.columnCount() - 1, QTableWidgetItem(variant))
+                    headers.append(variant)
+
+            if is_new:
+                self.insert_parameter_in_ui(table.rowCount(), param_name, values, table)
+                return
+            for row in range(table.rowCount()):
+                item = table.item(row, 0)
+                if item and item.text().strip() == param_name:
+                    for col in range(1, len(headers)):
+                        table.setItem(row, col, QTableWidgetItem(str(values.get(headers[col], ""))))
+                    break
+        finally:
+            table.blockSignals(False)
 
     def populate_tabs(self):
         """Populează interfața cu datele din JSON la pornirea aplicației."""
@@ -278,7 +482,7 @@ class ParametersPage(QWidget):
 
         # ✅ Ensure `self.parameters_data` contains the new category
         if category_name not in self.parameters_data:
-            self.parameters_data[category_name] = {}
+            self.parameters_data[category_name] = ParameterTable()
 
         new_tab = QWidget()
         tab_layout = QVBoxLayout()
@@ -308,22 +512,26 @@ class ParametersPage(QWidget):
         parameter_table = QTableWidget()
 
         if parameters:
+            if not isinstance(parameters, ParameterTable):
+                parameters = self.parameters_data[category_name] = ParameterTable(parameters)
+
             column_headers = ["Parameter Name"]
-            first_param = next(iter(parameters.values()), {})
-            column_headers.extend(first_param.keys())
+            column_headers.extend(parameters.variants)
 
             parameter_table.setColumnCount(len(column_headers))
             parameter_table.setHorizontalHeaderLabels(column_headers)
+            parameter_table.setRowCount(len(parameters))
 
-            for param_name, values in parameters.items():
-                row_position = parameter_table.rowCount()
-                parameter_table.insertRow(row_position)
+            for row_position, param_name in enumerate(parameters.names):
                 param_item = QTableWidgetItem(param_name)
                 param_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
                 parameter_table.setItem(row_position, 0, param_item )
 
-                for col_index, (variant_name, variant_value) in enumerate(values.items(), start=1):
-                    parameter_table.setItem(row_position, col_index, QTableWidgetItem(str(variant_value)))
+            # ✅ Coloanele sunt completate direct din tabelul columnar
+            for col_index, variant_name in enumerate(parameters.variants, start=1):
+                for row_position, variant_value in enumerate(parameters.columns[variant_name]):
+                    if variant_value is not None:
+                        parameter_table.setItem(row_position, col_index, QTableWidgetItem(variant_value))
 
         else:
             parameter_table.setColumnCount(2)
@@ -336,10 +544,12 @@ class ParametersPage(QWidget):
         button_layout = QHBoxLayout()
 
         add_variant_button = QPushButton("➕ Add Variant")
+        rename_variant_button = QPushButton("✏️ Rename Variant")
         delete_variant_button = QPushButton("🗑 Delete Variant")
         export_button = QPushButton("📤 Export to XLSX")
 
         button_layout.addWidget(add_variant_button)
+        button_layout.addWidget(rename_variant_button)
         button_layout.addWidget(delete_variant_button)
         button_layout.addWidget(export_button)
 
@@ -349,6 +559,7 @@ class ParametersPage(QWidget):
         add_parameter_button.clicked.connect(
             lambda: self.add_parameter(table=parameter_table, parameter_name_input=parameter_name_input))
         add_variant_button.clicked.connect(lambda: self.add_variant(parameter_table))
+        rename_variant_button.clicked.connect(lambda: self.rename_variant(parameter_table))
         delete_variant_button.clicked.connect(lambda: self.delete_variant(parameter_table))
         export_button.clicked.connect(lambda: self.export_to_xlsx(category_name, parameter_table))
 
@@ -359,6 +570,15 @@ class ParametersPage(QWidget):
         parameter_table.cellChanged.connect(
             lambda row, col: self.update_parameter_value(category_name, parameter_table, row, col))
 
+        # ✅ Range edit: Ctrl+C / Ctrl+V pe blocuri de celule (Excel), Ctrl+D = Fill Down
+        for key_sequence, handler in (
+                (QKeySequence.Copy, lambda: self.copy_cells(parameter_table)),
+                (QKeySequence.Paste, lambda: self.paste_cells(category_name, parameter_table)),
+                (QKeySequence("Ctrl+D"), lambda: self.fill_down(category_name, parameter_table))):
+            shortcut = QShortcut(key_sequence, parameter_table)
+            shortcut.setContext(Qt.WidgetShortcut)  # ✅ Nu interceptează paste-ul din editorul unei celule
+            shortcut.activated.connect(handler)
+
         # ✅ Store the table reference for this category
         self.category_tables[category_name] = parameter_table
 
@@ -451,15 +671,22 @@ class ParametersPage(QWidget):
             traceback.print_exc()
 
     def export_to_xlsx(self, category_name, table):
-        """Exportă parametrii unei categorii într-un fișier XLSX."""
-        try:
-            df = pd.DataFrame(columns=[table.horizontalHeaderItem(col).text() for col in range(table.columnCount())])
-            for row in range(table.rowCount()):
-                df.loc[row] = [table.item(row, col).text() if table.item(row, col) else "" for col in range(table.columnCount())]
-            df.to_excel(f"{category_name}.xlsx", index=False)
-            QMessageBox.information(self, "Export Successful", f"Category {category_name} exported to {category_name}.xlsx")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Failed", f"An error occurred during export:\n{str(e)}")
+        """Exportă parametrii unei categorii într-un fișier XLSX (scrierea rulează în fundal)."""
+        columns = [table.horizontalHeaderItem(col).text() for col in range(table.columnCount())]
+        rows = [[table.item(row, col).text() if table.item(row, col) else "" for col in range(table.columnCount())]
+                for row in range(table.rowCount())]
+        file_path = f"{category_name}.xlsx"
+
+        def write_xlsx():
+            import pandas as pd  # ✅ Import întârziat - pandas este încărcat doar la import/export
+            pd.DataFrame(rows, columns=columns).to_excel(file_path, index=False)
+
+        io_executor().submit_write(
+            file_path, write_xlsx,
+            on_done=lambda _: QMessageBox.information(self, "Export Successful",
+                                                      f"Category {category_name} exported to {category_name}.xlsx"),
+            on_error=lambda e: QMessageBox.critical(self, "Export Failed", f"An error occurred during export:\n{str(e)}"),
+            description=f"Exporting {file_path}")
 
     def add_variant(self, table):
         """Adds a new variant for all existing parameters in the table and updates JSON."""
@@ -479,20 +706,18 @@ class ParametersPage(QWidget):
                 QMessageBox.warning(self, "Warning", "Variant name cannot be empty!")
                 return
 
+            variant_name = variant_name.strip()
+            if variant_name in self.parameters_data[category_name].columns:
+                QMessageBox.warning(self, "Warning", f"Variant '{variant_name}' already exists!")
+                return
+
+            # ✅ O singură operație pe coloană: toți parametrii primesc valoarea goală
+            self.parameters_data[category_name].add_variant(variant_name, "")
+
             col_position = table.columnCount()
             table.insertColumn(col_position)
             table.setHorizontalHeaderItem(col_position, QTableWidgetItem(variant_name))
 
-            for row in range(table.rowCount()):
-                param_name = table.item(row, 0).text()
-
-                # ✅ Ensure parameter exists in JSON
-                if param_name in self.parameters_data[category_name]:
-                    self.parameters_data[category_name][param_name][variant_name] = ""
-
-                # ✅ Update UI with a placeholder value
-                table.setItem(row, col_position, QTableWidgetItem(""))
-
             self.save_parameters()
             print(f"✅ Added variant '{variant_name}' to category '{category_name}' and saved to JSON.")
 
@@ -501,7 +726,7 @@ class ParametersPage(QWidget):
             QMessageBox.critical(self, "Error", f"An error occurred while adding the variant:\n{str(e)}")
 
     def delete_variant(self, table):
-        """Deletes the selected variant (column) from the table and updates JSON, then reloads UI."""
+        """Deletes the selected variant (column) from the table and updates JSON."""
         if table.columnCount() <= 2:  # ✅ Keep at least "Parameter Name" and "Default Value"
             QMessageBox.warning(self, "Warning", "You cannot delete the default columns!")
             return
@@ -519,23 +744,52 @@ class ParametersPage(QWidget):
             print(f"❌ ERROR: Category '{category_name}' not found in self.parameters_data!")
             return
 
-        # ✅ Remove the variant from all parameters in JSON
-        for param_name in self.parameters_data[category_name]:
-            if variant_to_delete in self.parameters_data[category_name][param_name]:
-                del self.parameters_data[category_name][param_name][variant_to_delete]
-
-        # ✅ Remove the column from UI
+        # ✅ Remove the variant column from the data and from the UI
+        if variant_to_delete in self.parameters_data[category_name].columns:
+            self.parameters_data[category_name].remove_variant(variant_to_delete)
         table.removeColumn(selected_column)
 
-        # ✅ Save the changes and reload the UI
         self.save_parameters()
-        self.reload_ui()
 
         print(f"✅ Deleted variant '{variant_to_delete}' from category '{category_name}' and updated JSON.")
 
+    def rename_variant(self, table):
+        """Renames the selected variant (column) of the current category."""
+        selected_column = table.currentColumn()
+        if selected_column < 2:  # ✅ "Parameter Name" and "Default Value" keep their names
+            QMessageBox.warning(self, "Warning", "Select a variant column (other than Default Value) to rename.")
+            return
+
+        old_variant = table.horizontalHeaderItem(selected_column).text()
+        category_name = self.tab_widget.tabText(self.tab_widget.currentIndex())
+        if category_name not in self.parameters_data:
+            print(f"❌ ERROR: Category '{category_name}' not found in self.parameters_data!")
+            return
+
+        new_variant, ok = QInputDialog.getText(self, "Rename Variant", "Enter new variant name:", text=old_variant)
+        if not ok or not new_variant.strip() or new_variant.strip() == old_variant:
+            return
+
+        new_variant = new_variant.strip()
+        if new_variant in self.parameters_data[category_name].columns:
+            QMessageBox.warning(self, "Warning", f"Variant '{new_variant}' already exists!")
+            return
+
+        if old_variant in self.parameters_data[category_name].columns:
+            self.parameters_data[category_name].rename_variant(old_variant, new_variant)
+        else:
+            self.parameters_data[category_name].add_variant(new_variant, None)
+        table.horizontalHeaderItem(selected_column).setText(new_variant)
+
+        self.save_parameters()
+        print(f"✅ Renamed variant '{old_variant}' to '{new_variant}' in category '{category_name}'.")
+
     def update_parameter_value(self, category_name, table, row, col):
         """Updates a parameter value in the internal dictionary and saves it to JSON, including variants."""
         try:
+            if col == 0:
+                return  # ✅ Parameter names are changed only through `edit_parameter_name`
+
             param_name_item = table.item(row, 0)
             if not param_name_item:
                 return  # ✅ Do nothing if the parameter name does not exist
@@ -557,10 +811,7 @@ class ParametersPage(QWidget):
                 return
 
             # ✅ Update default value or variant
-            if variant_name == "Default Value":
-                self.parameters_data[category_name][param_name]["Default Value"] = value
-            else:
-                self.parameters_data[category_name][param_name][variant_name] = value
+            self.parameters_data[category_name].set_value(param_name, variant_name, value)
 
             # ✅ Save changes to JSON
             self.save_parameters()
@@ -570,21 +821,184 @@ class ParametersPage(QWidget):
             print(f"❌ Error updating parameter value: {str(e)}")
             QMessageBox.critical(self, "Error", f"An error occurred while updating the parameter value:\n{str(e)}")
 
+    def apply_cell_changes(self, category_name, table, cells):
+        """
+        Applies a batch of [(row, col, value)] cell edits (range paste, fill down).
+
+        The whole batch is one in-memory update of the category, one refresh of the table (its signals are
+        blocked, so `update_parameter_value` does not run per cell) and one save.
+        """
+        parameters = self.parameters_data.get(category_name)
+        if parameters is None:
+            print(f"❌ ERROR: Category '{category_name}' not found in parameters_data!")
+            return 0
+
+        variant_names = [table.horizontalHeaderItem(col).text().strip() for col in range(table.columnCount())]
+        param_names = {}
+        changes = []
+        for row, col, value in cells:
+            if col == 0:
+                continue  # ✅ Numele parametrilor se schimbă doar prin `edit_parameter_name`
+            if row not in param_names:
+                name_item = table.item(row, 0)
+                param_names[row] = name_item.text().strip() if name_item else None
+            if param_names[row] in parameters:
+                changes.append((row, col, value.strip()))
+
+        changed = parameters.set_values((param_names[row], variant_names[col], value) for row, col, value in changes)
+
+        table.blockSignals(True)
+        table.setUpdatesEnabled(False)
+        try:
+            for row, col, value in changes:
+                item = table.item(row, col)
+                if item:
+                    item.setText(value)
+                else:
+                    table.setItem(row, col, QTableWidgetItem(value))
+        finally:
+            table.setUpdatesEnabled(True)
+            table.blockSignals(False)
+
+        if changed:
+            self.save_parameters()
+        print(f"✅ Updated {changed} value(s) in category '{category_name}' ({len(changes)} cell(s) edited).")
+        return changed
+
+    @staticmethod
+    def visible_rows(table, top, bottom):
+        """Rows top..bottom that are not hidden by the search filter."""
+        return [row for row in range(top, bottom + 1) if not table.isRowHidden(row)]
+
+    def copy_cells(self, table):
+        """Copies the selected block (visible rows only) to the clipboard as tab separated text."""
+        ranges = table.selectedRanges()
+        if not ranges:
+            return
+
+        block = ranges[0]
+        rows = [
+            [table.item(row, col).text() if table.item(row, col) else ""
+             for col in range(block.leftColumn(), block.rightColumn() + 1)]
+            for row in self.visible_rows(table, block.topRow(), block.bottomRow())
+        ]
+        QApplication.clipboard().setText(format_clipboard_block(rows))
+        print(f"📋 Copied {len(rows)}x{block.columnCount()} cell(s)")
+
+    def paste_cells(self, category_name, table):
+        """
+        Pastes a tab separated block (e.g. copied from Excel) starting at the selected cell.
+
+        A single copied value fills every selected cell. The block is clipped to the existing parameters and
+        variants, and rows hidden by the search filter are skipped.
+        """
+        block = parse_clipboard_block(QApplication.clipboard().text())
+        if not block:
+            return
+
+        ranges = table.selectedRanges()
+        if ranges:
+            anchor_row = min(selection.topRow() for selection in ranges)
+            anchor_col = min(selection.leftColumn() for selection in ranges)
+        else:
+            anchor_row, anchor_col = table.currentRow(), table.currentColumn()
+        if anchor_row < 0 or anchor_col < 0:
+            QMessageBox.warning(self, "No Cell Selected", "Select the cell where the values should be pasted.")
+            return
+
+        cells = []
+        if len(block) == 1 and len(block[0]) == 1 and any(
+                selection.rowCount() * selection.columnCount() > 1 for selection in ranges):
+            for selection in ranges:
+                for row in self.visible_rows(table, selection.topRow(), selection.bottomRow()):
+                    cells.extend((row, col, block[0][0])
+                                 for col in range(selection.leftColumn(), selection.rightColumn() + 1))
+        else:
+            target_rows = self.visible_rows(table, anchor_row, table.rowCount() - 1)[:len(block)]
+            for row, values in zip(target_rows, block):
+                cells.extend((row, col, value)
+                             for col, value in enumerate(values, start=anchor_col) if col < table.columnCount())
+
+            skipped = sum(len(values) for values in block) - len(cells)
+            if skipped:
+                print(f"⚠️ {skipped} pasted cell(s) fall outside the table and were ignored.")
+
+        self.apply_cell_changes(category_name, table, cells)
+
+    def fill_down(self, category_name, table):
+        """Copies the first visible row of every selected range into the rows below it (Ctrl+D)."""
+        cells = []
+        for selection in table.selectedRanges():
+            rows = self.visible_rows(table, selection.topRow(), selection.bottomRow())
+            if not rows:
+                continue
+            if len(rows) == 1:
+                # ✅ Ca în Excel: o selecție de un singur rând se completează din rândul vizibil de deasupra
+                above = self.visible_rows(table, 0, rows[0] - 1)
+                if not above:
+                    continue
+                rows = [above[-1]] + rows
+
+            for col in range(selection.leftColumn(), selection.rightColumn() + 1):
+                source = table.item(rows[0], col)
+                value = source.text() if source else ""
+                cells.extend((row, col, value) for row in rows[1:])
+
+        if cells:
+            self.apply_cell_changes(category_name, table, cells)
+
     def import_from_xlsx(self):
         """Importă parametrii dintr-un fișier XLSX și creează o categorie cu numele fișierului."""
-        from PyQt5.QtWidgets import QFileDialog
-        import pandas as pd
-        import os
-
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Excel File", "", "Excel Files (*.xlsx);;All Files (*)")
 
         if not file_path:
             return  # Dacă utilizatorul nu a selectat un fișier, ieșim din funcție
 
-        try:
-            df = pd.read_excel(file_path)
+        # Citirea fișierului Excel rulează în fundal; rezultatul este aplicat în `apply_imported_parameters`
+        io_executor().submit_read(
+            file_path, lambda: self.read_parameters_xlsx(file_path),
+            lambda parameters: self.apply_imported_parameters(file_path, parameters),
+            on_error=lambda e: QMessageBox.critical(self, "Import Failed", f"An error occurred during import:\n{str(e)}"),
+            description=f"Importing {os.path.basename(file_path)}")
+
+    @staticmethod
+    def read_parameters_xlsx(file_path):
+        """
+        Citește un XLSX de parametri (rulează în thread-ul de I/O).
+
+        Returnează None dacă fișierul este gol, altfel dicționarul {parametru: {variantă: valoare}}.
+        """
+        import pandas as pd  # ✅ Import întârziat - pandas este încărcat doar la import/export
+
+        df = pd.read_excel(file_path)
+
+        if df.empty:
+            return None
 
-            if df.empty:
+        # Prima coloană trebuie să fie "Parameter Name"
+        if "Parameter Name" not in df.columns:
+            raise ValueError("The Excel file must have a 'Parameter Name' column!")
+
+        # Adăugăm parametrii și variantele din Excel în dicționarul intern
+        parameters = {}
+        for index, row in df.iterrows():
+            param_name = str(row["Parameter Name"]).strip()
+
+            if not param_name:
+                continue  # Sărim peste rândurile goale
+
+            parameters[param_name] = {}
+
+            for variant in df.columns[1:]:  # Ignorăm prima coloană (numele parametrului)
+                value = str(row[variant]).strip() if pd.notna(row[variant]) else ""
+                parameters[param_name][variant] = value
+
+        return parameters
+
+    def apply_imported_parameters(self, file_path, parameters):
+        """Adaugă în date și în UI parametrii citiți de `read_parameters_xlsx`."""
+        try:
+            if parameters is None:
                 QMessageBox.warning(self, "Warning", "The selected Excel file is empty!")
                 return
 
@@ -596,29 +1010,11 @@ class ParametersPage(QWidget):
                 QMessageBox.warning(self, "Warning",
                                     f"A category named '{category_name}' already exists! Overwriting data.")
 
-            self.parameters_data[category_name] = {}
-
-            # Prima coloană trebuie să fie "Parameter Name"
-            if "Parameter Name" not in df.columns:
-                QMessageBox.critical(self, "Error", "The Excel file must have a 'Parameter Name' column!")
-                return
-
-            # Adăugăm parametrii și variantele din Excel în dicționarul intern
-            for index, row in df.iterrows():
-                param_name = str(row["Parameter Name"]).strip()
-
-                if not param_name:
-                    continue  # Sărim peste rândurile goale
-
-                self.parameters_data[category_name][param_name] = {}
-
-                for variant in df.columns[1:]:  # Ignorăm prima coloană (numele parametrului)
-                    value = str(row[variant]).strip() if pd.notna(row[variant]) else ""
-                    self.parameters_data[category_name][param_name][variant] = value
+            self.parameters_data[category_name] = ParameterTable(parameters)
 
             # 🔹 DEBUGGING: Afișăm datele înainte de salvare
             print(f"📁 Imported category: {category_name}")
-            print(json.dumps(self.parameters_data[category_name], indent=4))
+            print(json.dumps(self.parameters_data[category_name].to_dict(), indent=4))
             # 🔹 Salvăm categoria în parameters.json
             self.save_parameters()
 
@@ -629,10 +1025,14 @@ class ParametersPage(QWidget):
             QMessageBox.critical(self, "Import Failed", f"An error occurred during import:\n{str(e)}")
 
     def reload_ui(self):
-        """Reloads all parameter tables from JSON to reflect recent changes."""
+        """Reloads all parameter tables from JSON (read in the background) to reflect recent changes."""
+        io_executor().submit_read(self.json_file, self.shared_file.read, self.rebuild_tabs,
+                                  on_error=lambda e: print(f"❌ ERROR reloading UI: {e}"))
+
+    def rebuild_tabs(self, parameters_data):
+        """Rebuilds every category tab from `parameters_data`."""
         try:
-            with open(self.json_file, "r", encoding="utf-8") as file:
-                self.parameters_data = json.load(file)
+            self.parameters_data = {category: ParameterTable(params) for category, params in parameters_data.items()}
 
             # ✅ Clear existing tabs
             while self.tab_widget.count():
@@ -647,6 +1047,66 @@ class ParametersPage(QWidget):
         except Exception as e:
             print(f"❌ ERROR reloading UI: {e}")
 
+    def get_value_index(self):
+        """Indexul valorilor canonice; reconstruit doar după modificări."""
+        if self.value_index is None:
+            self.value_index = ValueIndex(self.parameters_data)
+        return self.value_index
+
+    def find_by_value(self):
+        """Caută toți parametrii (din toate categoriile și variantele) care au o valoare echivalentă."""
+        value, ok = QInputDialog.getText(self, "Find by Value", "Enter value (e.g. [0x50,0x01]):")
+        if not ok or not value.strip():
+            return
+
+        matches = self.get_value_index().find(value)
+        if not matches:
+            QMessageBox.information(self, "Find by Value", f"No parameter has the value '{value}'.")
+            return
+
+        rows = [(f"{category} / {param_name} [{variant}] = {raw_value}", (category, param_name))
+                for category, param_name, variant, raw_value in matches]
+        self.show_parameter_list("Find by Value", f"{len(matches)} value(s) equivalent to '{value}':", rows)
+
+    def show_duplicate_values(self):
+        """Raport cu parametrii care au același payload în toate variantele."""
+        groups = self.get_value_index().duplicates()
+        if not groups:
+            QMessageBox.information(self, "Duplicate Values", "No duplicate parameters found.")
+            return
+
+        rows = []
+        for signature, parameters in groups:
+            rows.append((", ".join(f"{variant} = {format_canonical(key)}" for variant, key in signature), None))
+            rows.extend((f"    {category} / {param_name}", (category, param_name)) for category, param_name in parameters)
+
+        self.show_parameter_list("Duplicate Values",
+                                 f"{len(groups)} group(s) of parameters share the same payload:", rows)
+
+    def show_parameter_list(self, title, summary, rows):
+        dialog = ParameterListDialog(title, summary, rows)
+        if dialog.exec_() and dialog.selected_parameter:
+            self.show_parameter(*dialog.selected_parameter)
+
+    def show_parameter(self, category_name, param_name):
+        """Deschide tab-ul categoriei și selectează rândul parametrului."""
+        table = self.category_tables.get(category_name)
+        if table is None:
+            return
+
+        for index in range(self.tab_widget.count()):
+            if self.tab_widget.tabText(index) == category_name:
+                self.tab_widget.setCurrentIndex(index)
+                break
+
+        for row in range(table.rowCount()):
+            item = table.item(row, 0)
+            if item and item.text() == param_name:
+                table.setRowHidden(row, False)
+                table.selectRow(row)
+                table.scrollToItem(item)
+                break
+
     def filter_parameters(self, text, table):
         """Filters parameters based on search input."""
         text = text.strip().lower()  # Convert search text to lowercase
@@ -1,19 +1,39 @@
 import copy
+import html
 import json
 import os
 import sys
 import traceback
+import uuid
+from collections import ChainMap
 
-import pandas as pd
 from PyQt5.QtWidgets import (
 	QWidget, QVBoxLayout, QPushButton, QTableWidget, QTableWidgetItem,
 	QHBoxLayout, QLabel, QLineEdit, QHeaderView, QFrame, QInputDialog, QFileDialog, QMessageBox,
-	QDialog, QListWidget, QTextEdit, QToolButton, QStyle, QTabWidget, QMenu, QAction, QListWidgetItem
+	QDialog, QListWidget, QTextEdit, QToolButton, QStyle, QTabWidget, QMenu, QAction, QListWidgetItem,
+	QProgressBar, QSplitter, QTreeWidget, QTreeWidgetItem, QComboBox, QAbstractItemView, QApplication,
+	QTableWidgetSelectionRange, QShortcut
+)
+from PyQt5.QtGui import QFont, QColor, QDrag, QKeySequence
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QEvent, QItemSelectionModel, QMimeData
+
+from utils.command_palette import PaletteIndex, entry_label
+from utils.file_watcher import DataFileWatcher
+from utils.html_report import write_report
+from utils.io_executor import io_executor
+from utils.json_io import JsonObjectStream, SharedJsonFile, copy_json_data, read_json, report_save
+from utils.preconditions import PreconditionExpander, called_tests
+from utils.spec_merge import describe_key, diff_entries
+from utils.suites import ROOT, SuiteTree, folder_name, parent_path
+from utils.test_generator import MODES, combinations, generate_tests, open_categories
+from utils.validation import ValidationEngine, full_scan
+from utils.variant_expansion import write_variant_specs
+from utils.templates import compile_command, compile_template, highlight_template
+from utils.test_steps import (
+	STEPS_MIME_TYPE, StepIndex, changed_fields, command_step, compute_description_tcg, compute_test_data_description,
+	decode_steps, delete_step, derive_test, encode_steps, insert_step, insert_steps, migrate_test, move_steps,
+	rename_parameter_in_test, steps_as_text, steps_from_text
 )
-from PyQt5.QtGui import QFont, QColor
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, PatternFill, Font
 
 
 # ----------------- Dialog Classes -----------------
@@ -83,6 +103,8 @@ class PreviewTestStepDialog(QDialog):
         self.setWindowTitle("Preview Test Step")
         self.setGeometry(400, 300, 600, 500)
         self.selected_parameters = {}
+        self.action_template = compile_template(command_action)
+        self.expected_template = compile_template(command_expected)
 
         layout = QVBoxLayout()
 
@@ -130,7 +152,7 @@ class PreviewTestStepDialog(QDialog):
 
         # 🔹 Confirm Button
         self.confirm_button = QPushButton("Apply Parameters")
-        self.confirm_button.setEnabled(False)
+        self.confirm_button.setEnabled(not self.parameter_lists)  # ✅ Comenzile fără placeholder-e nu cer parametri
         self.confirm_button.clicked.connect(self.accept)
         layout.addWidget(self.confirm_button)
 
@@ -138,12 +160,7 @@ class PreviewTestStepDialog(QDialog):
 
     def highlight_placeholders(self, text):
         """Evidențiază placeholder-urile în text."""
-        highlighted_text = text
-        for placeholder in set(part.strip("{}") for part in text.split() if "{" in part):
-            highlighted_text = highlighted_text.replace(
-                f"{{{placeholder}}}", f"<span style='background-color: yellow; font-weight: bold;'>{'{'+placeholder+'}'}</span>"
-            )
-        return f"<html><body>{highlighted_text}</body></html>"
+        return highlight_template(compile_template(text))
 
     def select_parameter(self, category, value):
         """Salvează parametrul selectat și actualizează vizual textul fără a închide dialogul imediat."""
@@ -152,8 +169,8 @@ class PreviewTestStepDialog(QDialog):
 
     def update_text_display(self, category, value):
         """Actualizează vizual Action și Expected Result cu parametrii selectați."""
-        self.action_text.setHtml(self.action_text.toHtml().replace(f"{{{category}}}", value))
-        self.expected_text.setHtml(self.expected_text.toHtml().replace(f"{{{category}}}", value))
+        self.action_text.setHtml(highlight_template(self.action_template, self.selected_parameters))
+        self.expected_text.setHtml(highlight_template(self.expected_template, self.selected_parameters))
 
         if len(self.selected_parameters) == len(self.parameter_lists):
             self.confirm_button.setEnabled(True)
@@ -167,17 +184,188 @@ class PreviewTestStepDialog(QDialog):
                 item.setHidden(search_text.lower() not in item.text().lower())
 
 
+class UpdateTestsPreviewDialog(QDialog):
+    """Previzualizare pentru actualizările în bloc: testele afectate și câmpurile care se schimbă."""
+
+    def __init__(self, title, summary, changes):
+        super().__init__()
+        self.setWindowTitle(title)
+        self.setGeometry(400, 300, 700, 500)
+        self.changes = changes
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(summary))
+
+        # 🔹 Lista testelor afectate; detaliile testului selectat sunt afișate dedesubt
+        self.test_list = QListWidget()
+        self.test_list.addItems(list(changes.keys()))
+        self.test_list.currentTextChanged.connect(self.show_details)
+        layout.addWidget(self.test_list)
+
+        self.details = QTextEdit()
+        self.details.setReadOnly(True)
+        layout.addWidget(self.details)
+
+        button_layout = QHBoxLayout()
+        apply_button = QPushButton("Apply to All")
+        apply_button.clicked.connect(self.accept)
+        button_layout.addWidget(apply_button)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        if changes:
+            self.test_list.setCurrentRow(0)
+
+    def show_details(self, test_name):
+        """Afișează valorile vechi (-) și noi (+) pentru câmpurile modificate ale testului."""
+        lines = []
+        for field, old_value, new_value in self.changes.get(test_name, []):
+            lines.append(f"{field}:")
+            lines.extend(f"- {line}" for line in old_value if line not in new_value)
+            lines.extend(f"+ {line}" for line in new_value if line not in old_value)
+            lines.append("")
+        self.details.setPlainText("\n".join(lines))
+
+
+class GenerateTestsDialog(QDialog):
+    """Alegerea parametrilor pentru fiecare categorie deschisă a unui test template și a modului de combinare."""
+
+    def __init__(self, template_name, categories, parameters_data):
+        super().__init__()
+        self.setWindowTitle(f"Generate Tests from '{template_name}'")
+        self.setGeometry(400, 300, 700, 500)
+        self.categories = categories
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Select the parameters to use for every open category:"))
+
+        # 🔹 O listă cu selecție multiplă pentru fiecare categorie
+        lists_layout = QHBoxLayout()
+        self.parameter_lists = {}
+        for category in categories:
+            column = QVBoxLayout()
+            column.addWidget(QLabel(f"{{{category}}}"))
+            parameter_list = QListWidget()
+            parameter_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+            parameter_list.addItems(list(parameters_data.get(category, {})))
+            parameter_list.itemSelectionChanged.connect(self.update_count)
+            column.addWidget(parameter_list)
+            lists_layout.addLayout(column)
+            self.parameter_lists[category] = parameter_list
+        layout.addLayout(lists_layout)
+
+        self.mode_box = QComboBox()
+        self.mode_box.addItems(MODES)
+        self.mode_box.currentIndexChanged.connect(self.update_count)
+        layout.addWidget(self.mode_box)
+
+        layout.addWidget(QLabel("Test name pattern:"))
+        self.name_input = QLineEdit(template_name + "".join(f"_{{{category}}}" for category in categories))
+        layout.addWidget(self.name_input)
+
+        self.count_label = QLabel()
+        layout.addWidget(self.count_label)
+
+        button_layout = QHBoxLayout()
+        self.generate_button = QPushButton("Generate")
+        self.generate_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.generate_button)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        self.update_count()
+
+    @property
+    def selections(self):
+        """{category: [parameter names]} in list order."""
+        return {category: [parameter_list.item(row).text() for row in range(parameter_list.count())
+                           if parameter_list.item(row).isSelected()]
+                for category, parameter_list in self.parameter_lists.items()}
+
+    @property
+    def mode(self):
+        return self.mode_box.currentText()
+
+    @property
+    def name_pattern(self):
+        return self.name_input.text().strip()
+
+    def update_count(self):
+        count = len(combinations(self.selections, self.mode))
+        self.count_label.setText(f"{count} test(s) will be generated.")
+        self.generate_button.setEnabled(count > 0)
+
+
+class StepListTable(QTableWidget):
+    """Lista de step-uri a unui test: selecție pe interval, drag & drop și Ctrl+C / Ctrl+V."""
+
+    def __init__(self, step_table):
+        super().__init__()
+        self.step_table = step_table
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setDropIndicatorShown(True)
+        self.setDragDropMode(QAbstractItemView.DragDrop)
+
+    def mimeTypes(self):
+        return [STEPS_MIME_TYPE, "text/plain"]  # ✅ Step-uri din orice instanță sau text tab-separat
+
+    def startDrag(self, supported_actions):
+        """Drag-ul conține step-urile selectate în formatul clipboard-ului (`STEPS_MIME_TYPE`)."""
+        indices = self.step_table.selected_steps()
+        if not indices or self.step_table.mime_data_for is None:
+            return
+        drag = QDrag(self)
+        drag.setMimeData(self.step_table.mime_data_for(self.step_table, indices))
+        drag.exec_(Qt.CopyAction | Qt.MoveAction, Qt.MoveAction)
+
+    def drop_target(self, position):
+        """Indexul înaintea căruia se inserează step-urile lăsate la `position`."""
+        row = self.rowAt(position.y())
+        if row == -1:
+            return self.rowCount()
+        return row + 1 if position.y() > self.visualRect(self.model().index(row, 0)).center().y() else row
+
+    def dropEvent(self, event):
+        # ✅ Rândurile nu sunt mutate de Qt; pagina aplică modificarea pe test și reconstruiește tabelul
+        mime = event.mimeData()
+        if not (mime.hasFormat(STEPS_MIME_TYPE) or mime.hasText()):
+            event.ignore()
+            return
+        event.setDropAction(Qt.CopyAction)
+        event.accept()
+        self.step_table.steps_dropped.emit(self.step_table, mime, self.drop_target(event.pos()))
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Copy):
+            self.step_table.copy_requested.emit(self.step_table)
+        elif event.matches(QKeySequence.Paste):
+            self.step_table.paste_requested.emit(self.step_table)
+        else:
+            super().keyPressEvent(event)
+
+
 class TestStepTable(QWidget):
     step_selected = pyqtSignal(int)  # 🔹 Semnal pentru selecția unui step
+    steps_dropped = pyqtSignal(object, object, int)  # 🔹 (tabel, QMimeData, indexul unde se inserează)
+    copy_requested = pyqtSignal(object)  # 🔹 Ctrl+C pe step-urile selectate
+    paste_requested = pyqtSignal(object)  # 🔹 Ctrl+V înaintea step-ului curent
 
     def __init__(self, steps, parent_table, row_index, linked_table=None):
         super().__init__()
         self.parent_table = parent_table  # Referință la tabelul principal
         self.row_index = row_index  # Rândul testului părinte
         self.linked_table = linked_table  # Referință la tabelul pereche (Expected <-> Action)
+        self.mime_data_for = None  # 🔹 Callable(tabel, indecși) -> QMimeData, setat de pagină pentru drag
 
         layout = QVBoxLayout()
-        self.table = QTableWidget()
+        self.table = StepListTable(self)
         self.table.setColumnCount(1)
         self.table.setRowCount(len(steps))
         self.table.horizontalHeader().setVisible(False)
@@ -186,11 +374,11 @@ class TestStepTable(QWidget):
         self.table.horizontalHeader().setStretchLastSection(True)
 
         self.table.setSelectionBehavior(QTableWidget.SelectRows)  # ✅ Forțăm selecția rândului
-        self.table.setSelectionMode(QTableWidget.SingleSelection)  # ✅ Doar o singură selecție
+        self.table.setSelectionMode(QTableWidget.ContiguousSelection)  # ✅ Un interval de step-uri (Shift+click)
 
         for i, step in enumerate(steps):
             item = QTableWidgetItem(step)
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled)
             self.table.setItem(i, 0, item)
 
         # 🔹 Conectăm selecția la metoda `sync_selection`
@@ -199,6 +387,16 @@ class TestStepTable(QWidget):
         layout.addWidget(self.table)
         self.setLayout(layout)
 
+    def selected_steps(self):
+        """Indecșii step-urilor selectate, în ordine."""
+        return sorted(index.row() for index in self.table.selectionModel().selectedRows())
+
+    def select_steps(self, first, count):
+        self.table.clearSelection()
+        if count:
+            self.table.setRangeSelected(QTableWidgetSelectionRange(first, 0, first + count - 1, 0), True)
+            self.table.setCurrentCell(first, 0, QItemSelectionModel.NoUpdate)
+
     def sync_selection(self):
         """Selectează automat testul părinte în tabelul principal când un step este selectat."""
         selected_row = self.table.currentRow()
@@ -212,22 +410,411 @@ class TestStepTable(QWidget):
             if self.linked_table:
                 self.linked_table.table.selectRow(selected_row)
 
+class SuiteTreePanel(QWidget):
+    """Arborele cu suitele de teste; copiii unui folder sunt creați abia când folderul este expandat."""
+    folder_selected = pyqtSignal(object)  # 🔹 Calea folderului selectat (None = All Tests)
+    test_activated = pyqtSignal(str)  # 🔹 Dublu click pe un test din arbore
+    suites_changed = pyqtSignal(list)  # 🔹 Folderele modificate (pentru salvare și refiltrare)
+
+    PATH_ROLE = Qt.UserRole
+    TEST_ROLE = Qt.UserRole + 1
+    LOADED_ROLE = Qt.UserRole + 2
+
+    def __init__(self, suites):
+        super().__init__()
+        self.suites = suites
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(QLabel("Test Suites"))
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderHidden(True)
+        self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tree.customContextMenuRequested.connect(self.show_context_menu)
+        self.tree.itemExpanded.connect(self.populate_item)
+        self.tree.currentItemChanged.connect(self.select_item)
+        self.tree.itemDoubleClicked.connect(self.activate_item)
+        layout.addWidget(self.tree)
+
+        new_folder_button = QPushButton("📁 New Folder")
+        new_folder_button.clicked.connect(lambda: self.new_folder(self.selected_folder() or ROOT))
+        layout.addWidget(new_folder_button)
+
+        self.setLayout(layout)
+        self.rebuild()
+
+    def rebuild(self, suites=None):
+        """Reconstruiește doar nivelul de sus al arborelui."""
+        if suites is not None:
+            self.suites = suites
+
+        self.tree.clear()
+        all_tests_item = QTreeWidgetItem(["📚 All Tests"])
+        all_tests_item.setData(0, self.PATH_ROLE, None)
+        self.tree.addTopLevelItem(all_tests_item)
+        self.tree.addTopLevelItems([self.create_folder_item(path) for path in self.suites.child_folders(ROOT)])
+        self.tree.setCurrentItem(all_tests_item)
+
+    def create_folder_item(self, path):
+        item = QTreeWidgetItem([f"📁 {folder_name(path)}"])
+        item.setData(0, self.PATH_ROLE, path)
+        item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ShowIndicator if self.suites.has_children(path)
+            else QTreeWidgetItem.DontShowIndicatorWhenChildless)
+        return item
+
+    def populate_item(self, item):
+        """Creează copiii unui folder la prima expandare."""
+        path = item.data(0, self.PATH_ROLE)
+        if path is None or item.data(0, self.TEST_ROLE) or item.data(0, self.LOADED_ROLE) or path not in self.suites:
+            return
+
+        item.setData(0, self.LOADED_ROLE, True)
+        children = [self.create_folder_item(child) for child in self.suites.child_folders(path)]
+        for test_name in self.suites.tests(path):
+            test_item = QTreeWidgetItem([f"🧪 {test_name}"])
+            test_item.setData(0, self.PATH_ROLE, path)
+            test_item.setData(0, self.TEST_ROLE, test_name)
+            children.append(test_item)
+        item.addChildren(children)
+
+    def find_item(self, path):
+        """Item-ul unui folder deja afișat (None dacă un nod părinte nu a fost încă expandat)."""
+        items = [self.tree.topLevelItem(i) for i in range(self.tree.topLevelItemCount())]
+        for depth in range(1, path.count("/") + 2):
+            prefix = "/".join(path.split("/")[:depth])
+            item = next((item for item in items if item.data(0, self.PATH_ROLE) == prefix
+                         and not item.data(0, self.TEST_ROLE)), None)
+            if item is None:
+                return None
+            items = [item.child(i) for i in range(item.childCount())]
+        return item
+
+    def refresh(self, path):
+        """Re-creează copiii unui folder afișat, după o modificare."""
+        if path == ROOT:
+            current = self.selected_folder()
+            self.tree.blockSignals(True)
+            for index in reversed(range(1, self.tree.topLevelItemCount())):
+                self.tree.takeTopLevelItem(index)
+            self.tree.addTopLevelItems([self.create_folder_item(child) for child in self.suites.child_folders(ROOT)])
+            self.tree.blockSignals(False)
+            self.select_folder(current if current in self.suites else None)
+            self.select_item(self.tree.currentItem())  # ✅ Folderul selectat poate fi dispărut cu semnalele blocate
+            return
+
+        item = self.find_item(path)
+        if item is None or path not in self.suites:
+            return
+        item.takeChildren()
+        item.setData(0, self.LOADED_ROLE, False)
+        item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ShowIndicator if self.suites.has_children(path)
+            else QTreeWidgetItem.DontShowIndicatorWhenChildless)
+        if item.isExpanded():
+            self.populate_item(item)
+
+    def selected_folder(self):
+        item = self.tree.currentItem()
+        return item.data(0, self.PATH_ROLE) if item else None
+
+    def select_folder(self, path):
+        """Selectează (expandând părinții) folderul `path`; None = All Tests."""
+        if path is None:
+            self.tree.setCurrentItem(self.tree.topLevelItem(0))
+            return
+        parts = path.split("/")
+        for depth in range(1, len(parts)):
+            parent = self.find_item("/".join(parts[:depth]))
+            if parent:
+                parent.setExpanded(True)
+        item = self.find_item(path)
+        if item:
+            self.tree.setCurrentItem(item)
+
+    def select_item(self, item, _previous=None):
+        if item is not None:
+            self.folder_selected.emit(item.data(0, self.PATH_ROLE))
+
+    def activate_item(self, item, _column=0):
+        test_name = item.data(0, self.TEST_ROLE)
+        if test_name:
+            self.test_activated.emit(test_name)
+
+    def show_context_menu(self, position):
+        item = self.tree.itemAt(position)
+        path = item.data(0, self.PATH_ROLE) if item else ROOT
+        test_name = item.data(0, self.TEST_ROLE) if item else None
+
+        menu = QMenu(self)
+        if test_name:
+            remove_action = QAction("Remove from Suite", self)
+            remove_action.triggered.connect(lambda: self.remove_test(test_name, path))
+            menu.addAction(remove_action)
+        else:
+            new_action = QAction("📁 New Folder", self)
+            new_action.triggered.connect(lambda: self.new_folder(path or ROOT))
+            menu.addAction(new_action)
+            if path:
+                rename_action = QAction("✏️ Rename Folder", self)
+                rename_action.triggered.connect(lambda: self.rename_folder(path))
+                menu.addAction(rename_action)
+                delete_action = QAction("🗑 Delete Folder", self)
+                delete_action.triggered.connect(lambda: self.delete_folder(path))
+                menu.addAction(delete_action)
+
+        menu.exec_(self.tree.viewport().mapToGlobal(position))
+
+    def new_folder(self, parent):
+        name, ok = QInputDialog.getText(self, "New Folder", "Enter folder name:")
+        if not ok or not name.strip():
+            return
+        try:
+            path = self.suites.add_folder(parent, name)
+        except (KeyError, ValueError) as e:
+            QMessageBox.warning(self, "Invalid Folder", str(e).strip("'\""))
+            return
+
+        self.refresh(parent)
+        self.suites_changed.emit([parent])
+        self.select_folder(path)
+
+    def rename_folder(self, path):
+        new_name, ok = QInputDialog.getText(self, "Rename Folder", "Enter new folder name:", QLineEdit.Normal,
+                                            folder_name(path))
+        if not ok or not new_name.strip() or new_name.strip() == folder_name(path):
+            return
+        try:
+            new_path = self.suites.rename_folder(path, new_name)
+        except (KeyError, ValueError) as e:
+            QMessageBox.warning(self, "Invalid Folder", str(e).strip("'\""))
+            return
+
+        self.refresh(parent_path(path))
+        self.suites_changed.emit([new_path])
+        self.select_folder(new_path)
+
+    def delete_folder(self, path):
+        reply = QMessageBox.question(
+            self, "Delete Folder",
+            f"Delete folder '{path}' and its subfolders? The tests themselves are kept.",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+
+        self.suites.remove_folder(path)
+        self.refresh(parent_path(path))
+        self.suites_changed.emit([parent_path(path)])
+
+    def remove_test(self, test_name, path):
+        self.suites.remove_test(test_name)
+        self.refresh(path)
+        self.suites_changed.emit([path])
+
+
+class CommandPaletteDialog(QDialog):
+    """Paleta de comenzi: un step complet (comandă + parametri) scris pe o singură linie, cu căutare fuzzy."""
+
+    def __init__(self, palette_index, commands_data, target):
+        super().__init__()
+        self.setWindowTitle("Quick Step")
+        self.setGeometry(400, 300, 600, 450)
+        self.palette_index = palette_index
+        self.commands_data = commands_data
+        self.line = None
+        self.step = None
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(f"Add a step to {target}. Type the command and its parameters; "
+                                f"Tab completes, Enter inserts the step."))
+
+        self.input = QLineEdit()
+        self.input.setPlaceholderText("e.g. sendreq reqdef resdef2")
+        self.input.textChanged.connect(self.update_candidates)
+        self.input.installEventFilter(self)  # ✅ Tab / Enter / săgețile sunt tratate de paletă, nu de dialog
+        layout.addWidget(self.input)
+
+        self.candidate_list = QListWidget()
+        self.candidate_list.itemDoubleClicked.connect(lambda item: self.complete_token())
+        layout.addWidget(self.candidate_list)
+
+        self.preview = QTextEdit()
+        self.preview.setReadOnly(True)
+        layout.addWidget(self.preview)
+
+        self.setLayout(layout)
+        self.update_candidates("")
+
+    def eventFilter(self, watched, event):
+        if watched is self.input and event.type() == QEvent.KeyPress:
+            key = event.key()
+            if key in (Qt.Key_Up, Qt.Key_Down):
+                step = -1 if key == Qt.Key_Up else 1
+                row = self.candidate_list.currentRow() + step
+                if 0 <= row < self.candidate_list.count():
+                    self.candidate_list.setCurrentRow(row)
+                return True
+            if key == Qt.Key_Tab:
+                self.complete_token()
+                return True
+            if key in (Qt.Key_Return, Qt.Key_Enter):
+                self.accept_line()
+                return True
+        return super().eventFilter(watched, event)
+
+    def update_candidates(self, text):
+        """Re-evaluează linia la fiecare tastă: comanda și parametrii aleși, candidații pentru token-ul curent."""
+        index = self.palette_index
+        self.line = index.parse_line(text)
+
+        self.candidate_list.setUpdatesEnabled(False)
+        self.candidate_list.clear()
+        self.candidate_list.addItems([entry_label(index.entries[number]) for number in self.line.candidates])
+        if self.line.candidates:
+            self.candidate_list.setCurrentRow(0)
+        self.candidate_list.setUpdatesEnabled(True)
+        self.show_preview(self.line)
+
+    def show_preview(self, line):
+        if line.unmatched is not None:
+            self.preview.setHtml(f"❌ Nothing matches <b>{html.escape(line.unmatched)}</b>.")
+            return
+        if line.command is None:
+            self.preview.setHtml("Choose a command (or one of its parameters first).")
+            return
+
+        command = self.commands_data[line.command]
+        parts = [f"<b>{html.escape(line.command)}</b><br>",
+                 f"<b>Action:</b> {highlight_template(compile_template(command['Action']), line.bindings)}<br>",
+                 f"<b>Expected:</b> {highlight_template(compile_template(command['Expected Result']), line.bindings)}"]
+        missing = self.palette_index.missing_categories(line)
+        if missing:
+            parts.append(f"<br>Missing: {html.escape(', '.join(f'{{{category}}}' for category in missing))}")
+        self.preview.setHtml("".join(parts))
+
+    def complete_token(self):
+        """Înlocuiește token-ul curent cu candidatul selectat."""
+        row = self.candidate_list.currentRow()
+        if row < 0 or not self.line or row >= len(self.line.candidates):
+            return False
+        name = self.palette_index.entries[self.line.candidates[row]].name
+        text = self.input.text()
+        self.input.setText(text[:len(text) - len(self.line.token)] + name + " ")
+        return True
+
+    def accept_line(self):
+        if self.line and self.line.token:
+            self.complete_token()
+        line = self.palette_index.parse_line(self.input.text())
+        step = self.palette_index.step(line)
+        if step is None:
+            self.show_preview(line)
+            return
+        self.palette_index.record_use(line)
+        self.step = step
+        self.accept()
+
+
+class ProblemsPanel(QWidget):
+    """Lista live a referințelor invalide (teste și comenzi); actualizată doar pentru entitățile modificate."""
+    test_activated = pyqtSignal(str)  # 🔹 Dublu click pe problema unui test
+
+    KEY_ROLE = Qt.UserRole
+
+    def __init__(self):
+        super().__init__()
+        self.items = {}  # ("test" | "command", nume) -> elementul din arbore
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.title = QLabel()
+        layout.addWidget(self.title)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderHidden(True)
+        self.tree.setMaximumHeight(160)
+        self.tree.itemDoubleClicked.connect(self.activate_item)
+        layout.addWidget(self.tree)
+        self.setLayout(layout)
+        self.update_title()
+
+    def update_problems(self, changes):
+        """Applies {key: messages} from the validation engine (empty messages = the entity is valid again)."""
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for key, messages in changes.items():
+                item = self.items.pop(key, None)
+                if item is not None:
+                    self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+                if not messages:
+                    continue
+
+                kind, name = key
+                item = QTreeWidgetItem([f"{'🧪' if kind == 'test' else '⚙️'} {name} ({len(messages)})"])
+                item.setData(0, self.KEY_ROLE, key)
+                for message in messages:
+                    child = QTreeWidgetItem([message])
+                    child.setData(0, self.KEY_ROLE, key)
+                    item.addChild(child)
+                self.tree.addTopLevelItem(item)
+                self.items[key] = item
+        finally:
+            self.tree.setUpdatesEnabled(True)
+        self.update_title()
+
+    def update_title(self):
+        count = sum(item.childCount() for item in self.items.values())
+        self.title.setText(f"⚠️ Problems ({count})" if count else "✅ No broken references")
+
+    def activate_item(self, item):
+        kind, name = item.data(0, self.KEY_ROLE)
+        if kind == "test":
+            self.test_activated.emit(name)
+        else:
+            print(f"⚠️ Command '{name}' uses placeholders without a parameter category (see Generic Commands).")
+
+
 # ----------------- Main TestsPage Class -----------------
 class TestsPage(QWidget):
+	tests_loaded = pyqtSignal()  # 🔹 Emis după ce toate testele au fost încărcate în UI
+
+	LOAD_CHUNK_SIZE = 50  # 🔹 Numărul de teste adăugate în UI la fiecare iterație a event loop-ului
+
 	def __init__(self):
 		super().__init__()
-		self.copied_step = None
-		self.copied_expected = None
+		self.instance_id = uuid.uuid4().hex  # 🔹 Identifică sursa step-urilor trase / copiate (mutare vs. copiere)
+		self.initial_load_done = False
+		self.save_pending = False
+		self.save_scheduled = False
+		self.step_index = StepIndex()  # 🔹 Comandă / parametru -> testele care le folosesc
+		self.preconditions = PreconditionExpander()  # 🔹 Expansiunea memoizată a precondițiilor `call <test>`
+		self.pending_updates = []  # 🔹 Actualizări în bloc cerute în timpul încărcării testelor
+		self.pending_external_paths = set()  # 🔹 Fișiere modificate pe disc în timpul încărcării
+		self.suites = SuiteTree()  # 🔹 Folderele de teste (suites.json), independente de tests.json
+		self.current_folder = None  # 🔹 Folderul selectat în arbore (None = toate testele)
+		self.hidden_tests = set()  # 🔹 Testele ascunse de filtru (căutare / folder)
+		self.test_rows = {}  # 🔹 Nume test -> rând în tabel (reconstruit când rândurile se mută)
+		self.validation = ValidationEngine(self.step_index)  # 🔹 Referințe invalide, verificate incremental
+		self.validation_scanning = False
+		self.palette_index = None  # 🔹 Indexul paletei de comenzi, construit la prima deschidere
+		self.palette_sources = None  # 🔹 (commands_data, parameters_data) din care a fost construit
+		self.palette_recent = []  # 🔹 Comenzile / parametrii folosiți recent (primii în paletă)
 
 
 		self.json_file = self.get_resource_path("../data/tests.json")
 		self.commands_file = self.get_resource_path("../data/generic_commands.json")
 		self.parameters_file = self.get_resource_path("../data/parameters.json")
+		self.suites_file = self.get_resource_path("../data/suites.json")
+		self.tests_file = SharedJsonFile(self.json_file)  # 🔹 Salvările îmbină modificările altor instanțe
+		self.suites_shared_file = SharedJsonFile(self.suites_file)
 
-		# 🔹 Încărcăm datele necesare
-		self.tests_data = self.load_json(self.json_file)
-		self.commands_data = self.load_json(self.commands_file)
-		self.parameters_data = self.load_json(self.parameters_file)
+		# 🔹 Încărcăm comenzile și parametrii în fundal, apoi testele (progresiv, în `load_tests`);
+		# step-urile în format vechi sunt migrate pe baza comenzilor la încărcare
+		self.tests_data = {}
+		self.commands_data = {}
+		self.parameters_data = {}
+		self.load_commands(lambda: self.load_parameters(self.load_tests))
 
 
 
@@ -252,6 +839,13 @@ class TestsPage(QWidget):
 		self.add_test_button = QPushButton("Add Test")
 		self.add_test_button.clicked.connect(self.add_test)
 		input_layout.addWidget(self.add_test_button)
+
+		# 🔹 Un step scris pe o linie, cu căutare fuzzy în comenzi și parametri (Ctrl+P)
+		self.quick_step_button = QPushButton("⌨ Quick Step")
+		self.quick_step_button.setToolTip("Add a step to the selected test(s) from one line (Ctrl+P)")
+		self.quick_step_button.clicked.connect(self.open_command_palette)
+		input_layout.addWidget(self.quick_step_button)
+		QShortcut(QKeySequence("Ctrl+P"), self, self.open_command_palette)
 		layout.addLayout(input_layout)
 
 		# ✅ Search Bar for Tests
@@ -260,6 +854,7 @@ class TestsPage(QWidget):
 		search_bar.setPlaceholderText("🔍 Search tests...")
 		search_bar.textChanged.connect(lambda text: self.filter_tests(text, self.test_table))  # Connect search function
 		search_layout.addWidget(search_bar)
+		self.search_bar = search_bar
 		layout.addLayout(search_layout)
 
 		# Butoane pentru Import/Export
@@ -272,6 +867,17 @@ class TestsPage(QWidget):
 		self.export_button.clicked.connect(self.export_to_xlsx)
 		button_layout.addWidget(self.export_button)
 
+		# 🔹 Export cu valorile parametrilor rezolvate pentru fiecare variantă (pentru bancurile de test)
+		self.export_variants_button = QPushButton("Export Variant Specs")
+		self.export_variants_button.clicked.connect(self.export_variant_specs)
+		button_layout.addWidget(self.export_variants_button)
+
+		# 🔹 Raport HTML; la reconstruire sunt randate doar testele modificate (cache de fragmente)
+		self.export_html_button = QPushButton("🌐 Export HTML Report")
+		self.export_html_button.clicked.connect(self.export_html_report)
+		button_layout.addWidget(self.export_html_button)
+		self.report_dir = ""
+
 		layout.addLayout(button_layout)
 
 		# 🔹 Tabel pentru afișarea testelor
@@ -291,14 +897,49 @@ class TestsPage(QWidget):
 		self.test_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 		self.test_table.setContextMenuPolicy(Qt.CustomContextMenu)
 		self.test_table.setSelectionBehavior(QTableWidget.SelectRows)
-		self.test_table.setSelectionMode(QTableWidget.SingleSelection)
+		self.test_table.setSelectionMode(QTableWidget.ExtendedSelection)  # ✅ Mai multe teste: step adăugat în bloc
 		self.test_table.customContextMenuRequested.connect(self.show_context_menu)
 		self.test_table.customContextMenuRequested.connect(self.show_test_context_menu)
 		self.test_table.cellChanged.connect(self.save_edited_test)
-		layout.addWidget(self.test_table)
+
+		# 🔹 Arborele de suite în stânga tabelului; filtrează tabelul după folderul selectat
+		self.suite_panel = SuiteTreePanel(self.suites)
+		self.suite_panel.folder_selected.connect(self.select_folder)
+		self.suite_panel.test_activated.connect(self.show_test)
+		self.suite_panel.suites_changed.connect(self.suites_modified)
+
+		splitter = QSplitter(Qt.Horizontal)
+		splitter.addWidget(self.suite_panel)
+		splitter.addWidget(self.test_table)
+		splitter.setStretchFactor(1, 1)
+		splitter.setSizes([200, 800])
+		layout.addWidget(splitter)
+
+		# 🔹 Panoul de probleme: step-uri cu comenzi / parametri inexistenți, placeholder-e fără categorie
+		self.problems_panel = ProblemsPanel()
+		self.problems_panel.test_activated.connect(self.show_test)
+		layout.addWidget(self.problems_panel)
+
+		self.validation_timer = QTimer(self)
+		self.validation_timer.setSingleShot(True)
+		self.validation_timer.setInterval(200)  # ✅ Verificarea rulează după ce modificarea a fost afișată
+		self.validation_timer.timeout.connect(self.run_validation)
+
+		# 🔹 Indicator de progres pentru încărcarea testelor în fundal
+		self.load_progress = QProgressBar()
+		self.load_progress.setRange(0, 100)
+		self.load_progress.setFormat("Loading tests... %p%")
+		self.load_progress.hide()
+		layout.addWidget(self.load_progress)
+
 		self.setLayout(layout)
 
-		self.load_tests()
+		io_executor().submit_read(self.suites_file, self.read_suites, self.apply_suites)
+
+		# 🔹 Fișierele modificate din afara aplicației (alt utilizator, `git pull`) sunt aplicate incremental
+		self.file_watcher = DataFileWatcher(
+			[self.json_file, self.suites_file, self.commands_file, self.parameters_file], self)
+		self.file_watcher.file_changed.connect(self.external_file_changed)
 
 	def add_test(self):
 		"""Adaugă un test nou în tabel și în JSON."""
@@ -316,6 +957,7 @@ class TestsPage(QWidget):
 
 		row_position = self.test_table.rowCount()
 		self.test_table.insertRow(row_position)
+		self.hidden_tests.discard(test_name)  # ✅ Un rând nou este vizibil
 
 		self.test_table.setItem(row_position, 0, QTableWidgetItem(test_name))
 		self.test_table.setItem(row_position, 1, QTableWidgetItem(description))
@@ -327,11 +969,19 @@ class TestsPage(QWidget):
 		self.tests_data[test_name] = {
 			"Description": description,
 			"Precondition": precondition,
-			"Action": "",
-			"Expected Results": "",
-			"Test Data Description": "",
-			"Description TCG": ""
+			"Steps": [],
+			"Action": [],
+			"Expected Results": [],
+			"Test Data Description": [],
+			"Description TCG": []
 		}
+		self.step_index.index_test(test_name, self.tests_data[test_name])
+		self.preconditions.update_test(test_name, self.tests_data[test_name])
+		self.validate_later([test_name])
+
+		if self.current_folder:
+			self.suites.move_tests([test_name], self.current_folder)  # ✅ Testul nou intră în folderul selectat
+			self.suites_modified([self.current_folder])
 
 		self.save_tests()
 		self.test_name_input.clear()
@@ -343,28 +993,39 @@ class TestsPage(QWidget):
 			QMessageBox.warning(self, "No Test Selected", "Please select a test to add a step.")
 			return
 
+		test_names = self.selected_test_names()
+		if len(test_names) > 1:
+			# 🔹 Mai multe teste selectate: același step este inserat în toate, cu o singură salvare
+			self.load_parameters(lambda: self.load_commands(lambda: self.add_step_to_tests(test_names)))
+			return
+
 		test_name = self.test_table.item(selected_row, 0).text().strip()
 		print(f"🔹 Selected test: {test_name}")  # Debugging
 
-		self.load_parameters()
-		self.load_commands()
+		# 🔹 Reîncărcăm parametrii și comenzile în fundal, apoi deschidem dialogurile
+		self.load_parameters(lambda: self.load_commands(lambda: self.select_and_add_test_step(test_name)))
+
+	def selected_test_names(self):
+		"""Testele selectate (rânduri vizibile), în ordinea din tabel."""
+		rows = sorted({index.row() for index in self.test_table.selectionModel().selectedRows()})
+		return [self.test_table.item(row, 0).text().strip() for row in rows
+		        if self.test_table.item(row, 0) and not self.test_table.isRowHidden(row)]
 
+	def choose_command_step(self):
+		"""Dialogurile de selecție a comenzii și a parametrilor; returnează step-ul configurat sau None."""
 		# 🔹 Selectăm comanda
 		command_dialog = SelectCommandDialog(self.commands_data)
 		if not command_dialog.exec_():
 			print("❌ No command selected. Exiting...")
-			return
+			return None
 
 		selected_command = command_dialog.selected_command
 		command_action = self.commands_data[selected_command]["Action"]
 		command_expected = self.commands_data[selected_command]["Expected Result"]
 
-		# 🔹 Identificăm placeholder-ele
-		required_categories = set(
-			part.strip("{}") for part in command_action.split() if "{" in part
-		) | set(
-			part.strip("{}") for part in command_expected.split() if "{" in part
-		)
+		# 🔹 Identificăm placeholder-ele din forma compilată a comenzii
+		template = compile_command(self.commands_data[selected_command])
+		required_categories = template.categories
 
 		# 🔹 Deschidem dialogul pentru selecția parametrilor
 		parameter_dialog = PreviewTestStepDialog(command_action, command_expected, self.parameters_data,
@@ -372,43 +1033,107 @@ class TestsPage(QWidget):
 
 		if not parameter_dialog.exec_():
 			print("❌ Parameter selection was canceled. Exiting...")
-			return
+			return None
 
 		selected_parameters = parameter_dialog.selected_parameters
 		print(f"✅ Selected parameters: {selected_parameters}")  # Debugging
 
-		if not selected_parameters:
+		if required_categories and not selected_parameters:
 			QMessageBox.warning(self, "No Parameters Selected", "You must select parameters before applying.")
+			return None
+
+		# 🔹 Step-ul păstrează doar comanda și parametrii aleși; textul este derivat din ei
+		return command_step(selected_command, {category: selected_parameters[category]
+		                                       for category in required_categories if category in selected_parameters})
+
+	def select_and_add_test_step(self, test_name):
+		"""Deschide dialogurile de selecție a comenzii și parametrilor și adaugă step-ul în test."""
+		step = self.choose_command_step()
+		if step is None or test_name not in self.tests_data:
 			return
+		test_data = self.tests_data[test_name]
+		migrate_test(test_data, self.commands_data, self.parameters_data)
+		insert_step(test_data, len(test_data["Steps"]), step, self.commands_data)
 
-		# 🔹 Înlocuim placeholder-ele cu valorile selectate
-		test_data_description = []
-		for category, value in selected_parameters.items():
-			command_action = command_action.replace(f"{{{category}}}", value)
-			command_expected = command_expected.replace(f"{{{category}}}", value)
-			test_data_description.append(f"{category} = {value}")  # ✅ Stocăm ca listă de string-uri
+		self.update_test_after_step_edit(test_name)
 
-		# 🔹 Asigurăm structura JSON corectă
-		if test_name not in self.tests_data:
+	def open_command_palette(self):
+		"""Deschide paleta de comenzi pentru testele selectate; indexul este (re)construit în fundal dacă e nevoie."""
+		test_names = self.selected_test_names()
+		if not test_names:
+			QMessageBox.warning(self, "No Test Selected", "Please select a test to add a step.")
+			return
 
+		commands_data, parameters_data = self.commands_data, self.parameters_data
+		if self.palette_sources and self.palette_sources[0] is commands_data and self.palette_sources[1] is parameters_data:
+			self.show_command_palette(test_names)
 			return
-		# 🔹 Verificăm dacă Action și Expected Results sunt liste (conform `example_test.json`)
-		if not isinstance(self.tests_data[test_name].get("Action"), list):
-			self.tests_data[test_name]["Action"] = []
-		if not isinstance(self.tests_data[test_name].get("Expected Results"), list):
-			self.tests_data[test_name]["Expected Results"] = []
 
-		# 🔹 Adăugăm noul test step în listă
-		self.tests_data[test_name]["Action"].append(command_action)
-		self.tests_data[test_name]["Expected Results"].append(command_expected)
+		def built(palette_index):
+			self.palette_index = palette_index
+			self.palette_sources = (commands_data, parameters_data)
+			self.show_command_palette(test_names)
 
-		self.update_test_after_step_edit(test_name)
-		# 🔹 Apelăm funcția de actualizare a `Test Data Description`
-		self.update_test_data_description(test_name)
+		# ✅ Comenzile și parametrii sunt ținuți la zi de `file_watcher`; indexul se reconstruiește doar după o reîncărcare
+		io_executor().submit(lambda: PaletteIndex(commands_data, parameters_data, self.palette_recent), built,
+		                     key="command-palette", description="Indexing commands and parameters")
 
-		# 🔹 Apelăm funcția de actualizare după adăugarea unui step nou
-		self.update_description_tcg(test_name)
-		self.update_test_in_ui(test_name)
+	def show_command_palette(self, test_names):
+		target = f"'{test_names[0]}'" if len(test_names) == 1 else f"{len(test_names)} tests"
+		dialog = CommandPaletteDialog(self.palette_index, self.commands_data, target)
+		if not dialog.exec_() or dialog.step is None:
+			print("❌ Quick step canceled.")
+			return
+
+		# 🔹 Step-ul este adăugat la finalul fiecărui test selectat, într-un singur batch
+		updated_tests = {}
+		for test_name in test_names:
+			if test_name not in self.tests_data:
+				continue
+			migrate_test(self.tests_data[test_name], self.commands_data, self.parameters_data)
+			updated = self.step_edit_copy(test_name)
+			insert_step(updated, len(updated["Steps"]), copy.deepcopy(dialog.step), self.commands_data)
+			updated_tests[test_name] = derive_test(updated, self.commands_data, self.parameters_data,
+			                                       self.precondition_lines(test_name))
+		print(f"⌨ Quick step '{dialog.step['Command']}' added to {len(updated_tests)} test(s).")
+		self.apply_test_updates(updated_tests)
+
+	def add_step_to_tests(self, test_names):
+		"""Inserează același step configurat în toate testele selectate, la poziția aleasă, într-un singur batch."""
+		step = self.choose_command_step()
+		if step is None:
+			return
+
+		test_names = [test_name for test_name in test_names if test_name in self.tests_data]
+		for test_name in test_names:
+			migrate_test(self.tests_data[test_name], self.commands_data, self.parameters_data)
+		longest = max((len(self.tests_data[test_name]["Steps"]) for test_name in test_names), default=0)
+		position, ok = QInputDialog.getInt(
+			self, "Insert Step", f"Insert the step in {len(test_names)} test(s) at position\n"
+			                     f"(1 = first; tests with fewer steps get it at the end):", longest + 1, 1, longest + 1)
+		if not ok:
+			return
+
+		# 🔹 Testele noi sunt calculate pe copii; nimic nu se modifică înainte de confirmare
+		updated_tests = {}
+		changes = {}
+		for test_name in test_names:
+			test_data = self.tests_data[test_name]
+			updated = self.step_edit_copy(test_name)
+			# ✅ Fiecare test primește propria copie a step-ului (editările ulterioare sunt per test)
+			insert_step(updated, min(position - 1, len(updated["Steps"])), copy.deepcopy(step), self.commands_data)
+			updated = derive_test(updated, self.commands_data, self.parameters_data, self.precondition_lines(test_name))
+			updated_tests[test_name] = updated
+			changes[test_name] = changed_fields(test_data, updated)
+
+		dialog = UpdateTestsPreviewDialog(
+			"Add Step to Tests", f"Command '{step['Command']}' will be inserted at position {position} in "
+			                     f"{len(updated_tests)} test(s).", changes)
+		if not dialog.exec_():
+			print("❌ Bulk step insertion canceled.")
+			return
+
+		self.apply_test_updates(updated_tests)
 
 	def delete_test_step(self, test_name, step_index):
 		"""Șterge test step-ul selectat din test."""
@@ -424,16 +1149,10 @@ class TestsPage(QWidget):
 		if reply == QMessageBox.Yes:
 			print(f"🗑️ Deleting step {step_index} from test {test_name}")
 
-			# 🔹 Ștergem step-ul din toate categoriile relevante
-			del self.tests_data[test_name]["Action"][step_index]
-			del self.tests_data[test_name]["Expected Results"][step_index]
+			# 🔹 Ștergem step-ul (și textele derivate din el)
+			delete_step(self.tests_data[test_name], step_index)
 
 			self.update_test_after_step_edit(test_name)
-			# 🔹 Apelăm funcția de actualizare a `Test Data Description`
-			self.update_test_data_description(test_name)
-
-			# 🔹 Apelăm funcția de actualizare după adăugarea unui step nou
-			self.update_description_tcg(test_name)
 
 	def delete_test(self, test_name):
 		"""Șterge testul selectat din listă și actualizează UI-ul."""
@@ -453,8 +1172,16 @@ class TestsPage(QWidget):
 				print(f"🗑 Deleting test {test_name}")
 
 				del self.tests_data[test_name]  # ✅ Ștergem testul din JSON
+				self.step_index.remove_test(test_name)
+				self.preconditions.remove_test(test_name)
+				self.validate_later([test_name])
 				self.save_tests()
 
+				folder = self.suites.folder_of(test_name)
+				if folder is not None:
+					self.suites.remove_test(test_name)
+					self.suites_modified([folder])
+
 				# 🔹 Verificăm dacă UI-ul poate gestiona ștergerea
 				if self.test_table is None:
 					print("❌ ERROR: self.test_table is None. UI update failed!")
@@ -475,80 +1202,149 @@ class TestsPage(QWidget):
 			print(f"❌ CRITICAL ERROR in `delete_test`: {e}")
 			traceback.print_exc()
 
-	def move_test_step(self, test_name, step_index, direction):
-		"""Mută test step-ul selectat în sus sau în jos."""
+	def step_edit_copy(self, test_name):
+		"""Copie a testului în care listele de step-uri pot fi modificate fără a atinge `tests_data`."""
+		test_data = self.tests_data[test_name]
+		updated = dict(test_data)
+		for field in ("Steps", "Action", "Expected Results"):
+			updated[field] = list(test_data[field])
+		return updated
+
+	def apply_step_edit(self, test_name, updated, first, count):
+		"""Un singur update + o singură salvare pentru un gest pe step-uri; intervalul rezultat rămâne selectat."""
+		updated = derive_test(updated, self.commands_data, self.parameters_data, self.precondition_lines(test_name))
+		self.apply_test_updates({test_name: updated})
+		self.select_test_steps(test_name, first, count)
+
+	def move_test_steps(self, test_name, indices, target):
+		"""Mută step-urile `indices` (un interval sau nu) înaintea step-ului `target` într-un singur pas."""
 		if test_name not in self.tests_data:
 			print(f"❌ ERROR: Test '{test_name}' not found!")
 			return
 
-		steps = self.tests_data[test_name]["Action"]
-
-		if direction == "up" and step_index > 0:
-			print(f"🔼 Moving step {step_index} UP in test {test_name}")
-			steps[step_index], steps[step_index - 1] = steps[step_index - 1], steps[step_index]
-			self.tests_data[test_name]["Expected Results"][step_index], self.tests_data[test_name]["Expected Results"][
-				step_index - 1] = \
-				self.tests_data[test_name]["Expected Results"][step_index - 1], \
-				self.tests_data[test_name]["Expected Results"][step_index]
-		elif direction == "down" and step_index < len(steps) - 1:
-			print(f"🔽 Moving step {step_index} DOWN in test {test_name}")
-			steps[step_index], steps[step_index + 1] = steps[step_index + 1], steps[step_index]
-			self.tests_data[test_name]["Expected Results"][step_index], self.tests_data[test_name]["Expected Results"][
-				step_index + 1] = \
-				self.tests_data[test_name]["Expected Results"][step_index + 1], \
-				self.tests_data[test_name]["Expected Results"][step_index]
-		else:
+		step_count = len(self.tests_data[test_name]["Steps"])
+		indices = sorted(set(indices))
+		if not indices or indices[0] < 0 or indices[-1] >= step_count or not 0 <= target <= step_count:
 			print("❌ ERROR: Move not possible")
 			return
-
-		# 🔹 Apelăm funcția de actualizare după adăugarea unui step nou
-		self.update_test_after_step_edit(test_name)
-		self.update_description_tcg(test_name)
-
-	def copy_test_step(self, test_name, step_index):
-		"""Copiază test step-ul selectat într-un buffer temporar."""
+		if indices == list(range(indices[0], indices[-1] + 1)) and indices[0] <= target <= indices[-1] + 1:
+			return  # ✅ Step-urile rămân pe loc
+
+		print(f"🔀 Moving {len(indices)} step(s) of test {test_name} before position {target}")
+		updated = self.step_edit_copy(test_name)
+		first = move_steps(updated, indices, target)
+		self.apply_step_edit(test_name, updated, first, len(indices))
+
+	def steps_mime_data(self, test_name, indices):
+		"""Step-urile în formatul clipboard-ului; alte aplicații primesc textul "action<TAB>expected"."""
+		test_data = self.tests_data[test_name]
+		mime = QMimeData()
+		mime.setData(STEPS_MIME_TYPE, encode_steps(test_data, indices, {"instance": self.instance_id, "test": test_name}))
+		mime.setText(steps_as_text(
+			(test_data["Action"][index], test_data["Expected Results"][index]) for index in sorted(set(indices))))
+		return mime
+
+	def steps_from_mime(self, mime):
+		"""Payload-ul `decode_steps` din clipboard / drop (step-uri din orice instanță sau linii de text)."""
+		if mime is None:
+			return None
+		if mime.hasFormat(STEPS_MIME_TYPE):
+			return decode_steps(mime.data(STEPS_MIME_TYPE))
+		steps = steps_from_text(mime.text()) if mime.hasText() else []
+		return {"source": None, "steps": steps} if steps else None
+
+	def copy_test_steps(self, test_name, indices):
+		"""Copiază step-urile `indices` în clipboard-ul sistemului (lipibile și într-o altă instanță)."""
 		if test_name not in self.tests_data:
 			print(f"❌ ERROR: Test '{test_name}' not found!")
 			return
 
-		self.copied_step = self.tests_data[test_name]["Action"][step_index]
-		self.copied_expected = self.tests_data[test_name]["Expected Results"][step_index]
-
-		print(f"📋 Copied step {step_index} from test: {test_name}")
+		QApplication.clipboard().setMimeData(self.steps_mime_data(test_name, indices))
+		print(f"📋 Copied {len(indices)} step(s) from test: {test_name}")
 
-	def paste_test_step(self, test_name, step_index):
-		"""Lipește test step-ul copiat într-un test selectat."""
-		if not self.copied_step:
-			QMessageBox.warning(self, "No Copied Step", "Please copy a test step first.")
+	def paste_test_steps(self, test_name, step_index):
+		"""Lipește step-urile din clipboard înaintea step-ului `step_index`."""
+		payload = self.steps_from_mime(QApplication.clipboard().mimeData())
+		if payload is None:
+			QMessageBox.warning(self, "No Copied Steps", "Please copy one or more test steps first.")
 			return
 
+		self.insert_test_steps(test_name, step_index, payload)
+
+	def insert_test_steps(self, test_name, step_index, payload):
 		if test_name not in self.tests_data:
 			print(f"❌ ERROR: Test '{test_name}' not found!")
 			return
 
-		print(f"📌 Pasting copied step into test: {test_name} at position {step_index}")
+		steps = copy.deepcopy(payload["steps"])
+		step_index = max(0, min(step_index, len(self.tests_data[test_name]["Steps"])))
+		print(f"📌 Pasting {len(steps)} step(s) into test: {test_name} at position {step_index}")
 
-		# 🔹 Adăugăm step-ul copiat în testul selectat
-		self.tests_data[test_name]["Action"].insert(step_index, self.copied_step)
-		self.tests_data[test_name]["Expected Results"].insert(step_index, self.copied_expected)
+		updated = self.step_edit_copy(test_name)
+		insert_steps(updated, step_index, steps, self.commands_data, payload.get("texts"))
+		self.apply_step_edit(test_name, updated, step_index, len(steps))
 
-		# 🔹 Apelăm funcția de actualizare a `Test Data Description`
-		self.update_test_data_description(test_name)
+	def step_table_test(self, step_table):
+		"""Testul afișat de un tabel embedat (rândul se poate schimba după inserări / redenumiri)."""
+		for row in range(self.test_table.rowCount()):
+			if step_table in (self.test_table.cellWidget(row, 3), self.test_table.cellWidget(row, 4)):
+				return self.test_table.item(row, 0).text().strip()
+		return None
 
-		# 🔹 Apelăm funcția de actualizare după adăugarea unui step nou
-		self.update_description_tcg(test_name)
+	def select_test_steps(self, test_name, first, count):
+		for row in range(self.test_table.rowCount()):
+			item = self.test_table.item(row, 0)
+			if item and item.text().strip() == test_name:
+				for col in (3, 4):
+					step_table = self.test_table.cellWidget(row, col)
+					if isinstance(step_table, TestStepTable):
+						step_table.select_steps(first, count)
+				return
 
-		self.update_test_after_step_edit(test_name)
+	def drop_test_steps(self, step_table, mime, target):
+		"""Drop în lista de step-uri: în același test = reordonare, altfel copiere (și din altă instanță)."""
+		test_name = self.step_table_test(step_table)
+		payload = self.steps_from_mime(mime)
+		if test_name is None or payload is None:
+			return
 
-	def add_test_to_ui(self, test_name, test_data, after_test_name=None):
-		"""Adaugă un test în UI imediat după un test existent."""
+		source = payload.get("source") or {}
+		# ✅ Aplicăm după ce drag-ul s-a terminat: tabelul sursă / destinație este reconstruit de update
+		if source.get("instance") == self.instance_id and source.get("test") == test_name:
+			QTimer.singleShot(0, lambda: self.move_test_steps(test_name, payload.get("indices", []), target))
+		else:
+			QTimer.singleShot(0, lambda: self.insert_test_steps(test_name, target, payload))
+
+	def create_step_tables(self, test_data, row_position):
+		"""Tabelele embedate Action / Expected Results, conectate la drag & drop și clipboard."""
+		step_tables = []
+		for field in ("Action", "Expected Results"):
+			step_table = TestStepTable(test_data.get(field, []), self.test_table, row_position)
+			step_table.mime_data_for = lambda table, indices: self.steps_mime_data(self.step_table_test(table), indices)
+			step_table.steps_dropped.connect(self.drop_test_steps)
+			step_table.copy_requested.connect(
+				lambda table: self.copy_test_steps(self.step_table_test(table), table.selected_steps()))
+			step_table.paste_requested.connect(self.paste_into_step_table)
+			step_tables.append(step_table)
+		return step_tables
+
+	def paste_into_step_table(self, step_table):
+		"""Ctrl+V: step-urile sunt inserate înaintea step-ului curent (sau la final)."""
+		current = step_table.table.currentRow()
+		self.paste_test_steps(self.step_table_test(step_table), step_table.table.rowCount() if current == -1 else current)
+
+	def add_test_to_ui(self, test_name, test_data, after_test_name=None, row_position=None):
+		"""Adaugă un test în UI imediat după un test existent (sau la `row_position`, dacă este cunoscut)."""
 
 		if not self.test_table:
 			print("❌ ERROR: test_table is None! Cannot add test to UI.")
 			return
 
 		# 🔹 Găsim poziția testului original
-		row_position = self.test_table.rowCount()  # Default: ultimul rând
+		if row_position is None:
+			row_position = self.test_table.rowCount()  # Default: ultimul rând
+		elif after_test_name:
+			after_test_name = None  # ✅ Poziția este dată; nu mai căutăm testul original
 		if after_test_name:
 			for row in range(self.test_table.rowCount()):
 				if self.test_table.item(row, 0) and self.test_table.item(row, 0).text().strip() == after_test_name:
@@ -556,6 +1352,7 @@ class TestsPage(QWidget):
 					break
 
 		self.test_table.insertRow(row_position)  # ✅ Inserăm testul duplicat imediat după original
+		self.hidden_tests.discard(test_name)  # ✅ Un rând nou este vizibil
 
 		print(f"✅ Adding test '{test_name}' at row {row_position}, after '{after_test_name}'.")
 
@@ -572,8 +1369,7 @@ class TestsPage(QWidget):
 			self.test_table.setItem(row_position, col, item)
 
 		# 🔹 Creăm tabele embedate pentru Action și Expected Results
-		action_table = TestStepTable(test_data.get("Action", []), self.test_table, row_position)
-		expected_table = TestStepTable(test_data.get("Expected Results", []), self.test_table, row_position)
+		action_table, expected_table = self.create_step_tables(test_data, row_position)
 
 		self.test_table.setCellWidget(row_position, 3, action_table)
 		self.test_table.setCellWidget(row_position, 4, expected_table)
@@ -587,64 +1383,147 @@ class TestsPage(QWidget):
 		print(f"✅ Test '{test_name}' added to UI at row {row_position}.")
 
 	def load_tests(self):
-		"""Încarcă testele din JSON la pornirea aplicației și setează UI-ul corect."""
-		if hasattr(self, "initial_load_done") and self.initial_load_done:
+		"""
+		Încarcă testele din JSON la pornirea aplicației, progresiv.
+
+		Testele sunt citite unul câte unul din `tests.json` și adăugate în UI în bucăți de
+		`LOAD_CHUNK_SIZE` prin event loop, astfel încât primul ecran apare imediat, iar restul
+		se încarcă în fundal cu un indicator de progres.
+		"""
+		if self.initial_load_done or hasattr(self, "tests_stream"):
 			print("🔹 Skipping full reload - load_tests() is only called on startup.")
 			return  # ✅ Prevenim apelurile după inițializare
 
 		print("🔹 Loading tests from JSON...")
 
-		self.test_table.blockSignals(True)  # ✅ Dezactivăm semnalele pentru a preveni salvările inutile
 		self.test_table.setRowCount(0)  # Resetăm tabelul
 
-		for test_name, test_data in self.tests_data.items():
-			self.add_test_to_ui(test_name, test_data)  # ✅ Mutăm logica de încărcare per test într-o funcție separată
+		if not os.path.exists(self.json_file):
+			self.finish_loading_tests()
+			return
+
+		self.tests_stream = JsonObjectStream(self.json_file)
+		self.tests_iterator = iter(self.tests_stream)
+
+		# 🔹 Până la finalul încărcării nu permitem adăugarea/importul de teste
+		self.add_test_button.setEnabled(False)
+		self.import_button.setEnabled(False)
+		self.export_variants_button.setEnabled(False)
+		self.export_html_button.setEnabled(False)
+		self.load_progress.setValue(0)
+		self.load_progress.show()
+
+		self.load_next_tests_chunk()  # ✅ Primul ecran este construit imediat
 
-		self.test_table.blockSignals(False)  # ✅ Reactivăm semnalele după încărcare
+	def load_next_tests_chunk(self):
+		"""Adaugă următoarele `LOAD_CHUNK_SIZE` teste în UI și programează bucata următoare."""
+		first_row = self.test_table.rowCount()
+		finished = False
 
-		self.test_table.resizeRowsToContents()
+		self.test_table.blockSignals(True)  # ✅ Dezactivăm semnalele pentru a preveni salvările inutile
+		try:
+			for _ in range(self.LOAD_CHUNK_SIZE):
+				test_name, test_data = next(self.tests_iterator)
+				if migrate_test(test_data, self.commands_data, self.parameters_data):
+					self.save_pending = True  # ✅ Testele în format vechi sunt salvate cu `Steps` la final
+				self.tests_data[test_name] = test_data
+				self.step_index.index_test(test_name, test_data)
+				self.preconditions.update_test(test_name, test_data)
+				self.add_test_to_ui(test_name, test_data)  # ✅ Mutăm logica de încărcare per test într-o funcție separată
+		except StopIteration:
+			finished = True
+		except json.JSONDecodeError as e:
+			print(f"❌ Error: JSON file '{self.json_file}' is corrupted ({e}). Loaded {len(self.tests_data)} tests.")
+			finished = True
+		finally:
+			self.test_table.blockSignals(False)  # ✅ Reactivăm semnalele după încărcare
+
+		for row in range(first_row, self.test_table.rowCount()):
+			self.test_table.resizeRowToContents(row)
+
+		self.load_progress.setValue(int(self.tests_stream.progress * 100))
+
+		if finished:
+			self.finish_loading_tests()
+		else:
+			QTimer.singleShot(0, self.load_next_tests_chunk)
+
+	def finish_loading_tests(self):
+		"""Finalizează încărcarea progresivă: layout, snapshot, salvări amânate și filtrul activ."""
 		self.test_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
 		self.test_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
+		self.load_progress.hide()
+		self.add_test_button.setEnabled(True)
+		self.import_button.setEnabled(True)
+		self.export_variants_button.setEnabled(True)
+		self.export_html_button.setEnabled(True)
+
 		self.initial_load_done = True  # ✅ Marcăm că încărcarea inițială a fost efectuată
-		print("✅ Tests loaded successfully.")
 
-	def load_parameters(self):
-		"""Încarcă parametrii din parameters.json."""
-		if not os.path.exists(self.parameters_file):
-			print("❌ Parameters file not found.")
-			self.parameters_data = {}
-			return
+		if self.suites.retain(self.tests_data):
+			self.save_suites()  # ✅ Testele șterse din afara aplicației dispar și din suite
+			self.suite_panel.rebuild()
 
-		try:
-			with open(self.parameters_file, "r", encoding="utf-8") as file:
-				self.parameters_data = json.load(file)
-			print("✅ Parameters loaded successfully:", self.parameters_data.keys())
-		except json.JSONDecodeError:
-			print("❌ Error loading parameters file.")
-			self.parameters_data = {}
-
-	def load_commands(self):
-		"""Încarcă comenzile din `generic_commands.json`."""
-		if not os.path.exists(self.commands_file):
-			print("❌ Commands file not found.")
-			self.commands_data = {}
-			return
+		if hasattr(self, "tests_stream"):
+			# ✅ Versiunea încărcată este reținută pentru detectarea modificărilor altor instanțe la salvare
+			stream, data, migrated = self.tests_stream, copy_json_data(self.tests_data), self.save_pending
 
-		try:
-			with open(self.commands_file, "r", encoding="utf-8") as file:
-				self.commands_data = json.load(file)
+			def remember_loaded_tests():
+				self.tests_file.remember(data, stream.stamp)
+				if not migrated:
+					stream.store_snapshot(data)
+
+			# ✅ `submit_read`: ordonat cu scrierile fișierului, dar nu poate fi comasat cu (înlocuit de) o salvare
+			io_executor().submit_read(self.json_file, remember_loaded_tests, description="Caching tests.json snapshot")
+
+		if self.save_pending:
+			self.save_tests()  # ✅ Modificările făcute în timpul încărcării sunt salvate acum
+
+		if self.search_bar.text():
+			self.filter_tests(self.search_bar.text(), self.test_table)
+
+		self.start_full_validation()
+
+		print(f"✅ Tests loaded successfully ({len(self.tests_data)} tests).")
+		self.tests_loaded.emit()
+
+		pending_updates, self.pending_updates = self.pending_updates, []
+		self.pending_external_paths.clear()
+		for update in pending_updates:
+			update()
+
+	def load_parameters(self, on_loaded=None):
+		"""Încarcă parametrii din parameters.json în fundal; `on_loaded` rulează după actualizare."""
+		def apply(parameters_data):
+			self.parameters_data = parameters_data
+			self.preconditions.clear()  # ✅ Step-urile randate în precondiții pot folosi parametrii schimbați
+			self.validation.set_parameters(parameters_data)
+			self.validate_later()
+			print("✅ Parameters loaded successfully:", self.parameters_data.keys())
+			if on_loaded:
+				on_loaded()
+
+		io_executor().submit_read(self.parameters_file, lambda: self.load_json(self.parameters_file), apply)
+
+	def load_commands(self, on_loaded=None):
+		"""Încarcă comenzile din `generic_commands.json` în fundal; `on_loaded` rulează după actualizare."""
+		def apply(commands_data):
+			self.commands_data = commands_data
+			self.preconditions.clear()
+			self.validation.set_commands(commands_data)
+			self.validate_later()
 			print("✅ Commands loaded successfully:", self.commands_data.keys())
-		except json.JSONDecodeError:
-			print("❌ Error loading commands file.")
-			self.commands_data = {}
+			if on_loaded:
+				on_loaded()
+
+		io_executor().submit_read(self.commands_file, lambda: self.load_json(self.commands_file), apply)
 
 	def load_json(self, file_path):
 		"""Încarcă un JSON sau returnează un dicționar gol dacă nu există."""
 		if os.path.exists(file_path):
 			try:
-				with open(file_path, "r", encoding="utf-8") as file:
-					return json.load(file)
+				return read_json(file_path)
 			except json.JSONDecodeError:
 				print(f"❌ Error: JSON file '{file_path}' is corrupted. Returning empty dictionary.")
 				return {}
@@ -656,28 +1535,92 @@ class TestsPage(QWidget):
 		if not file_path:
 			return
 
-		df = pd.read_excel(file_path, dtype=str).fillna("")
+		def read_rows():
+			import pandas as pd  # ✅ Import întârziat - pandas este încărcat doar la import/export
+			return pd.read_excel(file_path, dtype=str).fillna("").to_dict("records")
 
-		for _, row in df.iterrows():
-			test_name = row["Test Name"].strip()
+		def apply(rows):
+			for row in rows:
+				test_name = row["Test Name"].strip()
 
-			# Verificăm dacă testul există deja în JSON sau UI
-			if test_name in self.tests_data or self.is_test_in_table(test_name):
-				print(f"⚠️ Test '{test_name}' already exists. Skipping import.")
-				continue  # Sărim peste acest test, deoarece este deja prezent
+				# Verificăm dacă testul există deja în JSON sau UI
+				if test_name in self.tests_data:
+					print(f"⚠️ Test '{test_name}' already exists. Skipping import.")
+					continue  # Sărim peste acest test, deoarece este deja prezent
 
-			# Adăugăm testul în JSON și UI
-			self.tests_data[test_name] = row.to_dict()
-			self.add_test_to_table(test_name, self.tests_data[test_name])
+				# Adăugăm testul în JSON și UI; step-urile text sunt legate de comenzi unde e posibil
+				migrate_test(row, self.commands_data, self.parameters_data)
+				self.tests_data[test_name] = row
+				self.step_index.index_test(test_name, row)
+				self.preconditions.update_test(test_name, row)
+				self.validate_later([test_name])
+				self.add_test_to_ui(test_name, self.tests_data[test_name])
 
-		self.save_tests()
-		QMessageBox.information(self, "Import Completed", "Tests imported successfully from XLSX!")
+			self.save_tests()
+			QMessageBox.information(self, "Import Completed", "Tests imported successfully from XLSX!")
+
+		io_executor().submit_read(
+			file_path, read_rows, apply,
+			on_error=lambda e: QMessageBox.critical(self, "Import Failed", f"An error occurred during import:\n{str(e)}"),
+			description=f"Importing {os.path.basename(file_path)}")
 
 	def export_to_xlsx(self):
 		file_path, _ = QFileDialog.getSaveFileName(self, "Save Excel File", "", "Excel Files (*.xlsx);;All Files (*)")
 		if not file_path:
 			return
 
+		tests_data = copy_json_data(self.tests_data)  # ✅ Exportul rulează în fundal pe o copie a datelor
+		io_executor().submit_write(
+			file_path, lambda: self.write_xlsx(file_path, tests_data),
+			on_done=lambda _: QMessageBox.information(self, "Export Completed", "Tests exported successfully to XLSX!"),
+			on_error=lambda e: QMessageBox.critical(self, "Export Failed", f"An error occurred during export:\n{str(e)}"),
+			description=f"Exporting {os.path.basename(file_path)}")
+
+	def export_variant_specs(self):
+		"""Exportă, pentru fiecare variantă, testele cu parametrii înlocuiți de valorile lor (CSV sau JSON)."""
+		file_path, _ = QFileDialog.getSaveFileName(self, "Save Variant Specifications", "",
+		                                           "CSV Files (*.csv);;JSON Files (*.json)")
+		if not file_path:
+			return
+
+		# ✅ Expansiunea rulează în fundal, pe copii ale datelor, și este scrisă progresiv în fișier
+		tests_data = copy_json_data(self.tests_data)
+		commands_data = copy_json_data(self.commands_data)
+		parameters_data = copy_json_data(self.parameters_data)
+		io_executor().submit_write(
+			file_path, lambda: write_variant_specs(file_path, tests_data, commands_data, parameters_data),
+			on_done=lambda _: QMessageBox.information(self, "Export Completed",
+			                                          f"Variant specifications exported to {os.path.basename(file_path)}!"),
+			on_error=lambda e: QMessageBox.critical(self, "Export Failed", f"An error occurred during export:\n{str(e)}"),
+			description=f"Exporting {os.path.basename(file_path)}")
+
+	def export_html_report(self):
+		"""Scrie (sau actualizează) raportul HTML într-un folder; fragmentele testelor nemodificate sunt refolosite."""
+		report_dir = QFileDialog.getExistingDirectory(self, "Select Report Folder", self.report_dir)
+		if not report_dir:
+			return
+		self.report_dir = report_dir
+
+		def done(result):
+			print(f"✅ HTML report: {result.rendered} test(s) rendered, {result.reused} reused, "
+			      f"{result.removed} stale fragment(s) removed.")
+			QMessageBox.information(self, "Export Completed", f"HTML report written to {result.index_path}")
+
+		tests_data = copy_json_data(self.tests_data)
+		io_executor().submit_write(
+			os.path.join(report_dir, "index.html"), lambda: write_report(report_dir, tests_data), on_done=done,
+			on_error=lambda e: QMessageBox.critical(self, "Export Failed", f"An error occurred during export:\n{str(e)}"),
+			description="Exporting HTML report")
+
+	@staticmethod
+	def write_xlsx(file_path, tests_data):
+		"""Scrie testele într-un fișier XLSX (rulează în thread-ul de I/O)."""
+		from openpyxl import Workbook  # ✅ Import întârziat - openpyxl este încărcat doar la export
+		from openpyxl.styles import Alignment, PatternFill, Font
+
+		def as_lines(value):
+			return list(value) if isinstance(value, list) else [line for line in str(value or "").split(", ") if line]
+
 		wb = Workbook()
 		ws = wb.active
 		ws.title = "Tests"
@@ -695,12 +1638,12 @@ class TestsPage(QWidget):
 			cell.font = bold_font
 			cell.alignment = Alignment(horizontal="center", vertical="center")
 
-		for test_name, test_data in self.tests_data.items():
-			action_steps = test_data.get("Steps", [])
-			action_text = "\n".join([f"{i + 1}. {step['Action']}" for i, step in enumerate(action_steps)])
-			expected_text = "\n".join([f"{i + 1}. {step['Expected']}" for i, step in enumerate(action_steps)])
-			test_data_description = "\n".join(test_data.get("Test Data Description", "").split(", "))
-			description_tcg = "\n".join(test_data.get("Description TCG", "").split(", "))
+		for test_name, test_data in tests_data.items():
+			action_text = "\n".join([f"{i + 1}. {step}" for i, step in enumerate(as_lines(test_data.get("Action", [])))])
+			expected_text = "\n".join(
+				[f"{i + 1}. {step}" for i, step in enumerate(as_lines(test_data.get("Expected Results", [])))])
+			test_data_description = "\n".join(as_lines(test_data.get("Test Data Description", [])))
+			description_tcg = "\n".join(as_lines(test_data.get("Description TCG", [])))
 
 			row = [
 				test_name,
@@ -718,16 +1661,39 @@ class TestsPage(QWidget):
 				ws.cell(row=row_num, column=col_num).alignment = Alignment(horizontal="center", vertical="center")
 
 		wb.save(file_path)
-		QMessageBox.information(self, "Export Completed", "Tests exported successfully to XLSX!")
 
 	def save_tests(self):
-		"""Salvează testele în JSON."""
-		try:
-			with open(self.json_file, "w", encoding="utf-8") as file:
-				json.dump(self.tests_data, file, indent=4)
-			print("✅ Tests saved successfully.")
-		except Exception as e:
-			print(f"❌ Error saving tests: {e}")
+		"""
+		Salvează testele în JSON, în fundal.
+
+		Toate apelurile din aceeași iterație a event loop-ului sunt grupate într-o singură scriere,
+		iar scrierile succesive în același fișier sunt serializate și comasate de `io_executor`.
+		"""
+		if not self.initial_load_done:
+			# ✅ Nu suprascriem fișierul cu un set parțial de teste; salvăm la finalul încărcării
+			self.save_pending = True
+			return
+
+		if not self.save_scheduled:
+			self.save_scheduled = True
+			QTimer.singleShot(0, self.flush_pending_io)
+
+	def flush_pending_io(self):
+		"""Trimite imediat salvarea programată către thread-ul de I/O."""
+		if not self.save_scheduled:
+			return
+
+		self.save_scheduled = False
+		self.save_pending = False
+		tests_data = copy_json_data(self.tests_data)
+		io_executor().submit_write(self.json_file, lambda: self.tests_file.write(tests_data),
+		                           on_done=self.tests_saved)
+
+	def tests_saved(self, result):
+		"""După salvare: testele păstrate de pe disc (salvate de altă instanță) sunt preluate și în UI."""
+		report_save("Tests", result, self)
+		if result.from_disk:
+			self.reload_external_tests(only=result.from_disk)
 
 	def get_selected_test_step(self, selected_row, selected_col):
 		"""Returnează testul și index-ul step-ului selectat din Action sau Expected Results."""
@@ -782,20 +1748,24 @@ class TestsPage(QWidget):
 		delete_action.triggered.connect(lambda: self.delete_test_step(test_name, step_index))
 		menu.addAction(delete_action)
 
-		move_up_action = QAction("🔼 Move Step Up", self)
-		move_up_action.triggered.connect(lambda: self.move_test_step(test_name, step_index, "up"))
+		# 🔹 Mutarea / copierea se aplică întregului interval selectat (Shift+click)
+		indices = self.test_table.cellWidget(selected_row, selected_col).selected_steps() or [step_index]
+		label = "Step" if len(indices) == 1 else f"{len(indices)} Steps"
+
+		move_up_action = QAction(f"🔼 Move {label} Up", self)
+		move_up_action.triggered.connect(lambda: self.move_test_steps(test_name, indices, indices[0] - 1))
 		menu.addAction(move_up_action)
 
-		move_down_action = QAction("🔽 Move Step Down", self)
-		move_down_action.triggered.connect(lambda: self.move_test_step(test_name, step_index, "down"))
+		move_down_action = QAction(f"🔽 Move {label} Down", self)
+		move_down_action.triggered.connect(lambda: self.move_test_steps(test_name, indices, indices[-1] + 2))
 		menu.addAction(move_down_action)
 
-		copy_action = QAction("📋 Copy Step", self)
-		copy_action.triggered.connect(lambda: self.copy_test_step(test_name, step_index))
+		copy_action = QAction(f"📋 Copy {label}", self)
+		copy_action.triggered.connect(lambda: self.copy_test_steps(test_name, indices))
 		menu.addAction(copy_action)
 
-		paste_action = QAction("📌 Paste Step", self)
-		paste_action.triggered.connect(lambda: self.paste_test_step(test_name, step_index))
+		paste_action = QAction("📌 Paste Steps", self)
+		paste_action.triggered.connect(lambda: self.paste_test_steps(test_name, step_index))
 		menu.addAction(paste_action)
 
 		print("✅ DEBUG: Context menu displayed")
@@ -827,10 +1797,16 @@ class TestsPage(QWidget):
 		delete_action.triggered.connect(lambda: self.run_and_close_menu(self.delete_test, test_name, menu))
 		menu.addAction(delete_action)
 
-		# 🔹 Adăugare Test Step
-		add_step_action = QAction("➕ Add Test Step", self)
-		add_step_action.triggered.connect(
-			lambda: self.run_and_close_menu(self.add_test_step_from_menu, test_name, menu))
+		# 🔹 Adăugare Test Step (în toate testele selectate, dacă testul face parte dintr-o selecție multiplă)
+		selected_tests = self.selected_test_names()
+		if len(selected_tests) > 1 and test_name in selected_tests:
+			add_step_action = QAction(f"➕ Add Test Step to {len(selected_tests)} Selected Tests", self)
+			add_step_action.triggered.connect(
+				lambda: self.run_and_close_menu(lambda _: self.add_test_step(), test_name, menu))
+		else:
+			add_step_action = QAction("➕ Add Test Step", self)
+			add_step_action.triggered.connect(
+				lambda: self.run_and_close_menu(self.add_test_step_from_menu, test_name, menu))
 		menu.addAction(add_step_action)
 
 		# 🔹 Actualizare Test Data Description
@@ -856,6 +1832,19 @@ class TestsPage(QWidget):
 		edit_test_name_action.triggered.connect(lambda: self.run_and_close_menu(self.edit_test_name, test_name, menu))
 		menu.addAction(edit_test_name_action)
 
+		# 🔹 Generare de teste din acest test (template cu categorii deschise)
+		generate_action = QAction("🧬 Generate Tests from Template...", self)
+		generate_action.triggered.connect(
+			lambda: self.run_and_close_menu(
+				lambda name: self.load_parameters(lambda: self.load_commands(lambda: self.generate_from_template(name))),
+				test_name, menu))
+		menu.addAction(generate_action)
+
+		# 🔹 **Move to Suite**
+		move_to_suite_action = QAction("📁 Move to Suite...", self)
+		move_to_suite_action.triggered.connect(lambda: self.run_and_close_menu(self.move_test_to_suite, test_name, menu))
+		menu.addAction(move_to_suite_action)
+
 		print("✅ DEBUG: Context menu displayed")
 		menu.exec_(self.test_table.viewport().mapToGlobal(position))
 
@@ -871,6 +1860,100 @@ class TestsPage(QWidget):
 
 		self.add_test_step()
 
+	def generate_from_template(self, template_name):
+		"""Generează testele template × parametri aleși și le inserează în bloc după template."""
+		if template_name not in self.tests_data:
+			return
+		template = self.tests_data[template_name]
+		migrate_test(template, self.commands_data, self.parameters_data)
+
+		categories = open_categories(template, self.commands_data, self.parameters_data)
+		if not categories:
+			QMessageBox.information(
+				self, "No Open Categories",
+				f"'{template_name}' has no open categories.\nLeave a command placeholder unbound, or write "
+				f"{{Category}} in a text step, the description or the precondition.")
+			return
+
+		dialog = GenerateTestsDialog(template_name, categories, self.parameters_data)
+		if not dialog.exec_():
+			return
+		bindings = combinations(dialog.selections, dialog.mode)
+		if not bindings or not dialog.name_pattern:
+			return
+
+		# ✅ Câmpurile derivate sunt calculate în fundal (în procese separate pentru multe teste), pe copii
+		template_copy = copy_json_data(template)
+		existing = set(self.tests_data)
+		commands_data = copy_json_data(self.commands_data)
+		parameters_data = copy_json_data(self.parameters_data)
+		name_pattern = dialog.name_pattern
+		self.add_test_button.setEnabled(False)
+
+		def done(generated):
+			self.add_test_button.setEnabled(True)
+			self.insert_generated_tests(template_name, generated)
+
+		def failed(error):
+			self.add_test_button.setEnabled(True)
+			QMessageBox.critical(self, "Generation Failed", f"An error occurred while generating tests:\n{error}")
+
+		io_executor().submit(
+			lambda: generate_tests(template_copy, bindings, name_pattern, existing, commands_data, parameters_data),
+			done, failed, key="generation", description=f"Generating {len(bindings)} test(s)")
+
+	def insert_generated_tests(self, template_name, generated):
+		"""Inserează testele generate după template: o singură actualizare a tabelului și o singură salvare."""
+		generated = {test_name: test_data for test_name, test_data in generated.items()
+		             if test_name not in self.tests_data}  # ✅ Teste create între timp cu același nume
+		if not generated:
+			return
+
+		# 🔹 Ordinea din JSON: testele generate urmează imediat după template
+		test_names = list(self.tests_data)
+		index = test_names.index(template_name) + 1 if template_name in self.tests_data else len(test_names)
+		new_tests_data = {test_name: self.tests_data[test_name] for test_name in test_names[:index]}
+		new_tests_data.update(generated)
+		new_tests_data.update((test_name, self.tests_data[test_name]) for test_name in test_names[index:])
+		self.tests_data = new_tests_data
+
+		row_position = self.test_table.rowCount()
+		for row in range(self.test_table.rowCount()):
+			item = self.test_table.item(row, 0)
+			if item and item.text().strip() == template_name:
+				row_position = row + 1
+				break
+
+		previous_name = template_name
+		changed_folders = set()
+		self.test_table.blockSignals(True)
+		self.test_table.setUpdatesEnabled(False)
+		try:
+			for offset, (test_name, test_data) in enumerate(generated.items()):
+				if called_tests(test_data.get("Precondition", "")):
+					# ✅ Liniile `call <test>` sunt expandate aici (expansiunea folosește cache-ul paginii)
+					test_data["Description TCG"] = compute_description_tcg(
+						test_data, self.commands_data, self.parameters_data,
+						self.preconditions.precondition_lines(test_name, test_data, self.tests_data,
+						                                      self.commands_data, self.parameters_data))
+				self.step_index.index_test(test_name, test_data)
+				self.preconditions.update_test(test_name, test_data)
+				if self.suites.add_test_after(test_name, previous_name):
+					changed_folders.add(self.suites.folder_of(test_name))
+				previous_name = test_name
+				self.add_test_to_ui(test_name, test_data, row_position=row_position + offset)
+		finally:
+			self.test_table.setUpdatesEnabled(True)
+			self.test_table.blockSignals(False)
+
+		self.validate_later(list(generated))
+		if changed_folders:
+			self.suites_modified(list(changed_folders))
+		self.save_tests()
+		if self.search_bar.text() or self.current_folder is not None:
+			self.filter_tests(self.search_bar.text(), self.test_table)
+		print(f"✅ Generated {len(generated)} test(s) from '{template_name}'.")
+
 	def update_test_data_description(self, test_name):
 		if test_name not in self.tests_data:
 			print(f"❌ ERROR: Test '{test_name}' not found!")
@@ -878,29 +1961,7 @@ class TestsPage(QWidget):
 
 		print(f"🔹 Updating Test Data Description for: {test_name}")
 
-		variant_groups = {}
-
-		# Iterăm peste câmpurile Action și Expected Results
-		for field in ["Action", "Expected Results"]:
-			steps = self.tests_data[test_name].get(field, [])
-			for step in steps:
-				words = step.split()
-				for word in words:
-					# Verificăm existența parametrului în parameters.json
-					for category, param_dict in self.parameters_data.items():
-						if word in param_dict:
-							value_dict = param_dict[word]
-							for variant, value in value_dict.items():
-								if value != "":
-									variant_groups = variant_groups if 'variant_groups' in locals() else {}
-									variant_groups.setdefault(variant, set()).add(f"{word} = {value}")
-
-		# Construim structura Test Data Description în format listă
-		new_test_data_description = []
-		for variant, values in variant_groups.items():
-			new_test_data_description.append(f"{variant}:")
-			new_test_data_description.extend(sorted(values))
-			new_test_data_description.append("")  # Adaugăm spațiu după fiecare variantă
+		new_test_data_description = compute_test_data_description(self.tests_data[test_name], self.parameters_data)
 
 		# Verificăm dacă există schimbări față de versiunea actuală
 		current_data_description = self.tests_data[test_name].get("Test Data Description", [])
@@ -924,10 +1985,10 @@ class TestsPage(QWidget):
 
 		print(f"🔹 Checking if Description for TCG needs an update for: {test_name}")
 
-		actions = self.tests_data[test_name].get("Action", [])
-		expected_results = self.tests_data[test_name].get("Expected Results", [])
+		description_tcg = compute_description_tcg(self.tests_data[test_name], self.commands_data, self.parameters_data,
+		                                          self.precondition_lines(test_name))
 
-		if not actions or not expected_results:
+		if not description_tcg:
 			if self.tests_data[test_name].get("Description TCG", []):  # ✅ Doar dacă nu este deja gol
 				self.tests_data[test_name]["Description TCG"] = []
 				self.save_tests()
@@ -935,20 +1996,6 @@ class TestsPage(QWidget):
 				print(f"✅ Cleared Description for TCG for {test_name}.")
 			return
 
-		description_tcg = ["PRECONDITION:"]
-
-		precondition_text = self.tests_data[test_name].get("Precondition", "").strip()
-		if precondition_text and "call" not in precondition_text.lower():
-			description_tcg.append(f"1. {precondition_text}")
-			description_tcg.append("")
-
-		description_tcg.append("ACTION:")
-
-		for index, (action, expected) in enumerate(zip(actions, expected_results), start=1):
-			formatted_action = self.format_step(action)
-			formatted_expected = self.format_step(expected)
-			description_tcg.append(f"{index}. {formatted_action} {formatted_expected}")
-
 		# ✅ Verificăm dacă `Description for TCG` există și este diferit
 		if self.tests_data[test_name].get("Description TCG", []) == description_tcg:
 			print(f"✅ No changes detected in Description for TCG for {test_name}, skipping update.")
@@ -961,22 +2008,6 @@ class TestsPage(QWidget):
 
 		print(f"✅ Updated Description for TCG for {test_name}: {description_tcg}")
 
-	def format_step(self, step_text):
-		"""Înlocuiește parametrii dintr-un test step cu versiunea lor încadrată între ' '."""
-		words = step_text.split()
-		formatted_words = []
-
-		for word in words:
-			# Verificăm dacă acest cuvânt este un parametru valid în `parameters.json`
-			for category, param_dict in self.parameters_data.items():
-				if word in param_dict:  # ✅ Parametru detectat, adăugăm ' '
-					word = f"'{word}'"
-					break
-
-			formatted_words.append(word)
-
-		return " ".join(formatted_words)  # ✅ Reconstruim fraza cu parametrii formatați
-
 	def save_edited_test(self, row, column):
 		"""Salvează automat modificările făcute de user în `Description` și `Precondition` și actualizează doar acel test în UI."""
 
@@ -1000,6 +2031,12 @@ class TestsPage(QWidget):
 		print(f"📝 Updating '{field_name}' for '{test_name}' with: {new_value}")
 
 		self.tests_data[test_name][field_name] = new_value
+		self.preconditions.update_test(test_name, self.tests_data[test_name])
+		if field_name == "Precondition":
+			# ✅ Liniile `call <test>` schimbă `Description TCG` al testului și al celor care îl apelează
+			self.apply_test_updates({test_name: derive_test(self.tests_data[test_name], self.commands_data,
+			                                                self.parameters_data, self.precondition_lines(test_name))})
+			return
 		self.save_tests()
 
 		# 🔹 Actualizăm doar testul modificat în UI
@@ -1037,6 +2074,11 @@ class TestsPage(QWidget):
 			new_tests_data.update({k: self.tests_data[k] for k in test_names[index:]})  # ✅ Păstrăm restul testelor
 
 			self.tests_data = new_tests_data
+			self.step_index.index_test(new_test_name, new_test_data)
+			self.preconditions.update_test(new_test_name, new_test_data)
+			self.validate_later([new_test_name])
+			if self.suites.add_test_after(new_test_name, test_name):
+				self.suites_modified([self.suites.folder_of(new_test_name)])
 			print(f"✅ Test '{new_test_name}' added to tests_data after '{test_name}'.")
 
 			# 🔹 Salvăm modificările
@@ -1087,12 +2129,26 @@ class TestsPage(QWidget):
 
 		# 🔹 Redenumim testul în JSON și păstrăm toate datele
 		self.tests_data[new_test_name] = self.tests_data.pop(old_test_name)
-
-		# 🔹 Salvăm modificările
-		self.save_tests()
+		self.step_index.remove_test(old_test_name)
+		self.step_index.index_test(new_test_name, self.tests_data[new_test_name])
+		self.preconditions.remove_test(old_test_name)  # ✅ Testele care apelau vechiul nume îl raportează ca lipsă
+		self.preconditions.update_test(new_test_name, self.tests_data[new_test_name])
+		self.validate_later([old_test_name, new_test_name])
+		if self.suites.rename_test(old_test_name, new_test_name):
+			self.suites_modified([self.suites.folder_of(new_test_name)])
 
 		# 🔹 Actualizăm doar rândul în UI
 		self.test_table.item(row_position, 0).setText(new_test_name)
+		if old_test_name in self.hidden_tests:
+			self.hidden_tests.discard(old_test_name)  # ✅ Rândul rămâne ascuns, acum sub noul nume
+			self.hidden_tests.add(new_test_name)
+
+		# ✅ Testele care apelau vechiul nume (acum lipsă) sau deja pe cel nou își regenerează `Description TCG`
+		callers = self.derive_calling_tests([old_test_name, new_test_name])
+		if callers:
+			self.apply_test_updates(callers)  # ✅ Include și salvarea
+		else:
+			self.save_tests()
 
 	def run_and_close_menu(self, function, test_name, menu):
 		"""Execută funcția selectată și închide meniul de click dreapta."""
@@ -1102,23 +2158,25 @@ class TestsPage(QWidget):
 	def update_test_after_step_edit(self, test_name):
 		"""Actualizează doar testul modificat în UI după modificarea unui test step."""
 
-		# 🔹 Salvăm testele și actualizăm doar testul modificat
-		self.save_tests()
-		self.update_test_in_ui(test_name)
+		# 🔹 Prin batch: câmpurile derivate ale testului și testele care îl apelează (`call <test>`) sunt
+		# re-generate, salvate o singură dată, iar rândul este reconstruit o singură dată
+		self.apply_test_updates({test_name: derive_test(self.tests_data[test_name], self.commands_data,
+		                                                self.parameters_data, self.precondition_lines(test_name))})
 
 		print(f"✅ UI updated after test step modification for '{test_name}'.")
 
-	def update_test_in_ui(self, test_name):
-		"""Actualizează un test existent în UI fără să reîncarce toată lista."""
+	def update_test_in_ui(self, test_name, row_position=None):
+		"""Actualizează un test existent în UI fără să reîncarce toată lista (`row_position` evită căutarea rândului)."""
 
 		try:
 			print(f"🔄 Updating test '{test_name}' in UI...")
 
-			row_position = -1
-			for row in range(self.test_table.rowCount()):
-				if self.test_table.item(row, 0) and self.test_table.item(row, 0).text().strip() == test_name:
-					row_position = row
-					break
+			if row_position is None:
+				row_position = -1
+				for row in range(self.test_table.rowCount()):
+					if self.test_table.item(row, 0) and self.test_table.item(row, 0).text().strip() == test_name:
+						row_position = row
+						break
 
 			if row_position == -1:
 				print(f"❌ ERROR: Test '{test_name}' not found in UI! Skipping update.")
@@ -1147,9 +2205,7 @@ class TestsPage(QWidget):
 					print(f"⚠️ WARNING: Column {col} is None for test '{test_name}', skipping update.")
 
 			# 🔹 Reîmprospătăm `Action` și `Expected Results`
-			action_table = TestStepTable(self.tests_data[test_name].get("Action", []), self.test_table, row_position)
-			expected_table = TestStepTable(self.tests_data[test_name].get("Expected Results", []), self.test_table,
-			                               row_position)
+			action_table, expected_table = self.create_step_tables(self.tests_data[test_name], row_position)
 
 			self.test_table.setCellWidget(row_position, 3, action_table)
 			self.test_table.setCellWidget(row_position, 4, expected_table)
@@ -1161,15 +2217,383 @@ class TestsPage(QWidget):
 			import traceback
 			traceback.print_exc()
 
+	def update_command_steps(self, command_name):
+		"""Re-generează step-urile construite din `command_name` după ce comanda a fost editată."""
+		if not self.initial_load_done:
+			# ✅ Testele se încarcă încă; actualizarea rulează la finalul încărcării
+			self.pending_updates.append(lambda: self.update_command_steps(command_name))
+			return
+
+		# 🔹 Reîncărcăm comenzile și parametrii în fundal, apoi calculăm modificările
+		self.load_commands(lambda: self.load_parameters(lambda: self.preview_command_update([command_name])))
+
+	def preview_command_update(self, command_names):
+		"""Arată testele afectate de editarea comenzilor și aplică modificările într-un singur batch."""
+		affected = set()
+		for command_name in command_names:
+			affected |= self.step_index.tests_using_command(command_name)
+		affected |= self.preconditions.tests_calling(affected)  # ✅ Și testele care le apelează în precondiție
+		updated_tests = {}
+		changes = {}
+		for test_name in self.tests_data:
+			if test_name not in affected:
+				continue
+			updated = derive_test(self.tests_data[test_name], self.commands_data, self.parameters_data,
+			                      self.precondition_lines(test_name))
+			test_changes = changed_fields(self.tests_data[test_name], updated)
+			if test_changes:
+				updated_tests[test_name] = updated
+				changes[test_name] = test_changes
+
+		label = ", ".join(f"'{command_name}'" for command_name in command_names)
+		if not updated_tests:
+			print(f"✅ No test steps need an update for command(s) {label}.")
+			return
+
+		step_count = sum(
+			1 for test_name in updated_tests for step in self.tests_data[test_name]["Steps"]
+			if step.get("Command") in command_names)
+		dialog = UpdateTestsPreviewDialog(
+			"Update Tests From Command",
+			f"Command {label} changed: {step_count} step(s) in {len(updated_tests)} test(s) will be updated.",
+			changes)
+		if not dialog.exec_():
+			print(f"❌ Update of tests using {label} canceled.")
+			return
+
+		self.apply_test_updates(updated_tests)
+
+	def rename_parameter(self, category, old_name, new_name):
+		"""Propagă redenumirea unui parametru în toate testele care îl folosesc, într-o singură tranzacție."""
+		if not self.initial_load_done:
+			self.pending_updates.append(lambda: self.rename_parameter(category, old_name, new_name))
+			return
+
+		# 🔹 Parametrii sunt reîncărcați (noul nume este deja salvat), apoi rescriem testele afectate
+		self.load_parameters(lambda: self.apply_parameter_rename(category, old_name, new_name))
+
+	def apply_parameter_rename(self, category, old_name, new_name):
+		"""Rescrie step-urile și câmpurile derivate ale testelor găsite prin indexul de utilizare."""
+		# ✅ Textul liber este rescris doar dacă vechiul nume nu mai există în nicio altă categorie
+		rewrite_text = not any(old_name in params for params in self.parameters_data.values())
+		affected = self.step_index.tests_using_parameter(category, old_name, include_text=rewrite_text)
+
+		# 🔹 Calculăm toate testele noi înainte de a modifica ceva; aplicarea se face dintr-o dată
+		renamed_tests = {}
+		for test_name in affected:
+			if test_name not in self.tests_data:
+				continue
+			renamed = rename_parameter_in_test(self.tests_data[test_name], category, old_name, new_name, rewrite_text)
+			if renamed is not None:
+				renamed_tests[test_name] = renamed
+
+		# ✅ Precondițiile `call` sunt expandate din testele deja redenumite; apelanții lor sunt regenerați și ei
+		tests_view = ChainMap(renamed_tests, self.tests_data)
+		for test_name in renamed_tests:
+			self.preconditions.invalidate(test_name)
+		updated_tests = {}
+		for test_name in set(renamed_tests) | self.preconditions.tests_calling(renamed_tests):
+			if test_name not in tests_view:
+				continue
+			updated = derive_test(tests_view[test_name], self.commands_data, self.parameters_data,
+			                      self.precondition_lines(test_name, tests_view))
+			if test_name in renamed_tests or changed_fields(self.tests_data[test_name], updated):
+				updated_tests[test_name] = updated
+
+		if updated_tests:
+			self.apply_test_updates(updated_tests)
+		print(f"✅ Renamed parameter '{old_name}' to '{new_name}' in {len(updated_tests)} test(s).")
+
+	def precondition_lines(self, test_name, tests_data=None):
+		"""Precondiția testului cu liniile `call <test>` expandate (memoizat per test apelat)."""
+		tests_data = self.tests_data if tests_data is None else tests_data
+		return self.preconditions.precondition_lines(
+			test_name, tests_data[test_name], tests_data, self.commands_data, self.parameters_data)
+
+	def derive_calling_tests(self, test_names, exclude=()):
+		"""Testele care apelează `test_names` (direct sau indirect), re-derivate; doar cele care se schimbă."""
+		updated_tests = {}
+		for test_name in self.preconditions.tests_calling(test_names):
+			if test_name in exclude or test_name not in self.tests_data:
+				continue
+			updated = derive_test(self.tests_data[test_name], self.commands_data, self.parameters_data,
+			                      self.precondition_lines(test_name))
+			if changed_fields(self.tests_data[test_name], updated):
+				updated_tests[test_name] = updated
+		return updated_tests
+
+	def apply_test_updates(self, updated_tests):
+		"""Înlocuiește testele modificate în bloc: o singură salvare, apoi actualizarea rândurilor din UI."""
+		def replace_tests(tests):
+			for test_name, test_data in tests.items():
+				self.tests_data[test_name] = test_data
+				self.step_index.index_test(test_name, test_data)
+				self.preconditions.update_test(test_name, test_data)
+				self.validate_later([test_name])
+
+		replace_tests(updated_tests)
+		# ✅ Testele care le apelează prin `call <test>` își regenerează `Description TCG` în același batch
+		callers = self.derive_calling_tests(updated_tests, exclude=updated_tests)
+		replace_tests(callers)
+		updated_tests = {**updated_tests, **callers}
+
+		self.save_tests()
+
+		rows = {}
+		for row in range(self.test_table.rowCount()):
+			item = self.test_table.item(row, 0)
+			if item and item.text().strip() in updated_tests:
+				rows[item.text().strip()] = row
+
+		# ✅ După încărcare, header-ul vertical își ajustează singur rândurile (ResizeToContents) o singură dată,
+		# la următorul layout; redimensionarea explicită a fiecărui rând recalcula tabelul pentru fiecare test
+		resize_rows = self.test_table.verticalHeader().sectionResizeMode(0) != QHeaderView.ResizeToContents
+		self.test_table.blockSignals(True)  # ✅ Actualizarea UI nu trebuie să declanșeze `save_edited_test`
+		self.test_table.setUpdatesEnabled(False)
+		try:
+			for test_name, row in rows.items():
+				self.update_test_in_ui(test_name, row)
+				if resize_rows:
+					self.test_table.resizeRowToContents(row)
+		finally:
+			self.test_table.setUpdatesEnabled(True)
+			self.test_table.blockSignals(False)
+
+		print(f"✅ Updated {len(updated_tests)} test(s) in one batch.")
+
 	def filter_tests(self, text, table):
-		"""Filters tests based on search input."""
+		"""Filters tests based on search input and on the suite folder selected in the tree."""
 		text = text.strip().lower()  # Convert search text to lowercase
 
-		for row in range(table.rowCount()):
-			test_name_item = table.item(row, 0)  # Get the test name
-			if test_name_item:
-				test_name = test_name_item.text().strip().lower()
-				table.setRowHidden(row, text not in test_name)  # ✅ Hide rows that don't match
+		# ✅ Membrii folderului vin din arborele de suite (cache pe subarbore), nu dintr-o parcurgere a tabelului
+		folder_tests = self.suites.subtree_tests(self.current_folder) if self.current_folder in self.suites else None
+		candidates = self.tests_data.keys() if folder_tests is None else folder_tests
+		visible = {test_name for test_name in candidates if text in test_name.lower()} if text else candidates
+		hidden = self.tests_data.keys() - visible
+
+		# ✅ Doar rândurile care își schimbă starea sunt atinse (diferența față de filtrul anterior)
+		to_hide = hidden - self.hidden_tests
+		to_show = (self.hidden_tests - hidden) & self.tests_data.keys()
+		table.setUpdatesEnabled(False)
+		try:
+			for test_names, hide in ((to_hide, True), (to_show, False)):
+				for test_name in test_names:
+					row = self.test_row(test_name)
+					if row is not None:
+						table.setRowHidden(row, hide)
+		finally:
+			table.setUpdatesEnabled(True)
+		self.hidden_tests = hidden
+
+	def test_row(self, test_name):
+		"""Rândul testului în tabel (sau None); harta nume -> rând este reconstruită doar după ce rândurile s-au mutat."""
+		row = self.test_rows.get(test_name)
+		item = self.test_table.item(row, 0) if row is not None else None
+		if item is not None and item.text().strip() == test_name:
+			return row
+		if test_name not in self.tests_data:
+			return None
+		self.test_rows = {}
+		for row in range(self.test_table.rowCount()):
+			item = self.test_table.item(row, 0)
+			if item:
+				self.test_rows[item.text().strip()] = row
+		return self.test_rows.get(test_name)
+
+	# ----------------- Test Suites -----------------
+	def apply_suites(self, suites_data):
+		"""Încarcă arborele de suite din `suites.json`; doar nivelul de sus este afișat."""
+		self.suites = SuiteTree(suites_data)
+		if self.initial_load_done and self.suites.retain(self.tests_data):
+			self.save_suites()
+		self.suite_panel.rebuild(self.suites)
+		print(f"✅ Suites loaded successfully ({len(self.suites.nodes) - 1} folders).")
+
+	# ----------------- Validation -----------------
+	def start_full_validation(self):
+		"""Prima scanare completă, în fundal (în procese separate pentru specificații mari)."""
+		tests_data = copy_json_data(self.tests_data)
+		commands_data = copy_json_data(self.commands_data)
+		parameters_data = copy_json_data(self.parameters_data)
+		self.validation_scanning = True
+
+		def apply(problems):
+			self.validation_scanning = False
+			self.problems_panel.update_problems(self.validation.load(problems))
+			self.run_validation()  # ✅ Modificările făcute în timpul scanării
+			print(f"✅ Validation finished: {self.validation.count()} problem(s).")
+
+		def failed(error):
+			self.validation_scanning = False
+			print(f"❌ ERROR validating tests: {error}")
+
+		io_executor().submit(lambda: full_scan(tests_data, commands_data, parameters_data), apply, failed,
+		                     key="validation", description="Validating references")
+
+	def validate_later(self, test_names=()):
+		"""Marchează testele modificate; verificarea lor rulează grupat, după ce UI-ul a fost actualizat."""
+		self.validation.mark_tests(test_names)
+		if self.initial_load_done and not self.validation_scanning:
+			self.validation_timer.start()
+
+	def run_validation(self):
+		if self.validation_scanning:
+			return
+		changes = self.validation.run(self.tests_data, self.commands_data, self.parameters_data)
+		if changes:
+			self.problems_panel.update_problems(changes)
+
+	# ----------------- External Changes -----------------
+	def external_file_changed(self, path):
+		"""Un fișier de date a fost modificat pe disc; salvările proprii sunt ignorate (aceeași versiune)."""
+		if not self.initial_load_done:
+			if path not in self.pending_external_paths:
+				self.pending_external_paths.add(path)
+				self.pending_updates.append(lambda: self.external_file_changed(path))
+			return
+
+		if path == os.path.abspath(self.json_file):
+			self.reload_external_tests()
+		elif path == os.path.abspath(self.suites_file):
+			io_executor().submit_read(self.suites_file, self.suites_shared_file.read_external_change,
+			                          self.apply_external_suites)
+		elif path == os.path.abspath(self.commands_file):
+			previous_commands = self.commands_data
+			self.load_commands(lambda: self.load_parameters(lambda: self.apply_external_commands(previous_commands)))
+		elif path == os.path.abspath(self.parameters_file):
+			self.load_parameters()
+
+	def apply_external_commands(self, previous_commands):
+		"""Comenzile modificate pe disc re-generează step-urile testelor care le folosesc (ca o editare în aplicație)."""
+		added, changed, removed = diff_entries(previous_commands, self.commands_data)
+		command_names = [command_name for command_name, in added + changed + removed]
+		if command_names:
+			self.preview_command_update(command_names)
+
+	def reload_external_tests(self, only=None):
+		"""Citește tests.json în fundal și aplică doar testele modificate (`only`: doar aceste teste)."""
+		io_executor().submit_read(
+			self.json_file, lambda: self.tests_file.read_external_change(force=only is not None),
+			lambda change: self.apply_external_tests(change, only),
+			on_error=lambda e: print(f"❌ ERROR reloading tests: {e}"))
+
+	def apply_external_tests(self, change, only=None):
+		"""Aplică diferențele dintre tests.json și testele din memorie: teste adăugate, modificate, șterse."""
+		if change is None:
+			return
+		if self.save_scheduled and only is None:
+			return  # ✅ Salvarea programată îmbină modificările de pe disc și le preia apoi (`tests_saved`)
+
+		tests_data, pristine, stamp = change
+		added, changed, removed = diff_entries(self.tests_data, tests_data)
+		if only is not None:
+			only = set(only)
+			added, changed, removed = ([key for key in keys if describe_key(key) in only]
+			                           for keys in (added, changed, removed))
+
+		removed_names = {test_name for test_name, in removed}
+		for test_name in removed_names:
+			del self.tests_data[test_name]
+			self.step_index.remove_test(test_name)
+			self.preconditions.remove_test(test_name)
+			self.validate_later([test_name])
+		for row in reversed(range(self.test_table.rowCount())):
+			item = self.test_table.item(row, 0)
+			if item and item.text().strip() in removed_names:
+				self.test_table.removeRow(row)
+
+		for test_name, in added:
+			test_data = tests_data[test_name]
+			migrate_test(test_data, self.commands_data, self.parameters_data)
+			self.tests_data[test_name] = test_data
+			self.step_index.index_test(test_name, test_data)
+			self.preconditions.update_test(test_name, test_data)
+			self.validate_later([test_name])
+			self.test_table.blockSignals(True)
+			self.add_test_to_ui(test_name, test_data)
+			self.test_table.blockSignals(False)
+
+		updated_tests = {}
+		for test_name, in changed:
+			migrate_test(tests_data[test_name], self.commands_data, self.parameters_data)
+			updated_tests[test_name] = tests_data[test_name]
+
+		# ✅ Versiunea citită devine baza pentru următoarea salvare (înainte de salvarea din `apply_test_updates`)
+		io_executor().submit_read(self.json_file, lambda: self.tests_file.remember(pristine, stamp),
+		                          description="Remembering tests.json version")
+		if updated_tests:
+			self.apply_test_updates(updated_tests)
+		if added and (self.search_bar.text() or self.current_folder is not None):
+			self.filter_tests(self.search_bar.text(), self.test_table)
+
+		print(f"🔄 tests.json changed on disk: {len(added)} added, {len(changed)} changed, {len(removed)} removed.")
+
+	def apply_external_suites(self, change):
+		"""Preia suitele modificate pe disc (arborele este mic; doar nivelul de sus este reconstruit)."""
+		if change is None:
+			return
+		suites_data, pristine, stamp = change
+		io_executor().submit_read(self.suites_file, lambda: self.suites_shared_file.remember(pristine, stamp),
+		                          description="Remembering suites.json version")
+		current_folder = self.current_folder
+		self.apply_suites(suites_data)
+		if current_folder in self.suites:
+			self.suite_panel.select_folder(current_folder)
+
+	def read_suites(self):
+		"""Citește `suites.json` (în thread-ul de I/O); un fișier lipsă înseamnă că nu există încă suite."""
+		if not os.path.exists(self.suites_file):
+			return {}
+		try:
+			return self.suites_shared_file.read()
+		except json.JSONDecodeError:
+			print(f"❌ Error: JSON file '{self.suites_file}' is corrupted. Returning empty dictionary.")
+			return {}
+
+	def save_suites(self):
+		"""Salvează arborele de suite în fundal."""
+		suites_data = self.suites.to_dict()
+		io_executor().submit_write(self.suites_file, lambda: self.suites_shared_file.write(suites_data),
+		                           on_done=lambda result: report_save("Suites", result, self))
+
+	def suites_modified(self, paths):
+		"""Salvează suitele, actualizează nodurile afișate și re-aplică filtrul de folder."""
+		self.save_suites()
+		for path in paths:
+			if path != ROOT and path in self.suites:
+				self.suite_panel.refresh(path)
+		if self.current_folder is not None:
+			self.filter_tests(self.search_bar.text(), self.test_table)
+
+	def select_folder(self, path):
+		"""Afișează în tabel doar testele din folderul selectat (și subfolderele lui)."""
+		if path == self.current_folder:
+			return
+		self.current_folder = path
+		self.filter_tests(self.search_bar.text(), self.test_table)
+
+	def move_test_to_suite(self, test_name):
+		"""Mută testul într-un folder ales de user."""
+		no_suite = "(No Suite)"
+		folders = [no_suite] + self.suites.all_folders()
+		current = self.suites.folder_of(test_name)
+		folder, ok = QInputDialog.getItem(self, "Move to Suite", f"Move '{test_name}' to:", folders,
+		                                  folders.index(current) if current in folders else 0, False)
+		if not ok:
+			return
+
+		folder = ROOT if folder == no_suite else folder
+		self.suites.move_tests([test_name], folder)
+		self.suites_modified([path for path in (current, folder) if path])
+
+	def show_test(self, test_name):
+		"""Selectează și afișează în tabel testul ales din arbore."""
+		for row in range(self.test_table.rowCount()):
+			item = self.test_table.item(row, 0)
+			if item and item.text().strip() == test_name:
+				self.test_table.selectRow(row)
+				self.test_table.scrollToItem(item)
+				return
 
 	def get_resource_path(self, relative_path):
 		"""Get the correct path whether running as a script or an executable."""
@@ -1,9 +1,52 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget
-from pages.tests_page import TestsPage
-from pages.parameters_page import ParametersPage
-from pages.generic_command_page import GenericCommandPage
+from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, QLabel
+from PyQt5.QtCore import pyqtSignal
+from utils.io_executor import io_executor
+from utils.startup_profiler import profiler
 import sys
 
+
+def create_tests_page():
+    with profiler.measure("import", "pages.tests_page"):
+        from pages.tests_page import TestsPage
+    return TestsPage()
+
+
+def create_parameters_page():
+    with profiler.measure("import", "pages.parameters_page"):
+        from pages.parameters_page import ParametersPage
+    return ParametersPage()
+
+
+def create_commands_page():
+    with profiler.measure("import", "pages.generic_command_page"):
+        from pages.generic_command_page import GenericCommandPage
+    return GenericCommandPage()
+
+
+class LazyTab(QWidget):
+    """Placeholder pentru un tab; pagina reală este construită abia la prima activare."""
+    page_created = pyqtSignal(object)
+
+    def __init__(self, name, factory):
+        super().__init__()
+        self.name = name
+        self.factory = factory
+        self.page = None
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+    def ensure_page(self):
+        """Construiește pagina dacă nu există încă și o returnează."""
+        if self.page is None:
+            with profiler.measure("construct", self.name):
+                self.page = self.factory()
+            self.layout().addWidget(self.page)
+            self.page_created.emit(self.page)
+        return self.page
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -15,14 +58,67 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        # Adăugăm paginile în tab-uri
-        self.tests_page = TestsPage()
-        self.parameters_page = ParametersPage()
-        self.commands_page = GenericCommandPage()
+        # Adăugăm paginile în tab-uri; fiecare pagină se construiește la prima activare
+        self.lazy_tabs = {
+            "Tests": LazyTab("TestsPage", create_tests_page),
+            "Parameters": LazyTab("ParametersPage", create_parameters_page),
+            "Generic Commands": LazyTab("GenericCommandPage", create_commands_page),
+        }
+        for title, lazy_tab in self.lazy_tabs.items():
+            self.tabs.addTab(lazy_tab, title)
+
+        # 🔹 Legăturile dintre pagini se fac când pagina sursă este construită
+        self.lazy_tabs["Generic Commands"].page_created.connect(
+            lambda page: page.command_changed.connect(self.update_command_steps))
+        self.lazy_tabs["Parameters"].page_created.connect(
+            lambda page: page.parameter_renamed.connect(self.rename_parameter))
+
+        # 🔹 Indicator în status bar pentru operațiile I/O în așteptare
+        self.io_status = QLabel()
+        self.statusBar().addPermanentWidget(self.io_status)
+        io_executor().pending_changed.connect(self.update_io_status)
+        io_executor().task_failed.connect(
+            lambda description, error: self.statusBar().showMessage(f"❌ {description} failed: {error}", 10000))
+
+        self.tabs.currentChanged.connect(self.activate_tab)
+        self.activate_tab(self.tabs.currentIndex())
+
+    def update_io_status(self, pending):
+        self.io_status.setText(f"⏳ {pending} pending I/O operation(s)" if pending else "")
+
+    def closeEvent(self, event):
+        """Așteaptă ca toate salvările în curs să ajungă pe disc înainte de închidere."""
+        for lazy_tab in self.lazy_tabs.values():
+            if lazy_tab.page is not None and hasattr(lazy_tab.page, "flush_pending_io"):
+                lazy_tab.page.flush_pending_io()
+        io_executor().wait_until_idle()
+        super().closeEvent(event)
+
+    def update_command_steps(self, command_name):
+        """O comandă a fost editată: testele care o folosesc sunt re-generate (cu previzualizare)."""
+        self.tests_page.update_command_steps(command_name)
+
+    def rename_parameter(self, category, old_name, new_name):
+        """Un parametru a fost redenumit: testele care îl folosesc sunt rescrise."""
+        self.tests_page.rename_parameter(category, old_name, new_name)
+
+    def activate_tab(self, index):
+        """Construiește pagina tab-ului activ la prima afișare."""
+        lazy_tab = self.tabs.widget(index)
+        if isinstance(lazy_tab, LazyTab):
+            lazy_tab.ensure_page()
+
+    @property
+    def tests_page(self):
+        return self.lazy_tabs["Tests"].ensure_page()
+
+    @property
+    def parameters_page(self):
+        return self.lazy_tabs["Parameters"].ensure_page()
 
-        self.tabs.addTab(self.tests_page, "Tests")
-        self.tabs.addTab(self.parameters_page, "Parameters")
-        self.tabs.addTab(self.commands_page, "Generic Commands")
+    @property
+    def commands_page(self):
+        return self.lazy_tabs["Generic Commands"].ensure_page()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,268 @@
+"""
+Command palette: a test step written on one line.
+
+The palette searches a single in-memory index of the generic commands and of
+every parameter in parameters.json. A line is a list of space separated tokens,
+each naming a command or a parameter, fuzzily:
+
+    sendreq reqdef resdef2      ->  Send_req_check_response
+                                    {Request: Req_Default, Response: Res_Default_2}
+
+A parameter binds the category it belongs to, so the tokens can come in any
+order; once a command is chosen, only parameters of its unbound categories are
+candidates, and before that only commands using the categories bound so far.
+The line is a complete step when the command and all its categories are bound.
+
+A token matches a name that contains its characters in order (case-insensitive).
+Candidates come in this order: exact name, recently used, names starting with
+the token, names containing it once separators are ignored ("reqdef" in
+Req_Default), then the other matches; the last two groups are ranked by how
+compactly the token matches (shortest span, earliest, shortest name).
+
+Lookups must fit in one frame with ~100k parameters, so they never loop over the
+whole index in Python. For every character and count there is a big integer with
+one byte per entry (1 = the entry's name contains the character at least that
+many times); the entries containing all the characters of a token, restricted to
+the allowed kinds and categories, are a few integer ANDs away, and only those are
+checked with the fuzzy pattern until enough candidates are found. Names with
+the token contiguous (separators ignored) are found with `str.find` over one
+joined string, wherever they sit in the index. The other matches are ranked
+with a bounded heap; only a token matching more than RANK_LIMIT names (almost
+every name) is ranked over the first RANK_LIMIT of them, in index order.
+"""
+import bisect
+import re
+from collections import Counter, namedtuple
+from functools import lru_cache
+import heapq
+from itertools import accumulate, compress, islice, repeat
+from operator import attrgetter, ge, methodcaller
+
+from utils.templates import compile_command
+from utils.test_steps import command_step
+
+COMMAND = "command"
+PARAMETER = "parameter"
+LIMIT = 50
+PREFIX_SCAN = 2000  # 🔹 Câte nume cu prefixul token-ului sunt examinate cel mult
+RECENT_SIZE = 100
+RANK_LIMIT = 5000  # 🔹 Câte potriviri (restul, în ordinea indexului) sunt ordonate cel mult
+SEPARATORS = re.compile(r"[\W_]+")
+
+Entry = namedtuple("Entry", "kind category name")
+PaletteLine = namedtuple("PaletteLine", "command bindings token candidates unmatched")
+
+
+@lru_cache(maxsize=256)
+def fuzzy_pattern(token):
+    """The characters of `token` in order; `[^c]*c` never backtracks into an earlier match of `c`."""
+    if not token:
+        return re.compile("")
+    return re.compile(re.escape(token[0]) + "".join(f"[^{re.escape(c)}]*{re.escape(c)}" for c in token[1:]))
+
+
+def match_score(pattern, key):
+    """Shorter matched span first, then earlier match, then shorter name."""
+    start, end = pattern.search(key).span()
+    return end - start, start, len(key)
+
+
+def compact_key(key):
+    """`key` without separators: "req_default" -> "reqdefault"."""
+    return SEPARATORS.sub("", key)
+
+
+def entry_label(entry):
+    return f"⚙️ {entry.name}" if entry.kind == COMMAND else f"🔹 {entry.name}  ({entry.category})"
+
+
+class PaletteIndex:
+    """
+    Commands and parameters searchable by fuzzy token; `recent` is the shared most-recently-used list.
+
+    Building the index for ~100k parameters takes about a second, so pages build it in the background and
+    keep it until the commands or parameters are reloaded.
+    """
+
+    def __init__(self, commands_data, parameters_data, recent=None):
+        self.entries = [Entry(COMMAND, None, name) for name in commands_data]
+        self.command_count = len(self.entries)
+        self.command_categories = {name: compile_command(command).categories
+                                   for name, command in commands_data.items()}
+
+        category_ranges = {}
+        for category, params in parameters_data.items():
+            start = len(self.entries)
+            self.entries.extend(Entry(PARAMETER, category, name) for name in params)
+            category_ranges[category] = (start, len(self.entries))
+
+        self.keys = [entry.name.casefold() for entry in self.entries]
+        self.ids = {entry: number for number, entry in enumerate(self.entries)}
+        self.exact = {}
+        for number, key in enumerate(self.keys):
+            self.exact.setdefault(key, []).append(number)
+        self.sorted_keys = sorted(zip(self.keys, range(len(self.keys))))
+        # 🔹 Numele fără separatori, unite într-un singur text; `compact_starts[id]` = poziția intrării în el
+        compact_keys = list(map(compact_key, self.keys))
+        self.compact_text = "\n".join(compact_keys)
+        self.compact_starts = [0]
+        self.compact_starts.extend(accumulate(length + 1 for length in map(len, compact_keys)))
+        self.recent = recent if recent is not None else []
+
+        # 🔹 (caracter, n) -> intrările al căror nume conține caracterul de cel puțin n ori (un octet per intrare)
+        self.character_masks = {}
+        for character in set("".join(self.keys)):
+            counts = list(map(str.count, self.keys, repeat(character)))
+            for times in range(1, max(counts) + 1):
+                self.character_masks[character, times] = int.from_bytes(bytes(map(ge, counts, repeat(times))),
+                                                                        "little")
+        self.category_masks = {category: self.range_mask(start, end)
+                               for category, (start, end) in category_ranges.items()}
+
+    def range_mask(self, start, end):
+        bytemap = bytearray(len(self.entries))
+        bytemap[start:end] = b"\x01" * (end - start)
+        return int.from_bytes(bytemap, "little")
+
+    def allowed_mask(self, command, bindings):
+        """The entries that may follow a line with `command` (or None) and `bindings` so far."""
+        if command is not None:
+            mask = 0
+            for category in self.command_categories.get(command, []):
+                if category not in bindings:
+                    mask |= self.category_masks.get(category, 0)
+            return mask
+
+        bytemap = bytearray(len(self.entries))
+        open_categories = set()
+        for number in range(self.command_count):
+            categories = self.command_categories[self.entries[number].name]
+            if all(category in categories for category in bindings):
+                bytemap[number] = 1
+                open_categories.update(category for category in categories if category not in bindings)
+        mask = int.from_bytes(bytemap, "little")
+        for category in open_categories:
+            mask |= self.category_masks.get(category, 0)
+        return mask
+
+    def search(self, token, allowed, limit=LIMIT):
+        """Ids of the allowed entries matching `token`, best first (see the module docstring)."""
+        token = token.casefold()
+        pattern = fuzzy_pattern(token)
+        mask = allowed
+        for character, times in Counter(token).items():
+            if not mask:
+                break
+            mask &= self.character_masks.get((character, times), 0)
+        if not mask:
+            return []
+        flags = mask.to_bytes(len(self.entries), "little")  # ✅ flags[id] în O(1), fără deplasări pe întregul mare
+
+        results = []
+        seen = set()
+
+        def add(number):
+            if number not in seen and pattern.search(self.keys[number]):
+                seen.add(number)
+                results.append(number)
+
+        for number in self.exact.get(token, []):
+            if flags[number]:
+                add(number)
+        for entry in self.recent:
+            number = self.ids.get(entry)
+            if number is not None and flags[number]:
+                add(number)
+                if len(results) >= limit:
+                    return results
+
+        start = bisect.bisect_left(self.sorted_keys, (token, -1))
+        for position in range(start, min(start + PREFIX_SCAN, len(self.sorted_keys))):
+            key, number = self.sorted_keys[position]
+            if not key.startswith(token) or len(results) >= limit:
+                break
+            if flags[number]:
+                add(number)
+
+        if len(results) >= limit:
+            return results
+
+        # ✅ Token-ul întreg în numele fără separatori ("reqdef" -> Req_Default), oriunde ar fi în index
+        contiguous = []
+        compact_token = compact_key(token)
+        position = self.compact_text.find(compact_token) if compact_token else -1
+        for _ in range(PREFIX_SCAN):
+            if position == -1:
+                break
+            number = bisect.bisect_right(self.compact_starts, position) - 1
+            if flags[number] and number not in seen and pattern.search(self.keys[number]):
+                seen.add(number)
+                contiguous.append(number)
+            position = self.compact_text.find(compact_token, self.compact_starts[number + 1])
+        contiguous.sort(key=lambda number: match_score(pattern, self.keys[number]))
+        results.extend(contiguous[:limit - len(results)])
+        if len(results) >= limit:
+            return results
+
+        # ✅ Căutarea și scorurile rulează în C (compress / map / filter); potrivirile sunt ordonate cu un heap
+        # limitat la `limit`, fără a trece prin Python câte o intrare
+        matches = list(islice(filter(None, map(pattern.search, compress(self.keys, flags))), RANK_LIMIT))
+        keys = list(map(attrgetter("string"), matches))
+        spans = map(len, map(methodcaller("group"), matches))
+        starts = map(methodcaller("start"), matches)
+        ranked = heapq.nsmallest(limit - len(results) + len(seen), zip(spans, starts, map(len, keys), keys))
+        for _, _, _, key in ranked:
+            for number in self.exact[key]:
+                if flags[number] and number not in seen:
+                    seen.add(number)
+                    results.append(number)
+            if len(results) >= limit:
+                break
+        return results
+
+    def apply(self, number, command, bindings):
+        """(command, bindings) after accepting the entry `number`."""
+        entry = self.entries[number]
+        if entry.kind == COMMAND:
+            return entry.name, bindings
+        return command, {**bindings, entry.category: entry.name}
+
+    def parse_line(self, text):
+        """
+        Resolves every finished token of `text` to its best candidate; returns a PaletteLine with the
+        command and bindings so far, the token being typed and its candidates (ids), and the first token
+        that matched nothing (None if all matched).
+        """
+        *finished, token = text.split(" ")
+        command, bindings = None, {}
+        for word in finished:
+            if not word:
+                continue
+            best = self.search(word, self.allowed_mask(command, bindings), limit=1)
+            if not best:
+                return PaletteLine(command, bindings, token, [], word)
+            command, bindings = self.apply(best[0], command, bindings)
+        candidates = self.search(token, self.allowed_mask(command, bindings))
+        return PaletteLine(command, bindings, token, candidates, None)
+
+    def missing_categories(self, line):
+        if line.command is None:
+            return None
+        return [category for category in self.command_categories[line.command] if category not in line.bindings]
+
+    def step(self, line):
+        """The step described by `line`, or None while the command or one of its parameters is missing."""
+        if line.unmatched is not None or self.missing_categories(line) != []:
+            return None
+        return command_step(line.command, {category: line.bindings[category]
+                                           for category in self.command_categories[line.command]})
+
+    def record_use(self, line):
+        """Moves the command and parameters of an inserted step to the front of `recent`."""
+        used = [Entry(COMMAND, None, line.command)]
+        used.extend(Entry(PARAMETER, category, name) for category, name in line.bindings.items())
+        for entry in reversed(used):
+            if entry in self.recent:
+                self.recent.remove(entry)
+            self.recent.insert(0, entry)
+        del self.recent[RECENT_SIZE:]
@@ -0,0 +1,70 @@
+"""
+Watches the data files for changes made outside this instance (a colleague's
+save on a shared folder, a `git pull`, an editor).
+
+QFileSystemWatcher stops watching a file that is replaced instead of rewritten
+(git and most editors write a new file and rename it over the old one), so the
+containing folders are watched too and files are re-added when they reappear.
+Notifications are debounced, because a single save usually produces several.
+Telling external changes from this instance's own saves is left to the pages,
+which compare the file's version stamp with the one their `SharedJsonFile` last
+saw.
+"""
+import os
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+
+class DataFileWatcher(QObject):
+    """Emits `file_changed(path)` (debounced) when one of the watched files changes on disk."""
+    file_changed = pyqtSignal(str)
+
+    DEBOUNCE_MS = 300
+
+    def __init__(self, paths=(), parent=None):
+        super().__init__(parent)
+        self.paths = set()
+        self.pending = set()
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.schedule)
+        self.watcher.directoryChanged.connect(self.rewatch)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.DEBOUNCE_MS)
+        self.timer.timeout.connect(self.flush)
+
+        for path in paths:
+            self.add_path(path)
+
+    def add_path(self, path):
+        path = os.path.abspath(path)
+        self.paths.add(path)
+        directory = os.path.dirname(path)
+        if os.path.isdir(directory) and directory not in self.watcher.directories():
+            self.watcher.addPath(directory)
+        if os.path.exists(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+
+    def schedule(self, path):
+        path = os.path.abspath(path)
+        if path in self.paths:
+            self.pending.add(path)
+            self.timer.start()  # ✅ Repornit la fiecare notificare: raportăm după ce scrierea s-a terminat
+
+    def rewatch(self, directory):
+        """A file in a watched folder was created, replaced or removed."""
+        watched_files = set(self.watcher.files())
+        for path in self.paths:
+            if os.path.dirname(path) == os.path.abspath(directory) and os.path.exists(path) \
+                    and path not in watched_files:
+                self.watcher.addPath(path)
+                self.schedule(path)
+
+    def flush(self):
+        pending, self.pending = self.pending, set()
+        for path in sorted(pending):
+            if os.path.exists(path) and path not in self.watcher.files():
+                self.watcher.addPath(path)
+            self.file_changed.emit(path)
@@ -0,0 +1,159 @@
+"""
+HTML specification report.
+
+The report is a folder:
+
+    index.html          table of contents + one section per test
+    fragments/<hash>    the rendered section of one test, named by the hash of
+                        the test's name and stored fields
+
+A section is rendered from the fields stored in tests.json (Description,
+Precondition, Action / Expected Results, Test Data Description, Description
+TCG); nothing is recomputed from the steps. Fragments are content-addressed,
+so a rebuild renders only the tests whose content changed since the last one,
+deletes the fragments nobody uses any more and re-links index.html by
+streaming the cached fragments into it, one test at a time.
+
+Command line:
+    python -m utils.html_report report/
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+from collections import namedtuple
+
+FRAGMENTS_DIR = "fragments"
+FRAGMENT_VERSION = "1"  # 🔹 Schimbat la orice modificare a formatului unei secțiuni (invalidează cache-ul)
+
+ReportResult = namedtuple("ReportResult", "index_path rendered reused removed")
+
+PAGE_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 2em; }}
+section {{ border-top: 1px solid #ccc; padding: 0.5em 0 1em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; vertical-align: top; }}
+th {{ background: #f0f0f0; }}
+pre {{ background: #f8f8f8; padding: 0.5em; white-space: pre-wrap; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+"""
+PAGE_FOOTER = "</body>\n</html>\n"
+
+
+def as_lines(value):
+    """The stored list fields are lists of lines; older files may store a single string."""
+    if isinstance(value, list):
+        return [str(line) for line in value]
+    return str(value or "").splitlines()
+
+
+def anchor(test_name):
+    return "test-" + hashlib.sha1(test_name.encode("utf-8")).hexdigest()[:12]
+
+
+def fragment_key(test_name, test_data):
+    """Hash of everything a section is rendered from."""
+    content = json.dumps([FRAGMENT_VERSION, test_name, test_data], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def render_test(test_name, test_data):
+    """The HTML section of one test."""
+    escape = html.escape
+    actions = as_lines(test_data.get("Action", []))
+    expected_results = as_lines(test_data.get("Expected Results", []))
+
+    parts = [f'<section id="{anchor(test_name)}">\n<h2>{escape(test_name)}</h2>\n']
+    if test_data.get("Description"):
+        parts.append(f"<p>{escape(str(test_data['Description']))}</p>\n")
+    if test_data.get("Precondition"):
+        parts.append(f"<h3>Precondition</h3>\n<pre>{escape(str(test_data['Precondition']))}</pre>\n")
+
+    parts.append("<h3>Steps</h3>\n<table>\n<tr><th>#</th><th>Action</th><th>Expected Result</th></tr>\n")
+    for number in range(max(len(actions), len(expected_results))):
+        action = actions[number] if number < len(actions) else ""
+        expected = expected_results[number] if number < len(expected_results) else ""
+        parts.append(f"<tr><td>{number + 1}</td><td>{escape(action)}</td><td>{escape(expected)}</td></tr>\n")
+    parts.append("</table>\n")
+
+    for field in ("Test Data Description", "Description TCG"):
+        lines = as_lines(test_data.get(field, []))
+        if any(line.strip() for line in lines):
+            parts.append(f"<h3>{field}</h3>\n<pre>{escape(chr(10).join(lines))}</pre>\n")
+    parts.append("</section>\n")
+    return "".join(parts)
+
+
+def write_report(report_dir, tests_data, title="Test Specification"):
+    """
+    (Re)builds the report in `report_dir` (see the module docstring).
+
+    Returns ReportResult(index path, tests rendered, tests reused from the cache, fragments removed).
+    """
+    fragments_dir = os.path.join(report_dir, FRAGMENTS_DIR)
+    os.makedirs(fragments_dir, exist_ok=True)
+    existing = set(os.listdir(fragments_dir))
+
+    keys = {}
+    rendered = reused = 0
+    for test_name, test_data in tests_data.items():
+        key = keys[test_name] = fragment_key(test_name, test_data)
+        if key in existing:
+            reused += 1
+            continue
+        temp_path = os.path.join(fragments_dir, key + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(render_test(test_name, test_data))
+        os.replace(temp_path, os.path.join(fragments_dir, key))  # ✅ Un fragment incomplet nu este refolosit
+        rendered += 1
+
+    used = set(keys.values())
+    stale = [name for name in existing if name not in used]
+    for name in stale:
+        os.remove(os.path.join(fragments_dir, name))
+
+    # ✅ index.html este scris progresiv din fragmentele din cache; nicio secțiune nu este ținută în memorie
+    index_path = os.path.join(report_dir, "index.html")
+    temp_path = index_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as index:
+        index.write(PAGE_HEADER.format(title=html.escape(title)))
+        index.write(f"<p>{len(tests_data)} test(s)</p>\n<ol>\n")
+        for test_name in tests_data:
+            index.write(f'<li><a href="#{anchor(test_name)}">{html.escape(test_name)}</a></li>\n')
+        index.write("</ol>\n")
+        for test_name in tests_data:
+            with open(os.path.join(fragments_dir, keys[test_name]), encoding="utf-8") as fragment:
+                index.write(fragment.read())
+        index.write(PAGE_FOOTER)
+    os.replace(temp_path, index_path)
+
+    return ReportResult(index_path, rendered, reused, len(stale))
+
+
+def main(argv=None):
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+    parser = argparse.ArgumentParser(description="Write (or incrementally update) the HTML specification report.")
+    parser.add_argument("output", help="report folder")
+    parser.add_argument("--data-dir", default=data_dir, help="folder with tests.json")
+    parser.add_argument("--title", default="Test Specification")
+    args = parser.parse_args(argv)
+
+    from utils.json_io import load_json_file
+
+    tests_data = load_json_file(os.path.join(args.data_dir, "tests.json"))  # ✅ JSON simplu sau comprimat
+    result = write_report(args.output, tests_data, args.title)
+    print(f"✅ Report written to {result.index_path} ({result.rendered} test(s) rendered, "
+          f"{result.reused} reused, {result.removed} stale fragment(s) removed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Background executor for file and XLSX I/O.
+
+Every load, save, import and export is submitted here so the GUI thread never
+blocks on the disk (or a network share). Work runs on a `QThreadPool`; the
+`on_done` / `on_error` callbacks are always delivered back on the GUI thread.
+
+Tasks submitted with the same `key` (normally the normalized file path) run one
+after another in submission order, so a read never overtakes a write to the
+same file. Writes are additionally coalesced: if several writes to a file are
+queued behind a running one, only the newest is executed and all of their
+callbacks are notified when it completes.
+"""
+import os
+import traceback
+from collections import deque
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QEventLoop, QElapsedTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QApplication
+
+
+def file_key(file_path):
+    """Key used to serialize all operations on the same file."""
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+class IOTask:
+    def __init__(self, function, key, coalesce, on_done, on_error, description):
+        self.function = function
+        self.key = key
+        self.coalesce = coalesce
+        self.done_callbacks = [on_done] if on_done else []
+        self.error_callbacks = [on_error] if on_error else []
+        self.description = description
+
+
+class IORunnable(QRunnable):
+    def __init__(self, executor, task):
+        super().__init__()
+        self.executor = executor
+        self.task = task
+
+    def run(self):
+        try:
+            result = self.task.function()
+        except Exception as e:
+            traceback.print_exc()
+            self.executor.task_completed.emit(self.task, None, e)
+        else:
+            self.executor.task_completed.emit(self.task, result, None)
+
+
+class IOExecutor(QObject):
+    pending_changed = pyqtSignal(int)  # 🔹 Numărul de operații I/O în așteptare sau în curs
+    task_failed = pyqtSignal(str, str)  # 🔹 (descriere, mesaj de eroare)
+    task_completed = pyqtSignal(object, object, object)  # intern: (task, result, error) din thread-ul worker
+
+    def __init__(self, max_threads=4):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self.queues = {}  # key -> deque of tasks waiting behind the running one
+        self.running_keys = set()
+        self.pending = 0
+        self.task_completed.connect(self.on_task_completed)
+
+    def submit(self, function, on_done=None, on_error=None, key=None, description="I/O"):
+        """Runs `function()` in the pool; `on_done(result)` / `on_error(exception)` run on the GUI thread."""
+        self.enqueue(IOTask(function, key, False, on_done, on_error, description))
+
+    def submit_write(self, file_path, function, on_done=None, on_error=None, description=None):
+        """Like `submit`, serialized per file and coalesced with other writes queued for the same file."""
+        key = file_key(file_path)
+        task = IOTask(function, key, True, on_done, on_error, description or f"Saving {os.path.basename(file_path)}")
+
+        queue = self.queues.get(key)
+        if queue and queue[-1].coalesce:
+            # ✅ Scrierea mai nouă o înlocuiește pe cea care încă așteaptă; callback-urile sunt păstrate
+            superseded = queue.pop()
+            task.done_callbacks = superseded.done_callbacks + task.done_callbacks
+            task.error_callbacks = superseded.error_callbacks + task.error_callbacks
+            self.pending -= 1
+
+        self.enqueue(task)
+
+    def submit_read(self, file_path, function, on_done=None, on_error=None, description=None):
+        """Like `submit`, ordered after every write already queued for the same file."""
+        self.submit(function, on_done, on_error, key=file_key(file_path),
+                    description=description or f"Loading {os.path.basename(file_path)}")
+
+    def enqueue(self, task):
+        self.pending += 1
+        self.pending_changed.emit(self.pending)
+
+        if task.key is None:
+            self.pool.start(IORunnable(self, task))
+        elif task.key in self.running_keys:
+            self.queues.setdefault(task.key, deque()).append(task)
+        else:
+            self.running_keys.add(task.key)
+            self.pool.start(IORunnable(self, task))
+
+    @pyqtSlot(object, object, object)
+    def on_task_completed(self, task, result, error):
+        """Rulează în thread-ul GUI: notifică apelantul și pornește următorul task pentru aceeași cheie."""
+        if task.key is not None:
+            queue = self.queues.get(task.key)
+            if queue:
+                self.pool.start(IORunnable(self, queue.popleft()))
+            else:
+                self.queues.pop(task.key, None)
+                self.running_keys.discard(task.key)
+
+        try:
+            if error is None:
+                for callback in task.done_callbacks:
+                    callback(result)
+            else:
+                print(f"❌ {task.description} failed: {error}")
+                self.task_failed.emit(task.description, str(error))
+                for callback in task.error_callbacks:
+                    callback(error)
+        except Exception as e:
+            print(f"❌ CRITICAL ERROR in I/O callback for '{task.description}': {e}")
+            traceback.print_exc()
+        finally:
+            self.pending -= 1
+            self.pending_changed.emit(self.pending)
+
+    def is_idle(self):
+        return self.pending == 0
+
+    def wait_until_idle(self, timeout_ms=30000):
+        """Procesează evenimente până când toate operațiile I/O (și callback-urile lor) s-au terminat."""
+        timer = QElapsedTimer()
+        timer.start()
+        while self.pending and timer.elapsed() < timeout_ms:
+            QApplication.processEvents(QEventLoop.AllEvents, 20)
+            self.pool.waitForDone(5)
+        return self.pending == 0
+
+
+_executor = None
+
+
+def io_executor():
+    """Returns the application-wide I/O executor (created on first use)."""
+    global _executor
+    if _executor is None:
+        _executor = IOExecutor()
+    return _executor
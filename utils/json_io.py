@@ -0,0 +1,441 @@
+"""
+Shared reading and writing of the JSON data files (tests, parameters, generic commands).
+
+All pages go through `read_json` / `write_json` so the snapshot cache in
+`utils.snapshot_cache` stays in sync with what is on disk. The file a page
+owns (and saves) is wrapped in a `SharedJsonFile`, which detects changes made
+by other instances working on the same data folder and merges them on save.
+
+A data file is stored either as indented JSON or gzip-compressed compact JSON
+(much smaller on network drives). The format is detected from the file's first
+bytes on every read, and a save keeps the format the file already has; switch
+a file with `python -m utils.json_io compress|decompress FILE...`. Compressed
+files are encoded and decoded one top-level entry at a time, so the whole JSON
+text is never held in memory.
+"""
+import argparse
+import codecs
+import gzip
+import hashlib
+import io
+import json
+import marshal
+import os
+import re
+import zlib
+from collections import namedtuple
+
+from utils import snapshot_cache
+from utils.spec_merge import conflict_report, describe_key, entry_hashes, merge, write_conflict_report
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+VALUE_END = frozenset(",:}] \t\n\r")  # 🔹 Caracterele care pot urma după o valoare (cheie sau membru)
+GZIP_MAGIC = b"\x1f\x8b"
+COMPRESS_LEVEL = 6  # 🔹 Aproape cât nivelul 9 ca mărime, de câteva ori mai rapid la salvare
+ENCODE_CHUNK_SIZE = 1 << 16
+DECODE_ERRORS = (ValueError, OSError, EOFError, zlib.error)  # ✅ JSON invalid sau gzip corupt / trunchiat
+
+
+def is_compressed(file_path):
+    """True if the file on disk is gzip-compressed (False for plain JSON or a missing file)."""
+    try:
+        with open(file_path, "rb") as file:
+            return file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    except OSError:
+        return False
+
+
+def read_json(file_path):
+    """
+    Reads a JSON data file (plain or compressed), using its binary snapshot when it is still valid.
+
+    Raises the same errors as `json.load` (FileNotFoundError, json.JSONDecodeError).
+    """
+    data = snapshot_cache.load_snapshot(file_path)
+    if data is not None:
+        return data
+
+    with open(file_path, "rb") as file:
+        raw_bytes = file.read()
+
+    with snapshot_cache.gc_paused():
+        data = decode_json_bytes(raw_bytes)
+    snapshot_cache.store_snapshot(file_path, data, snapshot_cache.content_hash(raw_bytes))
+    return data
+
+
+def decode_json_bytes(raw_bytes):
+    """Parses the bytes of a data file in either format (compressed files must hold a JSON object)."""
+    if raw_bytes[:len(GZIP_MAGIC)] != GZIP_MAGIC:
+        return json.loads(raw_bytes.decode("utf-8"))
+    with gzip.GzipFile(fileobj=io.BytesIO(raw_bytes)) as file:
+        return dict(iter_json_members(file))
+
+
+def load_json_file(file_path):
+    """Parses a data file in either format without touching its snapshot (e.g. temporary files given by git)."""
+    with open(file_path, "rb") as file:
+        return decode_json_bytes(file.read())
+
+
+def copy_json_data(data):
+    """Fast deep copy of JSON-like data (dict/list/str/number), e.g. to hand a save over to a worker thread."""
+    with snapshot_cache.gc_paused():
+        return marshal.loads(marshal.dumps(data))
+
+
+def dump_json_bytes(data, compressed=False):
+    """
+    Serializes data exactly as the data files are written: indent=4, UTF-8, or with `compressed`
+    gzip of compact JSON (byte-identical for identical data, so unchanged saves are still skipped).
+    """
+    if not compressed:
+        return json.dumps(data, indent=4).encode("utf-8")
+
+    output = io.BytesIO()
+    with gzip.GzipFile(fileobj=output, mode="wb", compresslevel=COMPRESS_LEVEL, mtime=0) as file:
+        if not isinstance(data, dict):
+            file.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            return output.getvalue()
+
+        # ✅ O intrare de nivel 1 odată: textul JSON complet nu există niciodată în memorie
+        pending, pending_size = ["{"], 0
+        for number, (key, value) in enumerate(data.items()):
+            text = f"{',' if number else ''}{json.dumps(key)}:{json.dumps(value, separators=(',', ':'))}"
+            pending.append(text)
+            pending_size += len(text)
+            if pending_size >= ENCODE_CHUNK_SIZE:
+                file.write("".join(pending).encode("utf-8"))
+                pending, pending_size = [], 0
+        pending.append("}")
+        file.write("".join(pending).encode("utf-8"))
+    return output.getvalue()
+
+
+def write_json(file_path, data, compressed=None):
+    """
+    Writes `data` to `file_path` and refreshes its snapshot (`compressed=None` keeps the file's format).
+
+    Returns False (and leaves the file untouched) when the file already holds exactly these bytes.
+    """
+    if compressed is None:
+        compressed = is_compressed(file_path)
+    raw_bytes = dump_json_bytes(data, compressed)
+    digest = snapshot_cache.content_hash(raw_bytes)
+    if file_has_content(file_path, len(raw_bytes), digest):
+        return False
+
+    with open(file_path, "wb") as file:
+        file.write(raw_bytes)
+    snapshot_cache.store_snapshot(file_path, data, digest)
+    return True
+
+
+def file_has_content(file_path, size, digest):
+    """True if the file on disk is `size` bytes long and hashes to `digest` (read only when the sizes match)."""
+    try:
+        return os.path.getsize(file_path) == size and snapshot_cache.file_hash(file_path) == digest
+    except OSError:
+        return False
+
+
+VersionStamp = namedtuple("VersionStamp", "size mtime_ns")
+SaveResult = namedtuple("SaveResult", "written from_disk conflicts conflicts_file", defaults=(None,))
+
+
+def version_stamp(file_path):
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return VersionStamp(stat.st_size, stat.st_mtime_ns)
+
+
+class SharedJsonFile:
+    """
+    A data file owned (loaded and saved) by one page, in a folder other instances may also write to.
+
+    The version stamp (size + mtime) of the file and the hash of every entry are remembered when the
+    page loads or saves it. On save:
+      - if the serialized data is byte-identical to the file, nothing is written;
+      - if the file still has the remembered stamp, it is overwritten as before;
+      - otherwise it was changed by someone else: both versions are merged entry by entry
+        (`utils.spec_merge`) and the merge result is written, so the other instance's changes survive.
+        For entries changed on both sides the local version is written and the disk version is kept,
+        next to ours, in `<file>.conflicts`.
+
+    `merge_depth` is 1 for files keyed by test / command and 2 for parameters.json (category -> parameter).
+    All methods run on the I/O thread, serialized per file by `io_executor`.
+    """
+
+    def __init__(self, file_path, merge_depth=1):
+        self.file_path = file_path
+        self.merge_depth = merge_depth
+        self.stamp = None
+        self.digest = None
+        self.local_hashes = None  # 🔹 Intrările așa cum le are pagina (la ultima sincronizare)
+        self.written_hashes = None  # 🔹 Intrările așa cum erau pe disc (la ultima sincronizare)
+        self.merged_data = None  # 🔹 Ultimul rezultat al unei îmbinări, cât timp pagina nu are încă modificările de pe disc
+
+    def read(self):
+        """`read_json` that also remembers the version read."""
+        stamp = version_stamp(self.file_path)
+        data = read_json(self.file_path)
+        self.remember(data, stamp)
+        return data
+
+    def read_external_change(self, force=False):
+        """
+        (data, pristine copy, stamp) if the file changed since this page last loaded or saved it, else None.
+
+        With `force`, the file is read even if the change is this page's own (merged) save. The copy is
+        meant for `remember` once the page has applied `data`, which it may modify.
+        """
+        stamp = version_stamp(self.file_path)
+        if stamp is None or (stamp == self.stamp and not force):
+            return None
+        data = read_json(self.file_path)
+        return data, copy_json_data(data), stamp
+
+    def remember(self, data, stamp=None, digest=None):
+        """Records `data` as the version of the file this page works on (both sides in sync)."""
+        self.stamp = stamp if stamp is not None else version_stamp(self.file_path)
+        self.digest = digest
+        self.merged_data = None
+        self.local_hashes = self.written_hashes = entry_hashes(data, self.merge_depth) if isinstance(data, dict) else {}
+
+    def write(self, data):
+        """Saves `data`, merging concurrent changes made on disk (see the class docstring). Returns a SaveResult."""
+        from_disk, conflicts, conflicts_file = [], [], None
+        local_hashes = entry_hashes(data, self.merge_depth)
+        current = version_stamp(self.file_path)
+
+        disk_data = None
+        if self.local_hashes is not None and current is not None and current != self.stamp:
+            with open(self.file_path, "rb") as file:
+                disk_bytes = file.read()
+            if snapshot_cache.content_hash(disk_bytes) != self.digest:
+                try:
+                    disk_data = decode_json_bytes(disk_bytes)
+                except DECODE_ERRORS:
+                    pass  # ✅ Un fișier corupt pe disc este înlocuit cu versiunea locală
+        elif current is not None and current == self.stamp:
+            # ✅ Fișierul conține încă îmbinarea scrisă de noi; pagina nu are modificările preluate de pe disc
+            disk_data = self.merged_data
+
+        if isinstance(disk_data, dict):
+            result = merge(data, disk_data, self.local_hashes, self.written_hashes, self.merge_depth)
+            if result.conflicts:
+                # ✅ Versiunea celeilalte instanțe nu se pierde: rămâne, alături de a noastră, în `<fișier>.conflicts`
+                report = conflict_report({}, data, disk_data, [(key, None) for key in result.conflicts],
+                                         self.merge_depth)
+                conflicts_file = write_conflict_report(self.file_path, report, keep_existing=True)
+            data, from_disk, conflicts = result.data, result.from_disk, result.conflicts
+
+        raw_bytes = dump_json_bytes(data, is_compressed(self.file_path))  # ✅ Formatul de pe disc este păstrat
+        digest = snapshot_cache.content_hash(raw_bytes)
+        if digest == self.digest and current == self.stamp:
+            written = False  # ✅ Exact ce am scris ultima dată, iar fișierul nu a fost atins între timp
+        else:
+            written = not file_has_content(self.file_path, len(raw_bytes), digest)
+        if written:
+            with open(self.file_path, "wb") as file:
+                file.write(raw_bytes)
+            snapshot_cache.store_snapshot(self.file_path, data, digest)
+
+        self.stamp = version_stamp(self.file_path)
+        self.digest = digest
+        self.local_hashes = local_hashes
+        if from_disk or conflicts:
+            self.written_hashes = entry_hashes(data, self.merge_depth)
+            self.merged_data = data
+        else:
+            self.written_hashes = local_hashes
+            self.merged_data = None
+        return SaveResult(written, [describe_key(key) for key in from_disk], [describe_key(key) for key in conflicts],
+                          conflicts_file)
+
+
+def report_save(name, result, parent=None):
+    """
+    Prints the outcome of a `SharedJsonFile.write` (used as the pages' `on_done`).
+
+    Conflicts are also shown to the user in a (non-modal) message box over `parent`, if given.
+    """
+    if result.from_disk:
+        print(f"🔀 {name}: kept {len(result.from_disk)} change(s) saved by another instance: "
+              f"{', '.join(result.from_disk[:10])}")
+    if result.conflicts:
+        print(f"⚠️ {name}: {len(result.conflicts)} entr(y/ies) changed here and by another instance, local version "
+              f"kept: {', '.join(result.conflicts[:10])}")
+        if parent is not None:
+            from PyQt5.QtCore import Qt
+            from PyQt5.QtWidgets import QMessageBox
+
+            more = f"\n… and {len(result.conflicts) - 10} more" if len(result.conflicts) > 10 else ""
+            message = QMessageBox(
+                QMessageBox.Warning, "Concurrent Changes",
+                f"{name}: {len(result.conflicts)} entr(y/ies) were changed here and by another instance at the same "
+                f"time. Your version was saved; the other version is kept in:\n{result.conflicts_file}\n\n"
+                + "\n".join(result.conflicts[:10]) + more,
+                QMessageBox.Ok, parent)
+            message.setAttribute(Qt.WA_DeleteOnClose)
+            message.show()  # ✅ Fără exec_: rezultatul salvării ajunge într-un callback, nu blocăm event loop-ul
+    print(f"✅ {name} saved successfully." if result.written else f"✅ {name} unchanged on disk, write skipped.")
+
+
+def iter_json_members(file, chunk_size=1 << 16):
+    """
+    Yields the (key, value) members of the top-level JSON object read from the binary `file`.
+
+    Only the value being decoded is held in memory (plus one chunk of text).
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, position, eof
+        # ✅ Reading at least as much as is already buffered keeps large values linear
+        chunk = file.read(max(chunk_size, len(buffer) - position))
+        eof = not chunk
+        buffer = buffer[position:] + text_decoder.decode(chunk, final=eof)
+        position = 0
+
+    def skip_whitespace():
+        nonlocal position
+        while True:
+            position = WHITESPACE.match(buffer, position).end()
+            if position < len(buffer) or eof:
+                return
+            fill()
+
+    def expect(characters):
+        skip_whitespace()
+        if position >= len(buffer) or buffer[position] not in characters:
+            found = buffer[position:position + 20] if position < len(buffer) else "end of file"
+            raise json.JSONDecodeError(f"Expected one of {characters!r}, found {found!r}", buffer, position)
+        return buffer[position]
+
+    def decode_value():
+        nonlocal position
+        while True:
+            skip_whitespace()
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                # ✅ A value cut by the chunk may still decode (e.g. "1" of "1.25"); it is complete only when
+                # followed by a separator, else it may continue in the next chunk
+                if eof or (end < len(buffer) and buffer[end] in VALUE_END):
+                    position = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+
+    fill()
+    expect("{")
+    position += 1
+    if expect('}"') == "}":
+        return
+
+    while True:
+        key = decode_value()
+        expect(":")
+        position += 1
+        value = decode_value()
+        yield key, value
+
+        separator = expect(",}")
+        position += 1
+        if separator == "}":
+            break
+        expect('"')
+
+    skip_whitespace()
+    if position < len(buffer):
+        raise json.JSONDecodeError("Extra data", buffer, position)
+
+
+class HashingReader:
+    """Reads a file as stored on disk, counting and hashing the bytes (before any decompression)."""
+
+    def __init__(self, file):
+        self.file = file
+        self.consumed = 0
+        self.digest = hashlib.sha1()
+
+    def read(self, size=-1):
+        chunk = self.file.read(size)
+        self.consumed += len(chunk)
+        self.digest.update(chunk)
+        return chunk
+
+
+class JsonObjectStream:
+    """
+    Iterates over the members of a top-level JSON object one (key, value) pair at a time.
+
+    Only the value being decoded is held in memory, so the caller can start using
+    the first entries long before the whole file has been read. Compressed files are
+    decompressed on the fly. When the file has a valid snapshot, the members are
+    served from it instead. `progress` reports the fraction consumed so far (0.0 - 1.0).
+    """
+
+    def __init__(self, file_path, chunk_size=1 << 16):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.stamp = version_stamp(file_path)  # 🔹 Versiunea fișierului citită (pentru `SharedJsonFile.remember`)
+        self.snapshot = snapshot_cache.load_snapshot(file_path)
+        self.total = len(self.snapshot) if self.snapshot is not None else max(1, os.path.getsize(file_path))
+        self.consumed = 0
+        self.completed = False
+        self.digest = hashlib.sha1()
+
+    @property
+    def progress(self):
+        return min(1.0, self.consumed / self.total) if self.total else 1.0
+
+    def __iter__(self):
+        if self.snapshot is not None:
+            for key, value in self.snapshot.items():
+                self.consumed += 1
+                yield key, value
+        else:
+            yield from self.iter_file()
+        self.completed = True
+
+    def iter_file(self):
+        with open(self.file_path, "rb") as raw_file:
+            reader = HashingReader(raw_file)
+            self.digest = reader.digest  # ✅ Hash-ul octeților de pe disc, ca în `snapshot_cache.file_hash`
+            compressed = raw_file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+            raw_file.seek(0)
+            file = gzip.GzipFile(fileobj=reader) if compressed else reader
+            for member in iter_json_members(file, self.chunk_size):
+                self.consumed = reader.consumed
+                yield member
+            self.consumed = reader.consumed
+
+    def store_snapshot(self, data):
+        """Stores `data` (the members read from the file, unchanged) as the file's snapshot."""
+        if self.snapshot is None and self.completed:
+            snapshot_cache.store_snapshot(self.file_path, data, self.digest.digest())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert data files between plain and gzip-compressed JSON.")
+    parser.add_argument("action", choices=("compress", "decompress"))
+    parser.add_argument("files", nargs="+", help="e.g. data/tests.json data/parameters.json")
+    args = parser.parse_args(argv)
+
+    for file_path in args.files:
+        before = os.path.getsize(file_path)
+        write_json(file_path, read_json(file_path), compressed=args.action == "compress")
+        print(f"✅ {file_path}: {before} -> {os.path.getsize(file_path)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""
+Headless interaction-latency harness.
+
+Generates a large synthetic data folder, builds the real pages on the
+`offscreen` Qt platform and drives typical user interactions against them:
+
+    * adding a test step (`TestsPage.add_test_step`)
+    * editing a parameter cell (`ParametersPage.update_parameter_value`)
+    * typing in the Tests / Parameters / Generic Commands search boxes
+    * typing a one-line step in the command palette (`CommandPaletteDialog`)
+
+For every action the time from the input until all resulting work (including
+background I/O) has finished is recorded, together with the longest stretch
+during which the event loop was blocked; p50 / p95 / max are reported per
+action type.
+
+Usage (from the project root):
+
+    python -m utils.latency_harness --tests 2000 --parameters 5000 --steps 5
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEventLoop, QTimer, Qt
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication, QLineEdit
+
+CATEGORIES = ["Request", "Response", "Signals", "Values", "CS_Variable"]
+
+COMMANDS = {
+    "Check_Signal_equal": {
+        "Action": "Check if signal {Signals} is equal with value {Values}",
+        "Expected Result": "Signal is equal"
+    },
+    "Send_req_check_response": {
+        "Action": "Send request {Request}",
+        "Expected Result": "Check response {Response}"
+    },
+    "Check_CS_Var": {
+        "Action": "Check if variable {Request} is equal with {CS_Variable}",
+        "Expected Result": "Done"
+    }
+}
+
+
+# ----------------- Dataset generation -----------------
+def generate_dataset(data_dir, tests=1000, parameters=2000, steps=5, variants=3, seed=0):
+    """Writes tests.json, parameters.json and generic_commands.json into `data_dir`."""
+    rnd = random.Random(seed)
+
+    per_category = max(1, parameters // len(CATEGORIES))
+    variant_names = ["Default Value"] + [f"Variant_{i}" for i in range(1, variants)]
+    parameters_data = {}
+    for category in CATEGORIES:
+        parameters_data[category] = {}
+        for index in range(per_category):
+            parameters_data[category][f"{category}_{index}"] = {
+                variant: f"[0x{rnd.randrange(256):02X},0x{rnd.randrange(256):02X}]" for variant in variant_names
+            }
+
+    tests_data = {}
+    command_names = list(COMMANDS)
+    for index in range(tests):
+        actions = []
+        expected = []
+        for _ in range(steps):
+            command = COMMANDS[rnd.choice(command_names)]
+            action = command["Action"]
+            expected_result = command["Expected Result"]
+            for category in CATEGORIES:
+                value = f"{category}_{rnd.randrange(per_category)}"
+                action = action.replace(f"{{{category}}}", value)
+                expected_result = expected_result.replace(f"{{{category}}}", value)
+            actions.append(action)
+            expected.append(expected_result)
+
+        tests_data[f"TC_{index:05d}"] = {
+            "Description": f"Generated test {index}",
+            "Precondition": "ECU is powered",
+            "Action": actions,
+            "Expected Results": expected,
+            "Test Data Description": [],
+            "Description TCG": []
+        }
+
+    for file_name, data in (("tests.json", tests_data),
+                            ("parameters.json", parameters_data),
+                            ("generic_commands.json", COMMANDS)):
+        with open(os.path.join(data_dir, file_name), "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+
+    return tests_data, parameters_data
+
+
+# ----------------- Page wiring -----------------
+def make_page_classes(data_dir):
+    """Returns the real page classes, redirected to read/write inside `data_dir`."""
+    from pages.tests_page import TestsPage
+    from pages.parameters_page import ParametersPage
+    from pages.generic_command_page import GenericCommandPage
+
+    def get_resource_path(self, relative_path):
+        return os.path.join(data_dir, os.path.basename(relative_path))
+
+    classes = []
+    for base in (TestsPage, ParametersPage, GenericCommandPage):
+        classes.append(type(f"Harness{base.__name__}", (base,), {"get_resource_path": get_resource_path}))
+    return classes
+
+
+class ScriptedCommandDialog:
+    """Stand-in for `SelectCommandDialog` that picks the scripted command without showing UI."""
+    next_command = None
+
+    def __init__(self, commands_data):
+        self.selected_command = ScriptedCommandDialog.next_command
+
+    def exec_(self):
+        return self.selected_command is not None
+
+
+class ScriptedPreviewDialog:
+    """Stand-in for `PreviewTestStepDialog` that binds the first parameter of every category."""
+
+    def __init__(self, command_action, command_expected, parameters_data, required_categories):
+        self.selected_parameters = {
+            category: next(iter(parameters_data.get(category, {})), "")
+            for category in required_categories
+        }
+
+    def exec_(self):
+        return True
+
+
+@contextlib.contextmanager
+def scripted_dialogs():
+    """Replaces the blocking dialogs used by `add_test_step` for the duration of the block."""
+    import pages.tests_page as tests_page_module
+
+    original = tests_page_module.SelectCommandDialog, tests_page_module.PreviewTestStepDialog
+    tests_page_module.SelectCommandDialog = ScriptedCommandDialog
+    tests_page_module.PreviewTestStepDialog = ScriptedPreviewDialog
+    try:
+        yield
+    finally:
+        tests_page_module.SelectCommandDialog, tests_page_module.PreviewTestStepDialog = original
+
+
+def find_search_box(page, placeholder_prefix):
+    """Returns the first QLineEdit of `page` whose placeholder starts with `placeholder_prefix`."""
+    for line_edit in page.findChildren(QLineEdit):
+        if line_edit.placeholderText().startswith(placeholder_prefix):
+            return line_edit
+    raise LookupError(f"No search box starting with '{placeholder_prefix}'")
+
+
+# ----------------- Measurement -----------------
+def wait_until_idle():
+    """Runs the event loop until every event queued so far has been processed."""
+    loop = QEventLoop()
+    QTimer.singleShot(0, loop.quit)
+    loop.exec_()
+
+
+def wait_for(condition, timeout=600.0):
+    """Runs the event loop until `condition()` is true (e.g. a background load has finished)."""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Condition not reached before timeout")
+        QApplication.processEvents(QEventLoop.AllEvents, 50)
+
+
+class StallMonitor:
+    """Records the longest gap between ticks of a 1 ms timer, i.e. the worst event-loop block."""
+
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setInterval(1)
+        self.timer.timeout.connect(self.tick)
+        self.last_tick = None
+        self.max_gap = 0.0
+
+    def start(self):
+        self.last_tick = time.perf_counter()
+        self.max_gap = 0.0
+        self.timer.start()
+
+    def tick(self):
+        now = time.perf_counter()
+        self.max_gap = max(self.max_gap, now - self.last_tick)
+        self.last_tick = now
+
+    def stop(self):
+        self.timer.stop()
+        self.tick()
+        return self.max_gap * 1000.0
+
+
+def settle():
+    """Waits for background I/O (and its GUI-thread callbacks) and then for the event loop to drain."""
+    from utils.io_executor import io_executor
+
+    # ✅ Draining the event loop can schedule new I/O (e.g. coalesced saves), so repeat until both are quiet
+    while True:
+        wait_for(io_executor().is_idle)
+        wait_until_idle()
+        if io_executor().is_idle():
+            return
+
+
+def measure(action, monitor):
+    """
+    Returns (latency ms, blocked ms) for `action`.
+
+    Latency is the time from the input until all resulting work (including background I/O)
+    has finished; blocked is the longest stretch during which the event loop could not run.
+    """
+    monitor.start()
+    start = time.perf_counter()
+    action()
+    synchronous = time.perf_counter() - start
+    settle()
+    latency = (time.perf_counter() - start) * 1000.0
+    return latency, max(synchronous * 1000.0, monitor.stop())
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of `samples`."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(results):
+    """Builds {action: {count, p50, p95, max, mean, blocked_p50, blocked_p95, blocked_max}} from raw samples."""
+    summary = {}
+    for action, samples in results.items():
+        if not samples:
+            continue
+        latencies = [latency for latency, _ in samples]
+        blocked = [block for _, block in samples]
+        summary[action] = {
+            "count": len(samples),
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "max": max(latencies),
+            "mean": statistics.fmean(latencies),
+            "blocked_p50": percentile(blocked, 0.50),
+            "blocked_p95": percentile(blocked, 0.95),
+            "blocked_max": max(blocked)
+        }
+    return summary
+
+
+def print_report(summary, stream=sys.stdout):
+    stream.write(f"{'action':<28}{'n':>6}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}"
+                 f"{'blocked p50':>14}{'blocked p95':>14}\n")
+    for action, stats in summary.items():
+        stream.write(f"{action:<28}{stats['count']:>6}{stats['p50']:>12.2f}{stats['p95']:>12.2f}{stats['max']:>12.2f}"
+                     f"{stats['blocked_p50']:>14.2f}{stats['blocked_p95']:>14.2f}\n")
+
+
+# ----------------- Scenarios -----------------
+def run_add_test_step(tests_page, repetitions, rnd, monitor):
+    samples = []
+    test_rows = tests_page.test_table.rowCount()
+    with scripted_dialogs():
+        for _ in range(repetitions):
+            ScriptedCommandDialog.next_command = rnd.choice(list(COMMANDS))
+            tests_page.test_table.selectRow(rnd.randrange(test_rows))
+            samples.append(measure(tests_page.add_test_step, monitor))
+    return samples
+
+
+def run_parameter_edit(parameters_page, repetitions, rnd, monitor):
+    samples = []
+    tables = list(parameters_page.category_tables.values())
+    for index in range(repetitions):
+        table = rnd.choice(tables)
+        row = rnd.randrange(table.rowCount())
+        column = rnd.randrange(1, table.columnCount())
+        value = f"[0x{index % 256:02X},0x01]"
+        samples.append(measure(lambda: table.item(row, column).setText(value), monitor))
+    return samples
+
+
+def run_typing(search_box, text, monitor):
+    samples = []
+    search_box.clear()
+    settle()
+    for character in text:
+        samples.append(measure(lambda: QTest.keyClick(search_box, character), monitor))
+    for _ in text:
+        samples.append(measure(lambda: QTest.keyClick(search_box, Qt.Key_Backspace), monitor))
+    return samples
+
+
+def run_palette_typing(tests_page, text, monitor):
+    """Candidate lookup and list update for every key of a one-line step typed in the command palette."""
+    from pages.tests_page import CommandPaletteDialog
+    from utils.command_palette import PaletteIndex
+
+    palette_index = PaletteIndex(tests_page.commands_data, tests_page.parameters_data)
+    dialog = CommandPaletteDialog(palette_index, tests_page.commands_data, "the benchmark")
+    samples = [measure(lambda: QTest.keyClick(dialog.input, character), monitor) for character in text]
+    dialog.deleteLater()
+    return samples
+
+
+def run(args):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    rnd = random.Random(args.seed)
+    results = {}
+    log = io.StringIO()
+
+    with tempfile.TemporaryDirectory(prefix="tst_latency_") as data_dir:
+        generate_dataset(data_dir, args.tests, args.parameters, args.steps, args.variants, args.seed)
+        tests_page_class, parameters_page_class, commands_page_class = make_page_classes(data_dir)
+
+        with contextlib.redirect_stdout(log if not args.verbose else sys.stdout):
+            startup = {}
+            pages = {}
+            for name, page_class in (("tests", tests_page_class),
+                                     ("parameters", parameters_page_class),
+                                     ("commands", commands_page_class)):
+                start = time.perf_counter()
+                pages[name] = page_class()
+                settle()
+                startup[name] = (time.perf_counter() - start) * 1000.0
+
+            # 🔹 Tests are appended in chunks through the event loop; wait for the full load
+            start = time.perf_counter()
+            wait_for(lambda: pages["tests"].initial_load_done)
+            startup["tests (background load)"] = (time.perf_counter() - start) * 1000.0
+
+            monitor = StallMonitor()
+            results["add_test_step"] = run_add_test_step(pages["tests"], args.repetitions, rnd, monitor)
+            results["update_parameter_value"] = run_parameter_edit(pages["parameters"], args.repetitions, rnd, monitor)
+            results["search_tests"] = run_typing(find_search_box(pages["tests"], "🔍 Search tests"), "TC_0001",
+                                                 monitor)
+            first_category_tab = pages["parameters"].tab_widget.widget(0)
+            results["search_parameters"] = run_typing(find_search_box(first_category_tab, "🔍 Search parameters"),
+                                                      "Request_1", monitor)
+            results["search_commands"] = run_typing(find_search_box(pages["commands"], "Search Commands"), "Check",
+                                                    monitor)
+            results["command_palette"] = run_palette_typing(pages["tests"], "sendreq request_1 response_2", monitor)
+
+            for page in pages.values():
+                page.deleteLater()
+            wait_until_idle()
+
+    summary = summarize(results)
+    print(f"Dataset: {args.tests} tests x {args.steps} steps, {args.parameters} parameters, "
+          f"{args.variants} variants")
+    print("Page construction: " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in startup.items()))
+    print_report(summary)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"startup_ms": startup, "actions": summary}, file, indent=4)
+
+    app.quit()
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure click-to-update latency of the GUI on generated data.")
+    parser.add_argument("--tests", type=int, default=1000, help="number of generated tests")
+    parser.add_argument("--parameters", type=int, default=2000, help="number of generated parameters")
+    parser.add_argument("--steps", type=int, default=5, help="steps per generated test")
+    parser.add_argument("--variants", type=int, default=3, help="variants per parameter (incl. Default Value)")
+    parser.add_argument("--repetitions", type=int, default=20, help="samples per add-step / edit action")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the summary to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="show the application's console output")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    run(parse_args())
@@ -0,0 +1,220 @@
+"""
+Columnar storage for one parameter category.
+
+parameters.json stores a category as {parameter: {variant: value}}. In memory,
+ParametersPage keeps each category as a `ParameterTable` instead:
+
+    names    ["Req_Default", "Req_Extended", ...]        row order
+    rows     {"Req_Default": 0, "Req_Extended": 1, ...}  name index
+    variants ["Default Value", "Speed", ...]             column order
+    columns  {"Default Value": ["[0x50,0x01]", ...], ...} one interned string list per variant
+
+so adding, removing or renaming a variant touches a single column, and a
+parameter costs one slot per variant instead of a dict of its own. A value of
+None marks a variant the parameter does not have (the key is absent from its
+JSON object).
+
+The table is a `MutableMapping` of parameter name -> `ParameterRow`, and a row
+is a `MutableMapping` of variant -> value, so code written against the
+dict-of-dicts keeps working; `to_dict()` gives the JSON form back.
+"""
+import csv
+import io
+import sys
+from collections.abc import MutableMapping
+
+
+def as_cell(value):
+    return None if value is None else sys.intern(str(value))
+
+
+def parse_clipboard_block(text):
+    """
+    Rows x cells of a block copied from Excel / LibreOffice / a table (tab separated, one row per line).
+
+    Cells containing tabs or line breaks arrive quoted, so the text is read as TSV rather than split by hand.
+    """
+    if not text:
+        return []
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if text.endswith("\n"):
+        text = text[:-1]  # ✅ Excel termină mereu blocul cu un rând nou
+    return [row or [""] for row in csv.reader(io.StringIO(text), delimiter="\t")] or [[""]]
+
+
+def format_clipboard_block(rows):
+    """Inverse of `parse_clipboard_block` (used for copying cells)."""
+    output = io.StringIO()
+    csv.writer(output, delimiter="\t", lineterminator="\n").writerows(rows)
+    return output.getvalue()
+
+
+class ParameterRow(MutableMapping):
+    """Variant -> value view of one parameter of a `ParameterTable`."""
+
+    __slots__ = ("table", "name")
+
+    def __init__(self, table, name):
+        self.table = table
+        self.name = name
+
+    def __getitem__(self, variant):
+        column = self.table.columns.get(variant)
+        value = None if column is None else column[self.table.rows[self.name]]
+        if value is None:
+            raise KeyError(variant)
+        return value
+
+    def __setitem__(self, variant, value):
+        self.table.set_value(self.name, variant, value)
+
+    def __delitem__(self, variant):
+        self[variant]  # ✅ KeyError dacă varianta lipsește, ca la un dict
+        self.table.columns[variant][self.table.rows[self.name]] = None
+
+    def __iter__(self):
+        row = self.table.rows[self.name]
+        return iter([variant for variant in self.table.variants if self.table.columns[variant][row] is not None])
+
+    def __len__(self):
+        row = self.table.rows[self.name]
+        return sum(1 for variant in self.table.variants if self.table.columns[variant][row] is not None)
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return f"ParameterRow({self.name!r}, {dict(self)!r})"
+
+
+class ParameterTable(MutableMapping):
+    """One parameter category stored column-wise (see the module docstring)."""
+
+    def __init__(self, parameters=None):
+        self.names = []
+        self.rows = {}
+        self.variants = []
+        self.columns = {}
+        for name, values in (parameters or {}).items():
+            self[name] = values
+
+    # ----------------- Parameters (rows) -----------------
+    def __getitem__(self, name):
+        if name not in self.rows:
+            raise KeyError(name)
+        return ParameterRow(self, name)
+
+    def __setitem__(self, name, values):
+        if name in self.rows:
+            self.set_row(self.rows[name], values)
+        else:
+            self.insert(len(self.names), name, values)
+
+    def __delitem__(self, name):
+        row = self.rows.pop(name)
+        del self.names[row]
+        for column in self.columns.values():
+            del column[row]
+        for index in range(row, len(self.names)):
+            self.rows[self.names[index]] = index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.rows
+
+    def insert(self, index, name, values):
+        """Inserts parameter `name` at row `index` (used to keep duplicates next to the original)."""
+        if name in self.rows:
+            raise KeyError(f"Parameter '{name}' already exists")
+
+        index = max(0, min(index, len(self.names)))
+        self.names.insert(index, sys.intern(name))
+        for column in self.columns.values():
+            column.insert(index, None)
+        for row in range(index, len(self.names)):
+            self.rows[self.names[row]] = row
+        self.set_row(index, values)
+
+    def set_row(self, row, values):
+        values = dict(values)  # ✅ `values` poate fi chiar un ParameterRow al acestui tabel
+        for column in self.columns.values():
+            column[row] = None
+        for variant, value in values.items():
+            if variant not in self.columns:
+                self.add_variant(variant, None)
+            self.columns[variant][row] = as_cell(value)
+
+    def rename_parameter(self, old_name, new_name):
+        """Renames a parameter in place (its row position is kept)."""
+        if new_name in self.rows:
+            raise KeyError(f"Parameter '{new_name}' already exists")
+        row = self.rows.pop(old_name)
+        self.names[row] = sys.intern(new_name)
+        self.rows[self.names[row]] = row
+
+    def get_value(self, name, variant, default=""):
+        column = self.columns.get(variant)
+        value = None if column is None else column[self.rows[name]]
+        return default if value is None else value
+
+    def set_value(self, name, variant, value):
+        if variant not in self.columns:
+            self.add_variant(variant, None)
+        self.columns[variant][self.rows[name]] = as_cell(value)
+
+    def set_values(self, cells):
+        """
+        Applies a batch of (parameter, variant, value) changes (range paste, fill down).
+
+        Missing variants are created once; returns the number of cells whose value actually changed.
+        """
+        changed = 0
+        for name, variant, value in cells:
+            column = self.columns.get(variant)
+            if column is None:
+                self.add_variant(variant, None)
+                column = self.columns[variant]
+            row = self.rows[name]
+            value = as_cell(value)
+            if column[row] != value:
+                column[row] = value
+                changed += 1
+        return changed
+
+    # ----------------- Variants (columns) -----------------
+    def add_variant(self, variant, default=""):
+        """Adds a column; every parameter gets `default` (None = parameter does not have the variant)."""
+        if variant in self.columns:
+            raise KeyError(f"Variant '{variant}' already exists")
+        self.variants.append(sys.intern(variant))
+        self.columns[variant] = [as_cell(default)] * len(self.names)
+
+    def remove_variant(self, variant):
+        self.variants.remove(variant)
+        del self.columns[variant]
+
+    def rename_variant(self, old_variant, new_variant):
+        if new_variant in self.columns:
+            raise KeyError(f"Variant '{new_variant}' already exists")
+        self.variants[self.variants.index(old_variant)] = sys.intern(new_variant)
+        self.columns[new_variant] = self.columns.pop(old_variant)
+
+    # ----------------- Conversion -----------------
+    def to_dict(self):
+        """The category in its JSON form: {parameter: {variant: value}}."""
+        columns = [(variant, self.columns[variant]) for variant in self.variants]
+        return {
+            name: {variant: column[row] for variant, column in columns if column[row] is not None}
+            for row, name in enumerate(self.names)
+        }
+
+    def copy(self):
+        return ParameterTable(self.to_dict())
+
+    def __repr__(self):
+        return f"ParameterTable({len(self.names)} parameters, variants={self.variants!r})"
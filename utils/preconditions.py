@@ -0,0 +1,134 @@
+"""
+Reusable precondition tests.
+
+A line of a test's "Precondition" of the form
+
+    call TC_Setup_Session
+    Call TC_Power_On, TC_Setup_Session
+
+refers to other tests by name. In "Description TCG" such a line is replaced by
+the referenced test's own precondition (expanded the same way, recursively)
+followed by its actions, each prefixed with the test name:
+
+    PRECONDITION:
+    1. ECU is powered
+    2. [TC_Setup_Session] Send request 'Req_Session' Check response 'Res_Session'
+
+Expansions are memoized per referenced test. The expander keeps a reverse
+index (test -> tests whose precondition calls it), so when a test changes only
+its own expansion and those of its direct and indirect callers are dropped.
+Cycles (A calls B calls A) and calls to missing tests are reported inline
+instead of being expanded.
+"""
+import re
+
+from utils.test_steps import format_step
+
+CALL_LINE = re.compile(r"^\s*call\s+(.+?)\s*$", re.IGNORECASE)
+
+
+def precondition_parts(precondition):
+    """[("text", line) | ("call", [test names])] for every non-empty line of a precondition."""
+    parts = []
+    for line in str(precondition or "").splitlines():
+        match = CALL_LINE.match(line)
+        if match:
+            parts.append(("call", [name.strip() for name in match.group(1).split(",") if name.strip()]))
+        elif line.strip():
+            parts.append(("text", line.strip()))
+    return parts
+
+
+def called_tests(precondition):
+    """Names of the tests referenced by `call` lines, in order."""
+    return [name for kind, value in precondition_parts(precondition) if kind == "call" for name in value]
+
+
+class PreconditionExpander:
+    """Memoized `call` expansion over tests_data (see the module docstring)."""
+
+    def __init__(self):
+        self.expansions = {}  # test -> liniile în care se expandează `call <test>`
+        self.calls = {}  # test -> testele apelate din precondiția lui
+        self.callers = {}  # test -> testele care îl apelează
+
+    # ----------------- Index -----------------
+    def update_test(self, test_name, test_data):
+        """(Re)indexează apelurile unui test după o modificare și invalidează expansiunile care depind de el."""
+        self.remove_test(test_name)
+        calls = set(called_tests(test_data.get("Precondition", "")))
+        self.calls[test_name] = calls
+        for called in calls:
+            self.callers.setdefault(called, set()).add(test_name)
+
+    def remove_test(self, test_name):
+        self.invalidate(test_name)
+        for called in self.calls.pop(test_name, ()):
+            callers = self.callers.get(called)
+            if callers is not None:
+                callers.discard(test_name)
+                if not callers:
+                    del self.callers[called]
+
+    def tests_calling(self, test_names):
+        """Every test that calls one of `test_names`, directly or through other tests."""
+        found = set()
+        stack = list(test_names)
+        while stack:
+            for caller in self.callers.get(stack.pop(), ()):
+                if caller not in found:
+                    found.add(caller)
+                    stack.append(caller)
+        return found
+
+    def invalidate(self, test_name):
+        """Drops the expansion of `test_name` and of every test that calls it."""
+        self.expansions.pop(test_name, None)
+        for caller in self.tests_calling([test_name]):
+            self.expansions.pop(caller, None)
+
+    def clear(self):
+        """Drops every expansion (commands or parameters changed, so all rendered steps may differ)."""
+        self.expansions.clear()
+
+    # ----------------- Expansion -----------------
+    def precondition_lines(self, test_name, test_data, tests_data, commands_data, parameters_data):
+        """The precondition of `test_data` with every `call` line expanded (unnumbered lines)."""
+        return self._precondition_lines(test_data, tests_data, commands_data, parameters_data, (test_name,))[0]
+
+    def _precondition_lines(self, test_data, tests_data, commands_data, parameters_data, stack):
+        lines = []
+        cacheable = True
+        for kind, value in precondition_parts(test_data.get("Precondition", "")):
+            if kind == "text":
+                lines.append(value)
+                continue
+            for called in value:
+                called_lines, called_cacheable = self._expand(called, tests_data, commands_data, parameters_data, stack)
+                lines.extend(called_lines)
+                cacheable = cacheable and called_cacheable
+        return lines, cacheable
+
+    def _expand(self, test_name, tests_data, commands_data, parameters_data, stack):
+        """(lines of `call test_name`, whether they may be memoized)."""
+        if test_name in stack:
+            # ✅ Mesajul depinde de drumul prin care s-a ajuns aici, deci nu este memorat
+            return [f"⚠️ call {test_name}: cycle {' -> '.join(stack + (test_name,))}"], False
+
+        cached = self.expansions.get(test_name)
+        if cached is not None:
+            return cached, True
+
+        test_data = tests_data.get(test_name)
+        if test_data is None:
+            return [f"⚠️ call {test_name}: test not found"], True
+
+        lines, cacheable = self._precondition_lines(test_data, tests_data, commands_data, parameters_data,
+                                                    stack + (test_name,))
+        for index in range(len(test_data.get("Steps", []))):
+            action, expected = format_step(test_data, index, commands_data, parameters_data)
+            lines.append(f"[{test_name}] {action} {expected}")
+
+        if cacheable:
+            self.expansions[test_name] = lines
+        return lines, cacheable
@@ -0,0 +1,117 @@
+"""
+Binary snapshot cache for the JSON data files.
+
+Next to every data file (e.g. `data/tests.json`) a `tests.json.snapshot` file
+keeps a marshal image of the parsed data together with the size, mtime and
+hash of the JSON file it was built from. The JSON file stays the source of
+truth: a snapshot is only used when all three still match, otherwise it is
+ignored and rebuilt on the next load or save.
+
+A snapshot is trusted local data, written by the tool itself and validated
+against the JSON file by size, mtime and sha1. That check detects stale
+snapshots, not crafted ones: marshal, like pickle, is not secure against
+malicious data, so disable the cache for folders others can write to.
+
+Set the environment variable `TEST_SPEC_SNAPSHOTS=0` to disable the cache.
+"""
+import gc
+import hashlib
+import marshal
+import os
+import struct
+import sys
+from contextlib import contextmanager
+
+SNAPSHOT_SUFFIX = ".snapshot"
+MAGIC = b"TSSNAP01"
+FORMAT = (marshal.version, sys.version_info[:2])
+
+ENABLED = os.environ.get("TEST_SPEC_SNAPSHOTS", "1") != "0"
+
+
+@contextmanager
+def gc_paused():
+    """Pauses the cyclic GC while decoding; the data files only produce acyclic dicts/lists."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def snapshot_path(json_path):
+    return json_path + SNAPSHOT_SUFFIX
+
+
+def content_hash(raw_bytes):
+    """Hash used to validate a snapshot against the JSON bytes it was built from."""
+    return hashlib.sha1(raw_bytes).digest()
+
+
+def file_hash(json_path):
+    digest = hashlib.sha1()
+    with open(json_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def load_snapshot(json_path):
+    """Returns the cached data for `json_path`, or None if there is no valid snapshot."""
+    if not ENABLED:
+        return None
+
+    try:
+        stat = os.stat(json_path)
+        with open(snapshot_path(json_path), "rb") as file:
+            raw = file.read()
+        if raw[:len(MAGIC)] != MAGIC:
+            return None
+
+        # ✅ Layout: MAGIC | header length (4 bytes) | marshal(header) | marshal(data)
+        view = memoryview(raw)
+        header_end = len(MAGIC) + 4 + struct.unpack_from("<I", raw, len(MAGIC))[0]
+        snapshot_format, size, mtime_ns, digest = marshal.loads(view[len(MAGIC) + 4:header_end])
+        if snapshot_format != FORMAT:
+            return None
+        if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            return None
+        if digest != file_hash(json_path):
+            return None
+        with gc_paused():
+            return marshal.loads(view[header_end:])
+    except (OSError, EOFError, ValueError, TypeError, struct.error):
+        return None
+
+
+def store_snapshot(json_path, data, digest):
+    """Writes a snapshot of `data` next to `json_path`; `digest` is `content_hash` of the JSON bytes."""
+    if not ENABLED:
+        return
+
+    target = snapshot_path(json_path)
+    temporary = target + ".tmp"
+    try:
+        stat = os.stat(json_path)
+        header = marshal.dumps((FORMAT, stat.st_size, stat.st_mtime_ns, digest))
+        with open(temporary, "wb") as file:
+            file.write(MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            file.write(marshal.dumps(data))
+        os.replace(temporary, target)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not write snapshot for {json_path}: {e}")
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+
+def discard_snapshot(json_path):
+    try:
+        os.remove(snapshot_path(json_path))
+    except OSError:
+        pass
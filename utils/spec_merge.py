@@ -0,0 +1,350 @@
+"""
+Three-way merge of the JSON data files, one entry (test, command, parameter) at a time.
+
+Several instances of the tool can save into the same `data/` folder. Before a
+save overwrites a file that changed on disk since this instance last loaded or
+saved it, the three versions are merged entry by entry:
+
+    local   what this instance is about to save
+    disk    what is on disk now
+    base    hashes of every entry as this instance last synced the file:
+            `local_hashes` (its own in-memory version) and `written_hashes`
+            (what was on disk / what it wrote)
+
+An entry is "an item of the top-level object" (merge depth 1: tests, generic
+commands, suites) or "an item of an item" (depth 2: parameters, per category).
+For every entry:
+
+    changed only locally    -> local version
+    changed only on disk    -> disk version (also added / deleted on disk)
+    changed on both sides   -> conflict: the local version wins, unless it
+                               was deleted locally (then the disk edit is kept)
+
+The same rules merge revisions of the files kept in git (`merge_revisions`),
+where the base is a real third revision. There, an entry changed on both sides
+is merged one field further down (a test's Description vs. its Steps, a
+parameter's variants), so only edits of the same field conflict. Unchanged
+entries are skipped by comparing their hashes. Command line:
+
+    python -m utils.spec_merge diff old/tests.json new/tests.json
+    python -m utils.spec_merge merge BASE OURS THEIRS [-o OUTPUT] [--path PATH]
+
+`merge` writes the result over OURS by default and exits with status 1 when
+there were conflicts, so it can be used as a git merge driver. Git hands the
+driver temporary files (`.merge_file_XXXXXX`), so the real path is passed with
+`--path %P` to pick the merge depth. Conflicting fields keep our version in the
+file; both versions are listed in `PATH.conflicts` (JSON) for resolution:
+
+    git config merge.testspec.driver "python -m utils.spec_merge merge %O %A %B --path %P"
+    echo "data/*.json merge=testspec" >> .gitattributes
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import namedtuple
+from collections.abc import Mapping
+
+MergeResult = namedtuple("MergeResult", "data from_disk conflicts")
+RevisionMerge = namedtuple("RevisionMerge", "data ours theirs conflicts")  # conflicts: [(entry key, field or None)]
+
+CATEGORY_MARKER = None  # 🔹 La adâncimea 2, fiecare categorie are și o intrare proprie (pentru categoriile goale)
+MISSING = object()  # 🔹 Valoare absentă într-o revizie (diferită de null)
+
+
+def entry_hash(value):
+    # ✅ JSON, nu marshal: marshal depinde de identitatea obiectelor (referințe, string-uri internate)
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")).digest()
+
+
+def flatten(data, depth):
+    """{entry key (tuple): value} for `data` at the given merge depth."""
+    if depth == 1:
+        return {(key,): value for key, value in data.items()}
+
+    entries = {}
+    for category, items in data.items():
+        entries[(category,)] = CATEGORY_MARKER
+        if isinstance(items, Mapping):
+            for name, value in items.items():
+                entries[(category, name)] = value
+    return entries
+
+
+def unflatten(entries, depth):
+    if depth == 1:
+        return {key[0]: value for key, value in entries.items()}
+
+    data = {}
+    for key, value in entries.items():
+        items = data.setdefault(key[0], {})
+        if len(key) == 2:
+            items[key[1]] = value
+    return data
+
+
+def entry_hashes(data, depth):
+    return {key: entry_hash(value) for key, value in flatten(data, depth).items()}
+
+
+def merge(local, disk, local_hashes, written_hashes, depth=1):
+    """
+    Merges `local` and `disk` against the last synced version (see the module docstring).
+
+    Returns MergeResult(data, from_disk, conflicts): the merged data, the entry keys taken from
+    disk, and the entry keys changed on both sides.
+    """
+    local_entries = flatten(local, depth)
+    disk_entries = flatten(disk, depth)
+
+    merged = {}
+    from_disk = []
+    conflicts = []
+    for key in list(local_entries) + [key for key in disk_entries if key not in local_entries]:
+        local_hash = entry_hash(local_entries[key]) if key in local_entries else None
+        disk_hash = entry_hash(disk_entries[key]) if key in disk_entries else None
+        in_local = local_hash is not None
+        in_disk = disk_hash is not None
+        local_changed = local_hash != local_hashes.get(key)
+        disk_changed = disk_hash != written_hashes.get(key)
+
+        if local_changed and disk_changed and local_hash != disk_hash:
+            conflicts.append(key)
+            use_disk = not in_local  # ✅ Ștergere locală vs. editare pe disc: păstrăm editarea
+        else:
+            # ✅ Neschimbat local => versiunea de pe disc (poate fi una preluată deja la o îmbinare anterioară)
+            use_disk = not local_changed
+
+        if use_disk:
+            if in_disk:
+                merged[key] = disk_entries[key]
+            if local_hash != disk_hash:
+                from_disk.append(key)
+        elif in_local:
+            merged[key] = local_entries[key]
+
+    return MergeResult(unflatten(merged, depth), from_disk, conflicts)
+
+
+def diff_entries(current, new, depth=1):
+    """
+    (added, changed, removed) entry keys of `new` compared to `current`, in `new`'s order.
+
+    Used to apply a file changed on disk to the in-memory data one entry at a time. Values are compared
+    directly, so `current` may hold mappings that are not plain dicts (e.g. ParameterTable rows).
+    """
+    current_entries = flatten(current, depth)
+    new_entries = flatten(new, depth)
+    added = [key for key in new_entries if key not in current_entries]
+    changed = [key for key, value in new_entries.items()
+               if key in current_entries and current_entries[key] != value]
+    removed = [key for key in current_entries if key not in new_entries]
+    return added, changed, removed
+
+
+def describe_key(key):
+    return "/".join(str(part) for part in key)
+
+
+# ----------------- Revisions (git) -----------------
+def changed_fields(old, new):
+    """Fields (top-level keys) that differ between two versions of an entry, in order."""
+    if not isinstance(old, Mapping) or not isinstance(new, Mapping):
+        return [] if old == new else [None]
+    return [field for field in list(old) + [field for field in new if field not in old]
+            if old.get(field, MISSING) != new.get(field, MISSING)]
+
+
+def diff_revisions(old, new, depth=1):
+    """[(entry key, "added" | "removed" | "changed", changed fields)] between two revisions of a data file."""
+    old_entries, new_entries = flatten(old, depth), flatten(new, depth)
+    old_hashes = {key: entry_hash(value) for key, value in old_entries.items()}
+    changes = []
+    for key, value in new_entries.items():
+        if key not in old_entries:
+            changes.append((key, "added", []))
+        elif entry_hash(value) != old_hashes[key]:
+            changes.append((key, "changed", changed_fields(old_entries[key], value)))
+    changes.extend((key, "removed", []) for key in old_entries if key not in new_entries)
+    return changes
+
+
+def merge_value(base, ours, theirs):
+    """Three-way merge of one value: (merged value, conflict). MISSING stands for "absent"."""
+    if ours == theirs:
+        return ours, False
+    if ours == base:
+        return theirs, False
+    if theirs == base:
+        return ours, False
+    return ours, True
+
+
+def merge_entry(base, ours, theirs):
+    """(merged entry or MISSING, [conflicting fields]); edits of different fields do not conflict."""
+    if ours is MISSING or theirs is MISSING or not isinstance(ours, Mapping) or not isinstance(theirs, Mapping):
+        if ours is MISSING or theirs is MISSING:
+            # ✅ Ștergere pe o parte, modificare pe cealaltă: păstrăm modificarea
+            return (theirs if ours is MISSING else ours), [None]
+        return ours, [None]
+
+    base = base if isinstance(base, Mapping) else {}
+    merged = {}
+    conflicts = []
+    for field in list(ours) + [field for field in theirs if field not in ours]:
+        value, conflict = merge_value(base.get(field, MISSING), ours.get(field, MISSING), theirs.get(field, MISSING))
+        if conflict:
+            conflicts.append(field)
+        if value is not MISSING:
+            merged[field] = value
+    return merged, conflicts
+
+
+def merge_revisions(base, ours, theirs, depth=1):
+    """
+    Three-way merge of revisions of a data file (see the module docstring).
+
+    Returns RevisionMerge(data, ours, theirs, conflicts): the merged data, the entry keys taken from
+    each side, and [(entry key, field)] for the edits that conflict (field None = the whole entry);
+    conflicting fields keep our version.
+    """
+    base_entries, our_entries, their_entries = flatten(base, depth), flatten(ours, depth), flatten(theirs, depth)
+    base_hashes = {key: entry_hash(value) for key, value in base_entries.items()}
+
+    merged = {}
+    taken_ours, taken_theirs, conflicts = [], [], []
+    for key in list(our_entries) + [key for key in their_entries if key not in our_entries]:
+        our_hash = entry_hash(our_entries[key]) if key in our_entries else None
+        their_hash = entry_hash(their_entries[key]) if key in their_entries else None
+        base_hash = base_hashes.get(key)
+
+        if our_hash == their_hash or their_hash == base_hash:
+            value = our_entries.get(key, MISSING)
+        elif our_hash == base_hash:
+            value = their_entries.get(key, MISSING)
+        else:
+            value, fields = merge_entry(base_entries.get(key, MISSING), our_entries.get(key, MISSING),
+                                        their_entries.get(key, MISSING))
+            conflicts.extend((key, field) for field in fields)
+
+        if our_hash != base_hash and our_hash != their_hash:
+            taken_ours.append(key)
+        if their_hash != base_hash and our_hash != their_hash:
+            taken_theirs.append(key)
+        if value is not MISSING:
+            merged[key] = value
+
+    return RevisionMerge(unflatten(merged, depth), taken_ours, taken_theirs, conflicts)
+
+
+def merge_depth(file_path):
+    """Merge depth of a data file: parameters.json is merged per parameter, the other files per entry."""
+    return 2 if os.path.basename(file_path).startswith("parameters") else 1
+
+
+def conflict_report(base, ours, theirs, conflicts, depth=1):
+    """[{entry, field, base, ours, theirs}] for the conflicts of `merge_revisions`; absent values are left out."""
+    revisions = {name: flatten(data, depth) for name, data in (("base", base), ("ours", ours), ("theirs", theirs))}
+    report = []
+    for key, field in conflicts:
+        item = {"entry": describe_key(key), "field": field}
+        for name, entries in revisions.items():
+            value = entries.get(key, MISSING)
+            if field is not None:
+                value = value.get(field, MISSING) if isinstance(value, Mapping) else MISSING
+            if value is not MISSING:
+                item[name] = value
+        report.append(item)
+    return report
+
+
+def conflict_report_path(file_path):
+    """The file next to `file_path` listing both versions of its conflicting entries / fields."""
+    return file_path + ".conflicts"
+
+
+def write_conflict_report(file_path, report, keep_existing=False):
+    """
+    Writes `report` (see `conflict_report`) to `conflict_report_path(file_path)` and returns that path.
+
+    With `keep_existing`, the conflicts already listed there (and not in `report`) are kept.
+    """
+    path = conflict_report_path(file_path)
+    if keep_existing and os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as file:
+                existing = json.load(file)
+        except (OSError, ValueError):
+            existing = []
+        replaced = {(item["entry"], item["field"]) for item in report}
+        report = [item for item in existing if (item.get("entry"), item.get("field")) not in replaced] + report
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4, ensure_ascii=False)
+    return path
+
+
+def describe_conflict(key, field):
+    return describe_key(key) if field is None else f"{describe_key(key)} [{field}]"
+
+
+def main(argv=None):
+    from utils.json_io import dump_json_bytes, is_compressed, load_json_file
+
+    parser = argparse.ArgumentParser(description="Diff and three-way merge of the tool's JSON data files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    diff_parser = commands.add_parser("diff", help="list the tests / commands / parameters that differ")
+    diff_parser.add_argument("old")
+    diff_parser.add_argument("new")
+    merge_parser = commands.add_parser("merge", help="merge OURS and THEIRS against BASE")
+    merge_parser.add_argument("base")
+    merge_parser.add_argument("ours")
+    merge_parser.add_argument("theirs")
+    merge_parser.add_argument("-o", "--output", help="output file (default: overwrite OURS, as git expects)")
+    merge_parser.add_argument("--path", help="real path of the merged file (git: %%P); picks the merge depth and "
+                                             "names the PATH.conflicts report")
+    for sub_parser in (diff_parser, merge_parser):
+        sub_parser.add_argument("--depth", type=int, choices=(1, 2),
+                                help="1 = per top-level entry, 2 = per parameter (default: from the file name)")
+    args = parser.parse_args(argv)
+
+    def load(path):
+        # ✅ Citire directă, fără read_json: git transmite fișiere temporare, care nu trebuie să primească snapshot
+        if not os.path.exists(path) or not os.path.getsize(path):
+            return {}
+        return load_json_file(path)
+
+    if args.command == "diff":
+        depth = args.depth or merge_depth(args.new)
+        changes = diff_revisions(load(args.old), load(args.new), depth)
+        marks = {"added": "+", "removed": "-", "changed": "~"}
+        for key, change, fields in changes:
+            details = f": {', '.join(str(field) for field in fields)}" if fields and fields != [None] else ""
+            print(f"{marks[change]} {describe_key(key)}{details}")
+        print(f"{len(changes)} entr(y/ies) differ.", file=sys.stderr)
+        return 0
+
+    # ✅ OURS este un fișier temporar al lui git; numele real (`--path %P`) decide adâncimea
+    target = args.path or args.output or args.ours
+    depth = args.depth or merge_depth(target)
+    base, ours, theirs = load(args.base), load(args.ours), load(args.theirs)
+    result = merge_revisions(base, ours, theirs, depth)
+    with open(args.output or args.ours, "wb") as file:
+        # ✅ Fără snapshot (git lucrează pe fișiere temporare); formatul (comprimat sau nu) este cel din OURS
+        file.write(dump_json_bytes(result.data, is_compressed(args.ours)))
+    print(f"🔀 Merged: {len(result.ours)} change(s) from ours, {len(result.theirs)} from theirs.", file=sys.stderr)
+
+    # 🔹 Markerii de conflict ar strica JSON-ul; ambele versiuni ale câmpurilor în conflict merg într-un fișier alăturat
+    report_path = conflict_report_path(target)
+    if result.conflicts:
+        write_conflict_report(target, conflict_report(base, ours, theirs, result.conflicts, depth))
+        for key, field in result.conflicts:
+            print(f"⚠️ Conflict (ours kept): {describe_conflict(key, field)}", file=sys.stderr)
+        print(f"⚠️ Both versions of every conflict are listed in '{report_path}'.", file=sys.stderr)
+    elif os.path.exists(report_path):
+        os.remove(report_path)  # ✅ Raportul unui merge anterior nu mai este valabil
+    return 1 if result.conflicts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
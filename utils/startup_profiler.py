@@ -0,0 +1,47 @@
+"""
+Startup profiler used by `main.py --profile-startup`.
+
+Records how long module imports and widget construction take during startup
+and prints a breakdown once the main window has been shown.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.perf_counter()
+        self.records = []  # (kind, name, milliseconds)
+
+    @contextmanager
+    def measure(self, kind, name):
+        """Times the enclosed block as `kind` ("import" / "construct" / ...) when profiling is enabled."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append((kind, name, (time.perf_counter() - start) * 1000.0))
+
+    def report(self, stream=None):
+        """Prints the recorded breakdown grouped by kind, plus the total time since process start."""
+        if not self.enabled:
+            return
+
+        stream = stream or sys.stdout
+        stream.write("⏱ Startup profile\n")
+        for kind in dict.fromkeys(kind for kind, _, _ in self.records):
+            entries = [(name, ms) for record_kind, name, ms in self.records if record_kind == kind]
+            stream.write(f"  {kind} ({sum(ms for _, ms in entries):.1f} ms)\n")
+            for name, ms in entries:
+                stream.write(f"    {name:<40}{ms:>10.1f} ms\n")
+        stream.write(f"  total until first paint{(time.perf_counter() - self.started_at) * 1000.0:>27.1f} ms\n")
+        stream.flush()
+
+
+profiler = StartupProfiler()
@@ -0,0 +1,207 @@
+"""
+Test suites: a folder hierarchy over the flat `tests_data`.
+
+Membership lives in `suites.json`, next to tests.json, as one flat record per
+folder keyed by its path:
+
+    {
+        "":                   {"Folders": ["Diagnostics", "Network"], "Tests": []},
+        "Diagnostics":        {"Folders": ["Session"], "Tests": ["TC_001", "TC_002"]},
+        "Diagnostics/Session": {"Folders": [], "Tests": ["TC_003"]},
+        "Network":            {"Folders": [], "Tests": ["TC_010"]}
+    }
+
+A folder lists only its direct children, so showing a collapsed tree needs the
+root record alone and expanding a node needs only that node's record. Tests
+that are in no folder are simply absent from the file; tests.json is not
+touched. The set of tests below a folder (used by the folder filter) is
+computed from its own subtree and cached until something inside it changes.
+"""
+SEPARATOR = "/"
+ROOT = ""
+
+
+def join_path(parent, name):
+    return f"{parent}{SEPARATOR}{name}" if parent else name
+
+
+def parent_path(path):
+    return path.rpartition(SEPARATOR)[0]
+
+
+def folder_name(path):
+    return path.rpartition(SEPARATOR)[2]
+
+
+class SuiteTree:
+    """Folder path -> {"Folders": [...], "Tests": [...]} (see the module docstring)."""
+
+    def __init__(self, data=None):
+        self.nodes = {ROOT: {"Folders": [], "Tests": []}}
+        for path, node in (data or {}).items():
+            self.nodes[path] = {"Folders": list(node.get("Folders", [])), "Tests": list(node.get("Tests", []))}
+        self.test_folders = None  # 🔹 test -> folder, construit la prima căutare
+        self.subtree_cache = {}
+
+    # ----------------- Queries -----------------
+    def __contains__(self, path):
+        return path in self.nodes
+
+    def child_folders(self, path):
+        """Full paths of the direct subfolders of `path`."""
+        return [join_path(path, name) for name in self.nodes[path]["Folders"]]
+
+    def tests(self, path):
+        """Tests placed directly in `path`."""
+        return list(self.nodes[path]["Tests"])
+
+    def has_children(self, path):
+        node = self.nodes[path]
+        return bool(node["Folders"] or node["Tests"])
+
+    def all_folders(self):
+        """Every folder path, depth first, in display order."""
+        folders = []
+        stack = list(reversed(self.child_folders(ROOT)))
+        while stack:
+            path = stack.pop()
+            folders.append(path)
+            stack.extend(reversed(self.child_folders(path)))
+        return folders
+
+    def folder_of(self, test_name):
+        """The folder containing `test_name`, or None for tests outside any suite."""
+        if self.test_folders is None:
+            self.test_folders = {test: path for path, node in self.nodes.items() for test in node["Tests"]}
+        return self.test_folders.get(test_name)
+
+    def subtree_tests(self, path):
+        """frozenset of the tests in `path` and all its subfolders (cached)."""
+        tests = self.subtree_cache.get(path)
+        if tests is None:
+            tests = set(self.nodes[path]["Tests"])
+            for child in self.child_folders(path):
+                tests.update(self.subtree_tests(child))
+            tests = self.subtree_cache[path] = frozenset(tests)
+        return tests
+
+    # ----------------- Folders -----------------
+    def add_folder(self, parent, name):
+        """Creates `name` under `parent` and returns its path."""
+        name = name.strip()
+        if not name or SEPARATOR in name:
+            raise ValueError(f"Invalid folder name '{name}'")
+        path = join_path(parent, name)
+        if path in self.nodes:
+            raise KeyError(f"Folder '{path}' already exists")
+
+        self.nodes[parent]["Folders"].append(name)
+        self.nodes[path] = {"Folders": [], "Tests": []}
+        return path
+
+    def descendants(self, path):
+        """`path` and all its subfolders."""
+        paths = [path]
+        for child in self.child_folders(path):
+            paths.extend(self.descendants(child))
+        return paths
+
+    def rename_folder(self, path, new_name):
+        """Renames the last component of `path`; returns the new path."""
+        new_name = new_name.strip()
+        if not new_name or SEPARATOR in new_name:
+            raise ValueError(f"Invalid folder name '{new_name}'")
+        parent = parent_path(path)
+        new_path = join_path(parent, new_name)
+        if new_path in self.nodes:
+            raise KeyError(f"Folder '{new_path}' already exists")
+
+        siblings = self.nodes[parent]["Folders"]
+        siblings[siblings.index(folder_name(path))] = new_name
+        for old in self.descendants(path):
+            self.nodes[new_path + old[len(path):]] = self.nodes.pop(old)
+
+        self.invalidate(parent)
+        self.subtree_cache = {key: value for key, value in self.subtree_cache.items()
+                              if key != path and not key.startswith(path + SEPARATOR)}
+        self.test_folders = None
+        return new_path
+
+    def remove_folder(self, path):
+        """Deletes a folder and its subfolders; their tests go back to "no suite". Returns the released tests."""
+        released = []
+        for descendant in self.descendants(path):
+            released.extend(self.nodes.pop(descendant)["Tests"])
+            self.subtree_cache.pop(descendant, None)
+
+        parent = parent_path(path)
+        self.nodes[parent]["Folders"].remove(folder_name(path))
+        self.invalidate(parent)
+        self.test_folders = None
+        return released
+
+    # ----------------- Membership -----------------
+    def move_tests(self, test_names, path):
+        """Moves tests into `path` (ROOT = out of every suite)."""
+        for test_name in test_names:
+            current = self.folder_of(test_name)
+            if current == path:
+                continue
+            if current is not None:
+                self.nodes[current]["Tests"].remove(test_name)
+                self.invalidate(current)
+                del self.test_folders[test_name]
+            if path != ROOT:
+                self.nodes[path]["Tests"].append(test_name)
+                self.invalidate(path)
+                self.test_folders[test_name] = path
+
+    def remove_test(self, test_name):
+        self.move_tests([test_name], ROOT)
+
+    def rename_test(self, old_name, new_name):
+        path = self.folder_of(old_name)
+        if path is None:
+            return False
+        tests = self.nodes[path]["Tests"]
+        tests[tests.index(old_name)] = new_name
+        del self.test_folders[old_name]
+        self.test_folders[new_name] = path
+        self.invalidate(path)
+        return True
+
+    def add_test_after(self, test_name, existing_name):
+        """Places `test_name` in the same folder as `existing_name`, right after it (used by Duplicate)."""
+        path = self.folder_of(existing_name)
+        if path is None:
+            return False
+        tests = self.nodes[path]["Tests"]
+        tests.insert(tests.index(existing_name) + 1, test_name)
+        self.test_folders[test_name] = path
+        self.invalidate(path)
+        return True
+
+    def retain(self, existing_tests):
+        """Drops members that are no longer in `existing_tests`; returns True if anything was removed."""
+        removed = False
+        for path, node in self.nodes.items():
+            kept = [test for test in node["Tests"] if test in existing_tests]
+            if len(kept) != len(node["Tests"]):
+                node["Tests"] = kept
+                self.invalidate(path)
+                removed = True
+        if removed:
+            self.test_folders = None
+        return removed
+
+    def invalidate(self, path):
+        """Drops the cached subtree of `path` and of its ancestors."""
+        while True:
+            self.subtree_cache.pop(path, None)
+            if path == ROOT:
+                return
+            path = parent_path(path)
+
+    def to_dict(self):
+        return {path: {"Folders": list(node["Folders"]), "Tests": list(node["Tests"])}
+                for path, node in self.nodes.items()}
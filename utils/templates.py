@@ -0,0 +1,101 @@
+"""
+Compiled placeholder templates for generic commands.
+
+A command's Action / Expected Result text such as
+"Check if signal {Signals} is equal with value {Values}." is compiled once into
+a tuple of tokens: literal strings and `Slot` objects naming the parameter
+category to fill in. Placeholders are found anywhere in the text, so
+"{Request}," or "{Signals}/{Values}" work as expected.
+
+Compiled forms are cached by their source text, so a command is compiled once
+and recompiled automatically after it is edited.
+"""
+import html
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+PLACEHOLDER = re.compile(r"\{([^{}\s][^{}]*)\}")
+
+Slot = namedtuple("Slot", "category")  # 🔹 Placeholder pentru o categorie de parametri
+CommandTemplate = namedtuple("CommandTemplate", "action expected categories")
+
+HIGHLIGHT_STYLE = "background-color: yellow; font-weight: bold;"
+BOUND_STYLE = "background-color: #C8F7C5; font-weight: bold;"
+
+
+@lru_cache(maxsize=8192)  # 🔹 Două texte (Action, Expected) per comandă din `compile_command_text`
+def compile_template(text):
+    """Splits `text` into a tuple of literal strings and `Slot` tokens."""
+    tokens = []
+    position = 0
+    for match in PLACEHOLDER.finditer(text or ""):
+        if match.start() > position:
+            tokens.append(text[position:match.start()])
+        tokens.append(Slot(match.group(1).strip()))
+        position = match.end()
+    if position < len(text or ""):
+        tokens.append(text[position:])
+    return tuple(tokens)
+
+
+def template_categories(tokens):
+    """Categories used by `tokens`, in order of first appearance."""
+    return tuple(dict.fromkeys(token.category for token in tokens if isinstance(token, Slot)))
+
+
+@lru_cache(maxsize=4096)
+def compile_command_text(action, expected):
+    action_tokens = compile_template(action)
+    expected_tokens = compile_template(expected)
+    return CommandTemplate(action_tokens, expected_tokens,
+                           template_categories(action_tokens + expected_tokens))
+
+
+def compile_command(command_data):
+    """Compiled form of a generic command ({"Action": ..., "Expected Result": ...})."""
+    return compile_command_text(command_data.get("Action", ""), command_data.get("Expected Result", ""))
+
+
+def render_template(tokens, bindings):
+    """Fills every slot with `bindings[category]`; unbound slots stay as "{category}"."""
+    return "".join(
+        token if not isinstance(token, Slot) else bindings.get(token.category, f"{{{token.category}}}")
+        for token in tokens
+    )
+
+
+@lru_cache(maxsize=4096)
+def template_regex(tokens):
+    """
+    Regex that matches texts rendered from `tokens`, plus a map group name -> category.
+
+    A category used twice must render to the same value both times.
+    """
+    parts = []
+    groups = {}
+    for token in tokens:
+        if not isinstance(token, Slot):
+            parts.append(re.escape(token))
+        elif token.category in groups.values():
+            group = next(name for name, category in groups.items() if category == token.category)
+            parts.append(f"(?P={group})")
+        else:
+            group = f"slot{len(groups)}"
+            groups[group] = token.category
+            parts.append(f"(?P<{group}>.+?)")
+    return re.compile("".join(parts), re.DOTALL), groups
+
+
+def highlight_template(tokens, bindings=None):
+    """HTML rendering of `tokens`: unbound placeholders are highlighted, bound values are marked."""
+    bindings = bindings or {}
+    parts = []
+    for token in tokens:
+        if not isinstance(token, Slot):
+            parts.append(html.escape(token).replace("\n", "<br>"))
+        elif token.category in bindings:
+            parts.append(f"<span style='{BOUND_STYLE}'>{html.escape(bindings[token.category])}</span>")
+        else:
+            parts.append(f"<span style='{HIGHLIGHT_STYLE}'>{html.escape('{' + token.category + '}')}</span>")
+    return f"<html><body>{''.join(parts)}</body></html>"
@@ -0,0 +1,150 @@
+"""
+Parametrized test generation: one template test x a set of parameters.
+
+A template is an ordinary test in which some categories are left open:
+
+    command step   the category is not bound, or is bound to "{Category}"
+                   {"Command": "Send_req_check_response",
+                    "Parameters": {"Request": "{Request}", "Response": "Res_Default"}}
+    text           "{Category}" in a text step, the Description or the Precondition
+
+Given the parameters chosen for every open category, the generator builds one
+concrete test per combination, either the Cartesian product of the choices or
+the choices zipped position by position (the shortest list wins). Test names
+come from a pattern in which "{Category}" is replaced the same way, e.g.
+"TC_Session_{Request}". Derived fields are computed in worker processes when
+many tests are generated, like the full validation scan.
+"""
+import itertools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.templates import compile_command
+from utils.test_steps import derive_test, is_command_step
+
+CARTESIAN = "Cartesian product"
+ZIP = "Zip (position by position)"
+MODES = (CARTESIAN, ZIP)
+
+PARALLEL_THRESHOLD = 1000
+CHUNK_SIZE = 250
+PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+def open_categories(test_data, commands_data, parameters_data):
+    """Categories left open in a template test, in order of first appearance."""
+    categories = {}
+    texts = [str(test_data.get("Description", "")), str(test_data.get("Precondition", ""))]
+    for step in test_data.get("Steps", []):
+        if not is_command_step(step):
+            texts.extend((step.get("Action", ""), step.get("Expected", "")))
+            continue
+        command = commands_data.get(step["Command"])
+        bindings = step["Parameters"]
+        for category in compile_command(command).categories if command else bindings:
+            if bindings.get(category, f"{{{category}}}") == f"{{{category}}}":
+                categories[category] = None
+    for text in texts:
+        for match in PLACEHOLDER.finditer(text):
+            if match.group(1) in parameters_data:
+                categories[match.group(1)] = None
+    return list(categories)
+
+
+def combinations(selections, mode=CARTESIAN):
+    """[{category: parameter}] for the parameters chosen per category ({category: [names]})."""
+    categories = list(selections)
+    if mode == ZIP:
+        rows = zip(*(selections[category] for category in categories))
+    else:
+        rows = itertools.product(*(selections[category] for category in categories))
+    return [dict(zip(categories, row)) for row in rows]
+
+
+def fill_text(text, binding):
+    for category, param_name in binding.items():
+        text = text.replace(f"{{{category}}}", param_name)
+    return text
+
+
+def instantiate(template, binding, commands_data):
+    """The template with every open category bound (derived fields are not computed here)."""
+    test_data = dict(template)
+    for field in ("Description", "Precondition"):
+        if isinstance(test_data.get(field), str):
+            test_data[field] = fill_text(test_data[field], binding)
+
+    steps = []
+    for step in template.get("Steps", []):
+        if not is_command_step(step):
+            steps.append({"Action": fill_text(step.get("Action", ""), binding),
+                          "Expected": fill_text(step.get("Expected", ""), binding)})
+            continue
+        command = commands_data.get(step["Command"])
+        bindings = dict(step["Parameters"])
+        for category in compile_command(command).categories if command else list(bindings):
+            if bindings.get(category, f"{{{category}}}") == f"{{{category}}}" and category in binding:
+                bindings[category] = binding[category]
+        steps.append({"Command": step["Command"], "Parameters": bindings})
+    test_data["Steps"] = steps
+    # ✅ Step-urile cu o comandă ștearsă păstrează textul template-ului (vezi `sync_step_texts`)
+    test_data["Action"] = list(template.get("Action", []))
+    test_data["Expected Results"] = list(template.get("Expected Results", []))
+    return test_data
+
+
+def test_names(name_pattern, bindings, existing):
+    """A unique name per binding; clashes with `existing` (or between generated tests) get a numeric suffix."""
+    names = []
+    taken = set(existing)
+    for binding in bindings:
+        base = fill_text(name_pattern, binding)
+        name, count = base, 1
+        while name in taken:
+            count += 1
+            name = f"{base}_{count}"
+        taken.add(name)
+        names.append(name)
+    return names
+
+
+def generate_chunk(template, bindings, commands_data, parameters_data):
+    return [derive_test(instantiate(template, binding, commands_data), commands_data, parameters_data)
+            for binding in bindings]
+
+
+worker_data = None  # 🔹 (template, commands_data, parameters_data), trimise o singură dată fiecărui proces
+
+
+def init_worker(template, commands_data, parameters_data):
+    global worker_data
+    worker_data = (template, commands_data, parameters_data)
+
+
+def generate_worker_chunk(bindings):
+    template, commands_data, parameters_data = worker_data
+    return generate_chunk(template, bindings, commands_data, parameters_data)
+
+
+def generate_tests(template, bindings, name_pattern, existing, commands_data, parameters_data, workers=None):
+    """
+    {name: test} for every binding, in order, with all derived fields computed.
+
+    Large batches are split across worker processes; small ones (or environments where processes cannot be
+    started) are generated in the calling thread.
+    """
+    names = test_names(name_pattern, bindings, existing)
+    workers = workers or os.cpu_count() or 1
+    tests = None
+    if len(bindings) >= PARALLEL_THRESHOLD and workers > 1:
+        chunks = [bindings[start:start + CHUNK_SIZE] for start in range(0, len(bindings), CHUNK_SIZE)]
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=init_worker,
+                                     initargs=(template, commands_data, parameters_data)) as pool:
+                tests = [test for chunk in pool.map(generate_worker_chunk, chunks) for test in chunk]
+        except (OSError, RuntimeError) as e:  # ✅ BrokenProcessPool este un RuntimeError
+            print(f"⚠️ Parallel generation unavailable ({e}); generating in one thread.")
+    if tests is None:
+        tests = generate_chunk(template, bindings, commands_data, parameters_data)
+    return dict(zip(names, tests))
@@ -0,0 +1,470 @@
+"""
+Structured test steps.
+
+Every test keeps its steps in a "Steps" list. A step built from a generic
+command stores only the command name and the chosen parameter per category:
+
+    {"Command": "Send_req_check_response",
+     "Parameters": {"Request": "Req_Default", "Response": "Req_Default_2"}}
+
+Steps that do not come from a generic command (legacy text that could not be
+matched to any command) keep their text:
+
+    {"Action": "Power on the ECU", "Expected": "ECU is awake"}
+
+The test's "Action" / "Expected Results" lists are derived from "Steps" and kept
+aligned with it, so older versions of the tool and the XLSX export can still
+read them. They also serve as the fallback text when a step's command has
+been deleted. Rendered texts are cached and interned, so identical steps share
+one string in memory.
+"""
+import json
+import re
+import sys
+from functools import lru_cache
+from itertools import zip_longest
+
+from utils.templates import compile_command, render_template, template_regex
+
+NUMBERED_LINE = re.compile(r"^\s*\d+\.\s")  # 🔹 "1. text" - formatul step-urilor în exportul XLSX
+
+
+# ----------------- Step construction -----------------
+def command_step(command_name, bindings):
+    """Step bound to a generic command; `bindings` maps category -> parameter name."""
+    return {
+        "Command": sys.intern(command_name),
+        "Parameters": {sys.intern(category): sys.intern(name) for category, name in bindings.items()}
+    }
+
+
+def text_step(action, expected):
+    """Free-text step (not linked to a generic command)."""
+    return {"Action": sys.intern(action or ""), "Expected": sys.intern(expected or "")}
+
+
+def is_command_step(step):
+    return "Command" in step
+
+
+# ----------------- Rendering -----------------
+@lru_cache(maxsize=65536)
+def render_bound(template, bindings_key):
+    """Rendered (action, expected) for a compiled command and a sorted tuple of bindings; interned."""
+    bindings = dict(bindings_key)
+    return (sys.intern(render_template(template.action, bindings)),
+            sys.intern(render_template(template.expected, bindings)))
+
+
+def bindings_key(step):
+    return tuple(sorted(step.get("Parameters", {}).items()))
+
+
+def render_step(step, commands_data):
+    """(action, expected) text of `step`, or None if its command no longer exists."""
+    if not is_command_step(step):
+        return step.get("Action", ""), step.get("Expected", "")
+
+    command = commands_data.get(step["Command"])
+    if command is None:
+        return None
+    return render_bound(compile_command(command), bindings_key(step))
+
+
+def sync_step_texts(test_data, commands_data):
+    """
+    Re-derives "Action" / "Expected Results" from "Steps".
+
+    Steps whose command is missing keep the text currently stored at their position.
+    Returns True if any text changed.
+    """
+    steps = test_data.get("Steps", [])
+    old_actions = test_data.get("Action", []) if isinstance(test_data.get("Action"), list) else []
+    old_expected = test_data.get("Expected Results", []) if isinstance(test_data.get("Expected Results"), list) else []
+
+    actions = []
+    expected_results = []
+    for index, step in enumerate(steps):
+        rendered = render_step(step, commands_data)
+        if rendered is None:
+            rendered = (old_actions[index] if index < len(old_actions) else "",
+                        old_expected[index] if index < len(old_expected) else "")
+        actions.append(rendered[0])
+        expected_results.append(rendered[1])
+
+    changed = actions != old_actions or expected_results != old_expected
+    test_data["Action"] = actions
+    test_data["Expected Results"] = expected_results
+    return changed
+
+
+# ----------------- Step list editing (keeps the derived lists aligned) -----------------
+def insert_step(test_data, index, step, commands_data):
+    rendered = render_step(step, commands_data) or ("", "")
+    test_data["Steps"].insert(index, step)
+    test_data["Action"].insert(index, rendered[0])
+    test_data["Expected Results"].insert(index, rendered[1])
+
+
+def insert_steps(test_data, index, steps, commands_data, texts=None):
+    """
+    Inserts several steps at `index` in one go (paste, drop from another test or instance).
+
+    `texts` are the (action, expected) pairs shown where they were copied; they are kept for steps whose command
+    does not exist here.
+    """
+    rendered = []
+    for position, step in enumerate(steps):
+        texts_here = render_step(step, commands_data)
+        if texts_here is None:
+            texts_here = tuple(texts[position]) if texts and position < len(texts) else ("", "")
+        rendered.append(texts_here)
+    test_data["Steps"][index:index] = steps
+    test_data["Action"][index:index] = [action for action, _ in rendered]
+    test_data["Expected Results"][index:index] = [expected for _, expected in rendered]
+
+
+def move_steps(test_data, indices, target):
+    """
+    Moves the steps at `indices` (kept in their order) so they end up before the step that was at `target`
+    (len(steps) = to the end). Returns the new index of the first moved step.
+    """
+    indices = sorted(set(indices))
+    selected = set(indices)
+    new_first = target - sum(1 for index in indices if index < target)
+    for field in ("Steps", "Action", "Expected Results"):
+        values = test_data[field]
+        moved = [values[index] for index in indices]
+        kept = [value for index, value in enumerate(values) if index not in selected]
+        kept[new_first:new_first] = moved
+        values[:] = kept
+    return new_first
+
+
+def delete_step(test_data, index):
+    for field in ("Steps", "Action", "Expected Results"):
+        del test_data[field][index]
+
+
+def swap_steps(test_data, first, second):
+    for field in ("Steps", "Action", "Expected Results"):
+        values = test_data[field]
+        values[first], values[second] = values[second], values[first]
+
+
+# ----------------- Clipboard -----------------
+STEPS_MIME_TYPE = "application/x-test-spec-steps"  # 🔹 Step-uri copiate/trase între teste și între instanțe
+
+
+def encode_steps(test_data, indices, source=None):
+    """Clipboard / drag payload (UTF-8 JSON) for the steps at `indices`; `source` identifies the origin."""
+    indices = sorted(set(indices))
+    return json.dumps({
+        "source": source,
+        "indices": indices,
+        "steps": [test_data["Steps"][index] for index in indices],
+        "texts": [[test_data["Action"][index], test_data["Expected Results"][index]] for index in indices],
+    }, ensure_ascii=False).encode("utf-8")
+
+
+def decode_steps(payload):
+    """{"source", "indices", "steps", "texts"} from `encode_steps` output, or None if it is not valid."""
+    try:
+        data = json.loads(bytes(payload).decode("utf-8"))
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("steps"), list):
+        return None
+    return data
+
+
+def steps_as_text(texts):
+    """Tab separated "action<TAB>expected" lines (what other applications get from the clipboard)."""
+    return "\n".join(f"{action}\t{expected}" for action, expected in texts)
+
+
+def steps_from_text(text):
+    """Text steps parsed from "action<TAB>expected" lines pasted from another application."""
+    steps = []
+    for line in text.splitlines():
+        if line.strip():
+            action, _, expected = line.partition("\t")
+            steps.append(text_step(action.strip(), expected.strip()))
+    return steps
+
+
+# ----------------- Legacy migration -----------------
+def as_text_list(value):
+    """Step texts from a legacy field: a list, or the numbered lines written by the XLSX export."""
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    if not isinstance(value, str) or not value.strip():
+        return []
+    lines = [line for line in value.splitlines() if line.strip()]
+    if all(NUMBERED_LINE.match(line) for line in lines):
+        return [NUMBERED_LINE.sub("", line, count=1) for line in lines]
+    return [value]
+
+
+def parse_step(action, expected, commands_data, parameters_data):
+    """Matches a legacy (action, expected) pair against the generic commands; falls back to a text step."""
+    for command_name, command in commands_data.items():
+        template = compile_command(command)
+        bindings = match_template(template.action, action, {})
+        if bindings is None:
+            continue
+        bindings = match_template(template.expected, expected, bindings)
+        if bindings is None:
+            continue
+        if all(name in parameters_data.get(category, {}) for category, name in bindings.items()):
+            return command_step(command_name, bindings)
+    return text_step(action, expected)
+
+
+def match_template(tokens, text, bindings):
+    """Bindings that render `tokens` into `text`, consistent with `bindings`; None if there are none."""
+    regex, groups = template_regex(tokens)
+    match = regex.fullmatch(text)
+    if match is None:
+        return None
+
+    result = dict(bindings)
+    for group, category in groups.items():
+        value = match.group(group)
+        if result.setdefault(category, value) != value:
+            return None
+    return result
+
+
+def migrate_test(test_data, commands_data, parameters_data):
+    """
+    Builds "Steps" for a test stored in the legacy format (text-only "Action" / "Expected Results").
+
+    Returns True if the test was migrated. Tests that already have "Steps" only get their
+    derived texts re-synced (which interns them).
+    """
+    if isinstance(test_data.get("Steps"), list):
+        sync_step_texts(test_data, commands_data)
+        return False
+
+    actions = as_text_list(test_data.get("Action"))
+    expected_results = as_text_list(test_data.get("Expected Results"))
+    test_data["Steps"] = [
+        parse_step(action, expected, commands_data, parameters_data)
+        for action, expected in zip_longest(actions, expected_results, fillvalue="")
+    ]
+    test_data["Action"] = [action for action, _ in zip_longest(actions, expected_results, fillvalue="")]
+    test_data["Expected Results"] = [expected for _, expected in zip_longest(actions, expected_results, fillvalue="")]
+    sync_step_texts(test_data, commands_data)
+    return True
+
+
+# ----------------- Derived fields -----------------
+def add_variant_values(variant_groups, parameter_name, value_dict):
+    for variant, value in value_dict.items():
+        if value != "":
+            variant_groups.setdefault(variant, set()).add(f"{parameter_name} = {value}")
+
+
+def compute_test_data_description(test_data, parameters_data):
+    """Parameter values used by the test, grouped by variant ("Test Data Description")."""
+    variant_groups = {}
+
+    for step in test_data.get("Steps", []):
+        if is_command_step(step):
+            for category, parameter_name in step["Parameters"].items():
+                value_dict = parameters_data.get(category, {}).get(parameter_name)
+                if isinstance(value_dict, dict):
+                    add_variant_values(variant_groups, parameter_name, value_dict)
+            continue
+
+        # 🔹 Step-uri text: detectăm parametrii cuvânt cu cuvânt, ca în formatul vechi
+        for text in (step.get("Action", ""), step.get("Expected", "")):
+            for word in text.split():
+                for category, param_dict in parameters_data.items():
+                    if word in param_dict:
+                        add_variant_values(variant_groups, word, param_dict[word])
+
+    description = []
+    for variant, values in variant_groups.items():
+        description.append(f"{variant}:")
+        description.extend(sorted(values))
+        description.append("")  # Spațiu după fiecare variantă
+    return description
+
+
+def format_text(step_text, parameters_data):
+    """Încadrează între ' ' cuvintele care sunt parametri (pentru step-uri text)."""
+    formatted_words = []
+    for word in step_text.split():
+        for param_dict in parameters_data.values():
+            if word in param_dict:
+                word = f"'{word}'"
+                break
+        formatted_words.append(word)
+    return " ".join(formatted_words)
+
+
+def format_step(test_data, index, commands_data, parameters_data):
+    """(action, expected) of step `index` with parameter names quoted, as used in "Description TCG"."""
+    step = test_data["Steps"][index]
+    if is_command_step(step) and step["Command"] in commands_data:
+        template = compile_command(commands_data[step["Command"]])
+        quoted = {category: f"'{name}'" for category, name in step["Parameters"].items()}
+        return render_template(template.action, quoted), render_template(template.expected, quoted)
+
+    action = test_data["Action"][index] if index < len(test_data.get("Action", [])) else ""
+    expected = test_data["Expected Results"][index] if index < len(test_data.get("Expected Results", [])) else ""
+    return format_text(action, parameters_data), format_text(expected, parameters_data)
+
+
+def compute_description_tcg(test_data, commands_data, parameters_data, precondition_lines=None):
+    """
+    Builds "Description TCG" (PRECONDITION / ACTION sections) for a test.
+
+    `precondition_lines` is the precondition with its `call` lines already expanded (see
+    utils/preconditions.py); without it a precondition that calls other tests is left out.
+    """
+    steps = test_data.get("Steps", [])
+    if not steps:
+        return []
+
+    description_tcg = ["PRECONDITION:"]
+
+    if precondition_lines is None:
+        precondition_text = test_data.get("Precondition", "").strip()
+        precondition_lines = [precondition_text] if precondition_text and "call" not in precondition_text.lower() else []
+    if precondition_lines:
+        description_tcg.extend(f"{index}. {line}" for index, line in enumerate(precondition_lines, 1))
+        description_tcg.append("")
+
+    description_tcg.append("ACTION:")
+
+    for index in range(len(steps)):
+        formatted_action, formatted_expected = format_step(test_data, index, commands_data, parameters_data)
+        description_tcg.append(f"{index + 1}. {formatted_action} {formatted_expected}")
+
+    return description_tcg
+
+
+
+DERIVED_FIELDS = ("Action", "Expected Results", "Test Data Description", "Description TCG")
+
+
+def derive_test(test_data, commands_data, parameters_data, precondition_lines=None):
+    """Shallow copy of `test_data` with all derived fields regenerated from its steps."""
+    derived = dict(test_data)
+    sync_step_texts(derived, commands_data)
+    derived["Test Data Description"] = compute_test_data_description(derived, parameters_data)
+    derived["Description TCG"] = compute_description_tcg(derived, commands_data, parameters_data, precondition_lines)
+    return derived
+
+
+def token_pattern(word):
+    """Regex for `word` as a whole whitespace-separated token (the way parameters are found in step text)."""
+    return re.compile(r"(?<!\S)" + re.escape(word) + r"(?!\S)")
+
+
+def rename_parameter_in_test(test_data, category, old_name, new_name, rewrite_text=True):
+    """
+    Shallow copy of `test_data` with parameter `old_name` of `category` renamed to `new_name`.
+
+    Command steps bound to it are rebound. With `rewrite_text`, whole-token mentions in text steps
+    are replaced as well. Returns None if nothing in the test changes.
+    """
+    pattern = token_pattern(old_name)
+    steps = list(test_data.get("Steps", []))
+    actions = list(test_data.get("Action", []))
+    expected_results = list(test_data.get("Expected Results", []))
+    changed = False
+
+    for index, step in enumerate(steps):
+        if is_command_step(step):
+            if step["Parameters"].get(category) != old_name:
+                continue
+            steps[index] = command_step(step["Command"], dict(step["Parameters"], **{category: new_name}))
+        elif rewrite_text:
+            action = pattern.sub(new_name, step.get("Action", ""))
+            expected = pattern.sub(new_name, step.get("Expected", ""))
+            if (action, expected) == (step.get("Action", ""), step.get("Expected", "")):
+                continue
+            steps[index] = text_step(action, expected)
+        else:
+            continue
+
+        # 🔹 Textele salvate (folosite dacă comanda lipsește) urmează aceeași redenumire
+        if index < len(actions):
+            actions[index] = pattern.sub(new_name, actions[index])
+        if index < len(expected_results):
+            expected_results[index] = pattern.sub(new_name, expected_results[index])
+        changed = True
+
+    if not changed:
+        return None
+
+    renamed = dict(test_data)
+    renamed["Steps"] = steps
+    renamed["Action"] = actions
+    renamed["Expected Results"] = expected_results
+    return renamed
+
+
+def changed_fields(old_data, new_data, fields=DERIVED_FIELDS):
+    """[(field, old value, new value)] for the fields that differ between two versions of a test."""
+    return [(field, old_data.get(field, []), new_data.get(field, []))
+            for field in fields if old_data.get(field, []) != new_data.get(field, [])]
+
+
+# ----------------- Reverse index -----------------
+class StepIndex:
+    """
+    Reverse index: generic command / (category, parameter) -> names of the tests whose steps use it.
+
+    Words of text steps are indexed too, so a parameter mentioned in free text can be found.
+    """
+
+    def __init__(self):
+        self.by_command = {}
+        self.by_parameter = {}
+        self.by_word = {}
+        self.test_keys = {}  # test name -> (commands, parameters, words) indexate pentru test
+
+    def index_test(self, test_name, test_data):
+        """(Re)indexează un test după ce step-urile lui s-au schimbat."""
+        self.remove_test(test_name)
+
+        commands = set()
+        parameters = set()
+        words = set()
+        for step in test_data.get("Steps", []):
+            if is_command_step(step):
+                commands.add(step["Command"])
+                parameters.update(step["Parameters"].items())
+            else:
+                words.update(step.get("Action", "").split())
+                words.update(step.get("Expected", "").split())
+
+        for index, keys in ((self.by_command, commands), (self.by_parameter, parameters), (self.by_word, words)):
+            for key in keys:
+                index.setdefault(key, set()).add(test_name)
+        self.test_keys[test_name] = (commands, parameters, words)
+
+    def remove_test(self, test_name):
+        commands, parameters, words = self.test_keys.pop(test_name, ((), (), ()))
+        for index, keys in ((self.by_command, commands), (self.by_parameter, parameters), (self.by_word, words)):
+            for key in keys:
+                tests = index.get(key)
+                if tests is not None:
+                    tests.discard(test_name)
+                    if not tests:
+                        del index[key]
+
+    def tests_using_command(self, command_name):
+        return set(self.by_command.get(command_name, ()))
+
+    def tests_using_parameter(self, category, parameter_name, include_text=True):
+        """Tests bound to the parameter, plus (with `include_text`) tests whose text steps mention its name."""
+        tests = set(self.by_parameter.get((category, parameter_name), ()))
+        if include_text:
+            tests.update(self.by_word.get(parameter_name, ()))
+        return tests
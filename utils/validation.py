@@ -0,0 +1,190 @@
+"""
+Broken-reference checks for the specification.
+
+Two kinds of entities are checked:
+
+    test      every command step must use an existing generic command, bind
+              every category its placeholders use, and bind parameters that
+              exist in parameters.json
+    command   every {Category} placeholder must name an existing category
+
+Problems are kept per entity, keyed ("test", name) / ("command", name), so a
+change only re-checks what it can affect: an edited test re-checks that test,
+a command whose placeholders changed re-checks the command and the tests that
+use it (found through `StepIndex`), and a parameter or category that appears
+or disappears re-checks the tests bound to it and the commands that use the
+category. The first full scan runs in worker processes when the specification
+is large (the checks are pure Python, so threads would not run in parallel).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.templates import compile_command
+from utils.test_steps import is_command_step
+
+PARALLEL_THRESHOLD = 2000  # 🔹 Sub acest număr de teste, pornirea proceselor costă mai mult decât scanarea
+CHUNK_SIZE = 500
+
+
+def test_problems(test_data, commands_data, parameters_data):
+    """Messages for the broken references of one test (empty list if there are none)."""
+    problems = []
+    for number, step in enumerate(test_data.get("Steps", []), 1):
+        if not is_command_step(step):
+            continue
+
+        command = commands_data.get(step["Command"])
+        if command is None:
+            problems.append(f"Step {number}: command '{step['Command']}' does not exist")
+            continue
+
+        bindings = step["Parameters"]
+        for category in compile_command(command).categories:
+            if category not in bindings:
+                problems.append(f"Step {number}: no parameter chosen for {{{category}}}")
+        for category, param_name in bindings.items():
+            params = parameters_data.get(category)
+            if params is None:
+                problems.append(f"Step {number}: category '{category}' does not exist")
+            elif param_name not in params:
+                problems.append(f"Step {number}: parameter '{param_name}' not found in '{category}'")
+    return problems
+
+
+def command_problems(command_data, parameters_data):
+    """Messages for the placeholders of a generic command that name no parameter category."""
+    return [f"Placeholder {{{category}}}: category '{category}' does not exist"
+            for category in compile_command(command_data).categories if category not in parameters_data]
+
+
+def scan(tests_data, commands_data, parameters_data, include_commands=True):
+    """{("test" | "command", name): messages} for every entity that has problems."""
+    problems = {}
+    for test_name, test_data in tests_data.items():
+        messages = test_problems(test_data, commands_data, parameters_data)
+        if messages:
+            problems[("test", test_name)] = messages
+    if include_commands:
+        for command_name, command_data in commands_data.items():
+            messages = command_problems(command_data, parameters_data)
+            if messages:
+                problems[("command", command_name)] = messages
+    return problems
+
+
+# ----------------- Parallel full scan -----------------
+worker_data = None  # 🔹 (commands_data, parameters_data), trimise o singură dată fiecărui proces
+
+
+def init_worker(commands_data, parameters_data):
+    global worker_data
+    worker_data = (commands_data, parameters_data)
+
+
+def scan_chunk(tests_chunk):
+    return scan(tests_chunk, worker_data[0], worker_data[1], include_commands=False)
+
+
+def full_scan(tests_data, commands_data, parameters_data, workers=None):
+    """
+    `scan` over the whole specification, split across worker processes for large specs.
+
+    Falls back to a scan in the calling thread when the specification is small or processes cannot be
+    started (e.g. restricted environments).
+    """
+    workers = workers or os.cpu_count() or 1
+    if len(tests_data) < PARALLEL_THRESHOLD or workers < 2:
+        return scan(tests_data, commands_data, parameters_data)
+
+    items = list(tests_data.items())
+    chunks = [dict(items[start:start + CHUNK_SIZE]) for start in range(0, len(items), CHUNK_SIZE)]
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=init_worker,
+                                 initargs=(commands_data, parameters_data)) as pool:
+            problems = {}
+            for chunk_problems in pool.map(scan_chunk, chunks):
+                problems.update(chunk_problems)
+    except (OSError, RuntimeError) as e:  # ✅ BrokenProcessPool este un RuntimeError
+        print(f"⚠️ Parallel validation unavailable ({e}); scanning in one thread.")
+        return scan(tests_data, commands_data, parameters_data)
+
+    problems.update(scan({}, commands_data, parameters_data))
+    return problems
+
+
+# ----------------- Incremental validation -----------------
+class ValidationEngine:
+    """
+    Keeps the current problems and re-checks only the entities affected by a change.
+
+    The page marks what changed (`mark_tests`, `set_commands`, `set_parameters`) and calls `run` later;
+    `run` returns {key: messages} for every entity whose problems changed (empty list = now valid).
+    """
+
+    def __init__(self, step_index):
+        self.step_index = step_index
+        self.problems = {}
+        self.dirty = set()
+        self.command_categories = None  # command -> categoriile placeholder-elor (ultima versiune verificată)
+        self.parameter_keys = None  # {(category, parameter)} și {(category,)} pentru categorii
+
+    def mark_tests(self, test_names):
+        self.dirty.update(("test", test_name) for test_name in test_names)
+
+    def set_commands(self, commands_data):
+        """Marks the commands whose placeholders changed (and the tests using them)."""
+        categories = {name: compile_command(command).categories for name, command in commands_data.items()}
+        if self.command_categories is not None:
+            for name in set(categories) | set(self.command_categories):
+                if categories.get(name) != self.command_categories.get(name):
+                    self.dirty.add(("command", name))
+                    self.mark_tests(self.step_index.tests_using_command(name))
+        self.command_categories = categories
+
+    def set_parameters(self, parameters_data):
+        """Marks the tests and commands that refer to a category or parameter that appeared or disappeared."""
+        keys = {(category,) for category in parameters_data}
+        keys.update((category, name) for category, params in parameters_data.items() for name in params)
+        if self.parameter_keys is not None:
+            changed = keys ^ self.parameter_keys
+            changed_categories = {key[0] for key in changed if len(key) == 1}
+            for key in changed:
+                if len(key) == 2:
+                    self.mark_tests(self.step_index.tests_using_parameter(*key, include_text=False))
+            for category in changed_categories:
+                for command_name, categories in (self.command_categories or {}).items():
+                    if category in categories:
+                        self.dirty.add(("command", command_name))
+                        self.mark_tests(self.step_index.tests_using_command(command_name))
+        self.parameter_keys = keys
+
+    def load(self, problems):
+        """Replaces the problems with the result of a full scan; returns the keys whose problems changed."""
+        changes = {key: [] for key in self.problems if key not in problems}
+        changes.update({key: messages for key, messages in problems.items() if self.problems.get(key) != messages})
+        self.problems = dict(problems)
+        return changes
+
+    def run(self, tests_data, commands_data, parameters_data):
+        """Re-checks the marked entities; returns {key: messages} for those whose problems changed."""
+        dirty, self.dirty = self.dirty, set()
+        changes = {}
+        for key in dirty:
+            kind, name = key
+            if kind == "test":
+                test_data = tests_data.get(name)
+                messages = test_problems(test_data, commands_data, parameters_data) if test_data is not None else []
+            else:
+                command = commands_data.get(name)
+                messages = command_problems(command, parameters_data) if command is not None else []
+
+            if messages != self.problems.get(key, []):
+                changes[key] = messages
+                if messages:
+                    self.problems[key] = messages
+                else:
+                    self.problems.pop(key, None)
+        return changes
+
+    def count(self):
+        return sum(len(messages) for messages in self.problems.values())
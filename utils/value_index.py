@@ -0,0 +1,88 @@
+"""
+Value-level index over parameters.json.
+
+Parameter values are free-form strings, so the same payload can be written in
+several ways ("[0x50,0x01]", "[0x50, 0x1]", "0x5001"). Every value is reduced
+to a canonical key first:
+
+    ("bytes", (0x50, 0x01))   hex bytes / hex arrays
+    ("number", 12.0)          decimal numbers
+    ("text", "bus/signal_1")  anything else, case and whitespace insensitive
+
+and indexed by that key across all categories and variants. This gives a
+"find by value" lookup and a report of parameters that carry the same payload.
+"""
+import re
+from functools import lru_cache
+
+HEX_ITEM = re.compile(r"0x([0-9a-fA-F]+)")
+HEX_ARRAY = re.compile(r"^\[?\s*0x[0-9a-fA-F]+(?:\s*[,;\s]\s*0x[0-9a-fA-F]+)*\s*\]?$")
+NUMBER = re.compile(r"^[+-]?\d+(?:\.\d+)?$")
+
+
+@lru_cache(maxsize=65536)
+def canonical_value(value):
+    """Canonical key of a parameter value, or None for empty values."""
+    text = str(value).strip()
+    if not text:
+        return None
+
+    if HEX_ARRAY.match(text):
+        payload = []
+        for digits in HEX_ITEM.findall(text):
+            digits = digits if len(digits) % 2 == 0 else "0" + digits
+            payload.extend(int(digits[i:i + 2], 16) for i in range(0, len(digits), 2))
+        return "bytes", tuple(payload)
+
+    if NUMBER.match(text):
+        return "number", float(text)
+
+    return "text", " ".join(text.split()).casefold()
+
+
+def format_canonical(key):
+    """Readable form of a canonical key (used in reports)."""
+    kind, value = key
+    if kind == "bytes":
+        return "[" + ",".join(f"0x{byte:02X}" for byte in value) + "]"
+    if kind == "number":
+        return f"{value:g}"
+    return value
+
+
+class ValueIndex:
+    """Canonical value -> [(category, parameter, variant, raw value)] across the whole parameters_data."""
+
+    def __init__(self, parameters_data):
+        self.entries = {}
+        self.signatures = {}  # (category, parameter) -> valorile canonice ale tuturor variantelor
+
+        for category, params in parameters_data.items():
+            for param_name, variants in params.items():
+                signature = []
+                for variant, raw_value in variants.items():
+                    key = canonical_value(raw_value)
+                    if key is None:
+                        continue
+                    self.entries.setdefault(key, []).append((category, param_name, variant, raw_value))
+                    signature.append((variant, key))
+                if signature:
+                    self.signatures[(category, param_name)] = tuple(sorted(signature))
+
+    def find(self, value):
+        """Every (category, parameter, variant, raw value) whose value is equivalent to `value`."""
+        key = canonical_value(value)
+        return list(self.entries.get(key, [])) if key is not None else []
+
+    def duplicates(self):
+        """
+        Groups of parameters that carry the same payload in every variant.
+
+        Returns [(signature, [(category, parameter), ...])], largest groups first.
+        """
+        groups = {}
+        for parameter, signature in self.signatures.items():
+            groups.setdefault(signature, []).append(parameter)
+
+        return sorted(((signature, parameters) for signature, parameters in groups.items() if len(parameters) > 1),
+                      key=lambda group: (-len(group[1]), group[1]))
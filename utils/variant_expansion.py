@@ -0,0 +1,170 @@
+"""
+Variant-resolved test expansion.
+
+Test steps reference parameters by name. A test bench needs the concrete
+values instead, once per variant: a step bound to `Request = Res_Default`
+runs as "Send request [0x10,0x01]" under the Default Value variant and with
+whatever "Speed" overrides under the Speed variant (falling back to
+`Default Value` where the variant is empty or missing).
+
+`expand_tests` walks variants x tests lazily, with one cached lookup table per
+variant, and the writers stream the result straight to JSON or CSV, so the
+full expansion never has to be held in memory.
+
+Command line:
+    python -m utils.variant_expansion specs.csv
+    python -m utils.variant_expansion specs.json --variant "Default Value" --variant Speed
+"""
+import argparse
+import csv
+import json
+import os
+import re
+from functools import lru_cache
+
+from utils.templates import compile_command
+from utils.test_steps import bindings_key, is_command_step, migrate_test, render_bound
+
+DEFAULT_VARIANT = "Default Value"
+TOKEN = re.compile(r"\S+")
+
+
+def all_variants(parameters_data):
+    """Every variant used in parameters_data, `Default Value` first."""
+    variants = {DEFAULT_VARIANT: None}
+    for params in parameters_data.values():
+        for values in params.values():
+            variants.update(dict.fromkeys(values))
+    return list(variants)
+
+
+class VariantResolver:
+    """Resolves parameters to their value under a variant; one lookup table per variant, built on first use."""
+
+    def __init__(self, parameters_data):
+        self.parameters_data = parameters_data
+        self.lookup_table = lru_cache(maxsize=None)(self.build_lookup_table)
+
+    def build_lookup_table(self, variant):
+        """({(category, name): value}, {name: value}) for `variant`, with the Default Value fallback applied."""
+        by_parameter = {}
+        by_name = {}
+        for category, params in self.parameters_data.items():
+            for param_name, values in params.items():
+                value = values.get(variant) or values.get(DEFAULT_VARIANT, "")
+                by_parameter[(category, param_name)] = value
+                by_name.setdefault(param_name, value)  # ✅ Ca la detectarea cuvânt cu cuvânt: prima categorie
+        return by_parameter, by_name
+
+    def resolve_step(self, step, step_texts, commands_data, variant):
+        """(action, expected) of `step` with every parameter replaced by its value under `variant`."""
+        by_parameter, by_name = self.lookup_table(variant)
+
+        if is_command_step(step) and step["Command"] in commands_data:
+            values = tuple((category, by_parameter.get((category, name), name)) for category, name in bindings_key(step))
+            return render_bound(compile_command(commands_data[step["Command"]]), values)
+
+        # 🔹 Step-uri text (sau cu comanda ștearsă): înlocuim cuvintele care sunt nume de parametri
+        replace = lambda match: by_name.get(match.group(0), match.group(0))
+        return TOKEN.sub(replace, step_texts[0]), TOKEN.sub(replace, step_texts[1])
+
+
+def test_steps_with_texts(test_data, commands_data, parameters_data):
+    """[(step, (action, expected))] for a test; tests in the legacy format are migrated on a copy."""
+    if not isinstance(test_data.get("Steps"), list):
+        test_data = dict(test_data)
+        migrate_test(test_data, commands_data, parameters_data)
+
+    actions = test_data.get("Action", [])
+    expected_results = test_data.get("Expected Results", [])
+    return [
+        (step, (actions[index] if index < len(actions) else step.get("Action", ""),
+                expected_results[index] if index < len(expected_results) else step.get("Expected", "")))
+        for index, step in enumerate(test_data["Steps"])
+    ]
+
+
+def expand_tests(tests_data, commands_data, parameters_data, variants=None):
+    """
+    Yields (variant, test name, resolved test) for every variant x test, variant by variant.
+
+    A resolved test is {"Precondition": ..., "Action": [...], "Expected Results": [...]}.
+    """
+    resolver = VariantResolver(parameters_data)
+    steps_cache = {}
+
+    for variant in variants or all_variants(parameters_data):
+        for test_name, test_data in tests_data.items():
+            steps = steps_cache.get(test_name)
+            if steps is None:
+                steps = steps_cache[test_name] = test_steps_with_texts(test_data, commands_data, parameters_data)
+
+            resolved = [resolver.resolve_step(step, texts, commands_data, variant) for step, texts in steps]
+            yield variant, test_name, {
+                "Precondition": test_data.get("Precondition", ""),
+                "Action": [action for action, _ in resolved],
+                "Expected Results": [expected for _, expected in resolved],
+            }
+
+
+def write_specs_json(file_path, expansion):
+    """Streams `expansion` as {variant: {test name: resolved test}} (same shape as tests.json, per variant)."""
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write("{")
+        current_variant = None
+        first_test = True
+        for variant, test_name, resolved in expansion:
+            if variant != current_variant:
+                if current_variant is not None:
+                    file.write("\n    },")
+                file.write(f"\n    {json.dumps(variant, ensure_ascii=False)}: {{")
+                current_variant = variant
+                first_test = True
+            test_json = json.dumps(resolved, indent=4, ensure_ascii=False).replace("\n", "\n        ")
+            file.write(f"{'' if first_test else ','}\n        {json.dumps(test_name, ensure_ascii=False)}: {test_json}")
+            first_test = False
+        if current_variant is not None:
+            file.write("\n    }")
+        file.write("\n}\n")
+
+
+def write_specs_csv(file_path, expansion):
+    """Streams `expansion` as one CSV row per step (variant, test, precondition, step number, action, expected)."""
+    with open(file_path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Variant", "Test Name", "Precondition", "Step", "Action", "Expected Result"])
+        for variant, test_name, resolved in expansion:
+            for index, (action, expected) in enumerate(zip(resolved["Action"], resolved["Expected Results"]), 1):
+                writer.writerow([variant, test_name, resolved["Precondition"], index, action, expected])
+
+
+def write_variant_specs(file_path, tests_data, commands_data, parameters_data, variants=None):
+    """Writes the expansion to `file_path` (CSV for *.csv, JSON otherwise)."""
+    expansion = expand_tests(tests_data, commands_data, parameters_data, variants)
+    if file_path.lower().endswith(".csv"):
+        write_specs_csv(file_path, expansion)
+    else:
+        write_specs_json(file_path, expansion)
+
+
+def main(argv=None):
+    from utils.json_io import read_json
+
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+    parser = argparse.ArgumentParser(description="Write one resolved test specification per variant.")
+    parser.add_argument("output", help="output file (*.csv or *.json)")
+    parser.add_argument("--data-dir", default=data_dir, help="folder with tests.json, parameters.json, generic_commands.json")
+    parser.add_argument("--variant", action="append", dest="variants", help="variant to expand (repeatable; default: all)")
+    args = parser.parse_args(argv)
+
+    def load(name):
+        path = os.path.join(args.data_dir, name)
+        return read_json(path) if os.path.exists(path) else {}
+
+    write_variant_specs(args.output, load("tests.json"), load("generic_commands.json"), load("parameters.json"),
+                         args.variants)
+    print(f"✅ Variant specifications written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()